@@ -0,0 +1,421 @@
+"""JSON API over the TravelScope core, for mobile clients and batch jobs.
+
+Run:
+    uvicorn api_server:app --host 0.0.0.0 --port 8000 --workers 4
+    python api_server.py --port 8000
+
+Endpoints (all GET unless noted):
+    /geocode?q=Paris
+    /suggest?q=Barc&limit=5                    (cities and cached places)
+    /nearby?city=Paris&category=tourism        (or lat=..&lon=..)
+    /itinerary?city=Paris&days=3&interests=Food,Culture&start=2024-06-01
+    /trip?legs=Paris:3,Rome:2&interests=Food&start=2024-06-01
+    /weather?city=Paris
+    /translate   POST {"text": "...", "source": "en", "target": "fr"}
+    /culture?place=Paris&related=1
+    /thumbnail?url=https://upload.wikimedia.org/...&width=320   (resized, cached image)
+    /export?format=ics   POST an /itinerary or /trip response   (also geojson, pdf)
+    /metrics, /health
+
+Handlers are async and share one pooled httpx client per worker, so
+concurrency is bounded by the per-host upstream limits in ``rate_limit``
+rather than by threads; the legs of a /trip are looked up concurrently.
+Lookups are memoized in-process with a TTL, and concurrent requests for the
+same key wait on a single upstream call. A memo miss for a city, attractions
+or a forecast reads through the same on-disk response cache as the Streamlit
+app and the warm-up job (``travelscope.lookups``) before going upstream.
+Wikipedia results and thumbnails go through the same on-disk caches as the
+Streamlit app.
+"""
+import argparse
+import asyncio
+import datetime
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from urllib.parse import urlsplit
+
+import requests
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from travelscope import (
+    Busy, NotFound, UpstreamError, aio, export, lookups, metrics, ranking, resources, search, thumbnails,
+)
+from travelscope.culture import fetch_related, fetch_summary
+from travelscope.itinerary import build_itinerary
+from travelscope.rate_limit import RateLimitTimeout
+from travelscope.translation import LANGUAGES
+from travelscope.trip import MAX_LEGS, Leg, LegData, build_trip
+from travelscope.weather import current_conditions
+
+GEOCODE_TTL = 24 * 60 * 60
+PLACES_TTL = 24 * 60 * 60
+FORECAST_TTL = 10 * 60
+MAX_DAYS = 10
+MAX_TRIP_DAYS = 30
+MAX_TEXT = 20_000
+
+
+class _Memo:
+    """In-process TTL cache for coroutine results with single-flight loading."""
+
+    def __init__(self, ttl: float, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._values = {}
+        self._pending = {}
+
+    async def get(self, key, load):
+        hit = self._values.get(key)
+        if hit is not None and hit[1] > time.monotonic():
+            return hit[0]
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(load())
+            task.add_done_callback(lambda t: self._store(key, t))
+        # Shielded so one caller disconnecting does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    def _store(self, key, task: asyncio.Task) -> None:
+        self._pending.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._values[key] = (task.result(), time.monotonic() + self.ttl)
+        if len(self._values) > self.max_entries:
+            self._values.pop(next(iter(self._values)))
+
+
+_geocodes = _Memo(GEOCODE_TTL)
+_places = _Memo(PLACES_TTL)
+_forecasts = _Memo(FORECAST_TTL)
+
+
+async def geocode(request: Request) -> JSONResponse:
+    with metrics.span("api:geocode"):
+        location = await _geocode(request, _param(request, "q"))
+    return JSONResponse(asdict(location))
+
+
+async def suggest(request: Request) -> JSONResponse:
+    with metrics.span("api:suggest"):
+        limit = _int_param(request, "limit", 5, 1, 20)
+        matches = search.suggest(_param(request, "q"), limit)
+    return JSONResponse({"suggestions": [asdict(m) for m in matches]})
+
+
+async def nearby(request: Request) -> JSONResponse:
+    with metrics.span("api:nearby"):
+        lat, lon = await _coordinates(request)
+        category = request.query_params.get("category", "tourism")
+        places = await _places.get(
+            ("nearby", lat, lon, category),
+            lambda: aio.nearby_places(request.app.state.client, lat, lon, category),
+        )
+    return JSONResponse({"lat": lat, "lon": lon, "places": [asdict(p) for p in places]})
+
+
+async def itinerary(request: Request) -> JSONResponse:
+    with metrics.span("api:itinerary"):
+        days = _int_param(request, "days", 3, 1, MAX_DAYS)
+        interests = _interests(request)
+        start = _date_param(request, "start")
+        location = await _geocode(request, _param(request, "city"))
+        attractions = await _attractions(request, location, interests)
+        scores = ranking.score_places(attractions, location.lat, location.lon, interests)
+        plan = build_itinerary(attractions, days, scores=scores, start=start)
+    return JSONResponse({"city": location.name, "start": (start or datetime.date.today()).isoformat(), "days": plan})
+
+
+async def trip(request: Request) -> JSONResponse:
+    with metrics.span("api:trip"):
+        legs = _legs(request)
+        interests = _interests(request)
+        start = _date_param(request, "start")
+        # All legs at once, so the trip takes about as long as its slowest leg
+        data = await asyncio.gather(*(_leg(request, leg, interests) for leg in legs))
+        plan = build_trip(data, interests, start)
+    return JSONResponse(plan)
+
+
+async def weather(request: Request) -> JSONResponse:
+    with metrics.span("api:weather"):
+        city = _param(request, "city")
+        location = await _geocodes.get(("open-meteo", city.casefold()), lambda: lookups.weather_city_async(
+            city, resources.get("response_cache"), lambda: aio.find_city(request.app.state.client, city)))
+        forecast = await _forecast(request, location)
+    return JSONResponse({"city": location.name, **asdict(current_conditions(forecast))})
+
+
+async def translate(request: Request) -> JSONResponse:
+    with metrics.span("api:translate"):
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(400, "Body must be JSON")
+        text = body.get("text") if isinstance(body, dict) else None
+        if not isinstance(text, str) or not text.strip():
+            raise HTTPException(400, "'text' is required")
+        if len(text) > MAX_TEXT:
+            raise HTTPException(413, f"'text' is limited to {MAX_TEXT} characters")
+        source, target = _language(body.get("source", "en")), _language(body.get("target", "fr"))
+        try:
+            translated = await aio.translate(request.app.state.client, text, source, target)
+        except ValueError as e:
+            raise HTTPException(413, str(e))
+    return JSONResponse({"source": source, "target": target, "text": translated})
+
+
+async def culture(request: Request) -> JSONResponse:
+    with metrics.span("api:culture"):
+        place = _param(request, "place")
+        cache, session = resources.get("response_cache"), resources.get("http")
+        # The Wikipedia client is sync and backed by the shared disk cache; most calls are cache hits
+        summary = await asyncio.to_thread(_call_upstream, fetch_summary, place, cache, session=session)
+        if summary is None:
+            raise NotFound(f"No Wikipedia article for {place!r}.")
+        related = []
+        if request.query_params.get("related") in ("1", "true", "yes"):
+            articles = await asyncio.to_thread(_call_upstream, fetch_related, place, cache, session=session)
+            related = [a for a in articles if a["title"] != summary["title"]]
+    return JSONResponse({"summary": summary, "related": related})
+
+
+async def thumbnail(request: Request) -> Response:
+    with metrics.span("api:thumbnail"):
+        url = _param(request, "url")
+        if urlsplit(url).hostname not in thumbnails.HOSTS:
+            raise HTTPException(400, "'url' must be a Wikimedia image")
+        width = _int_param(request, "width", thumbnails.WIDTHS[-1], 1, thumbnails.WIDTHS[-1])
+        data = await asyncio.to_thread(thumbnails.get, url, width)
+        if data is None:
+            raise UpstreamError("Could not fetch or read the image.")
+    return Response(data, media_type=thumbnails.MEDIA_TYPE, headers={"Cache-Control": "public, max-age=86400"})
+
+
+async def export_plan(request: Request) -> StreamingResponse:
+    with metrics.span("api:export"):
+        fmt = request.query_params.get("format", "ics")
+        if fmt not in export.FORMATS:
+            raise HTTPException(400, f"'format' must be one of {', '.join(export.FORMATS)}")
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(400, "Body must be JSON")
+        if not isinstance(body, dict):
+            raise HTTPException(400, "Body must be an /itinerary or /trip response")
+        legs = body.get("legs") if isinstance(body.get("legs"), list) else []
+        cities = [leg["city"] for leg in legs if isinstance(leg, dict) and isinstance(leg.get("city"), str)]
+        title = body.get("title") or (f"Trip to {body['city']}" if body.get("city") else " – ".join(cities) or "Trip")
+        start = body.get("start") or (legs[0].get("start") if legs and isinstance(legs[0], dict) else None)
+        try:
+            plan = export.make_plan(body.get("days"), start or datetime.date.today(), title)
+        except ValueError as e:
+            raise HTTPException(400, str(e))
+    media_type, extension = export.FORMATS[fmt]
+    # Written and sent a piece at a time, or read back from the export cache
+    return StreamingResponse(export.export(plan, fmt), media_type=media_type,
+                             headers={"Content-Disposition": f'attachment; filename="itinerary.{extension}"'})
+
+
+async def prometheus(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+async def health(request: Request) -> JSONResponse:
+    # Failed resources are dropped by the check and rebuilt on the next request
+    failed = {name: error for name, error in resources.check().items() if error}
+    if failed:
+        return JSONResponse({"status": "degraded", "failed": failed}, status_code=503)
+    return JSONResponse({"status": "ok"})
+
+
+async def _geocode(request: Request, query: str):
+    try:
+        return await _nominatim(request, query)
+    except NotFound:
+        # Only a name Nominatim does not know is tried as a near miss of a known city
+        corrected = search.correct(query)
+        if corrected == query:
+            raise
+    return await _nominatim(request, corrected)
+
+
+async def _nominatim(request: Request, query: str):
+    return await _geocodes.get(("nominatim", query.casefold()), lambda: lookups.geocode_async(
+        query, resources.get("response_cache"), lambda: aio.geocode(request.app.state.client, query)))
+
+
+async def _attractions(request: Request, location, interests: tuple[str, ...]):
+    async def load():
+        places = await aio.fetch_attractions(request.app.state.client, location.lat, location.lon,
+                                             interests=interests)
+        search.add(p.name for p in places)
+        return places
+
+    return await _places.get(("attractions", location.lat, location.lon, interests), lambda: lookups.attractions_async(
+        location.lat, location.lon, resources.get("response_cache"), load, interests=interests))
+
+
+async def _forecast(request: Request, location):
+    return await _forecasts.get((location.lat, location.lon), lambda: lookups.forecast_async(
+        location.lat, location.lon, resources.get("response_cache"),
+        lambda: aio.fetch_forecast(request.app.state.client, location.lat, location.lon)))
+
+
+async def _leg(request: Request, leg: Leg, interests: tuple[str, ...]) -> LegData:
+    location = await _geocode(request, leg.city)
+    attractions, forecast = await asyncio.gather(
+        _attractions(request, location, interests),
+        _forecast(request, location),
+        return_exceptions=True,
+    )
+    if isinstance(attractions, BaseException):
+        raise attractions
+    # A leg is still worth planning without its weather
+    weather = None if isinstance(forecast, BaseException) else current_conditions(forecast)
+    return LegData(leg, location, attractions, weather)
+
+
+async def _coordinates(request: Request) -> tuple[float, float]:
+    if "lat" in request.query_params and "lon" in request.query_params:
+        try:
+            return float(request.query_params["lat"]), float(request.query_params["lon"])
+        except ValueError:
+            raise HTTPException(400, "'lat' and 'lon' must be numbers")
+    location = await _geocode(request, _param(request, "city"))
+    return location.lat, location.lon
+
+
+def _param(request: Request, name: str) -> str:
+    value = request.query_params.get(name, "").strip()
+    if not value:
+        raise HTTPException(400, f"'{name}' is required")
+    return value
+
+
+def _int_param(request: Request, name: str, default: int, low: int, high: int) -> int:
+    try:
+        value = int(request.query_params.get(name, default))
+    except ValueError:
+        raise HTTPException(400, f"'{name}' must be an integer")
+    if not low <= value <= high:
+        raise HTTPException(400, f"'{name}' must be between {low} and {high}")
+    return value
+
+
+def _date_param(request: Request, name: str) -> datetime.date | None:
+    value = request.query_params.get(name, "").strip()
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(400, f"'{name}' must be a date (YYYY-MM-DD)")
+
+
+def _legs(request: Request) -> list[Leg]:
+    """``legs=Paris:3,Rome:2``: cities in travel order, each with its number of days."""
+    legs = []
+    for value in filter(None, (v.strip() for v in _param(request, "legs").split(","))):
+        city, _, days = value.rpartition(":")
+        if not city.strip() or not days.strip().isdigit() or not 1 <= int(days) <= MAX_DAYS:
+            raise HTTPException(400, f"Each leg must be 'city:days' with 1 to {MAX_DAYS} days, not {value!r}")
+        legs.append(Leg(city.strip(), int(days)))
+    if not legs or len(legs) > MAX_LEGS:
+        raise HTTPException(400, f"'legs' must list 1 to {MAX_LEGS} cities")
+    if sum(leg.days for leg in legs) > MAX_TRIP_DAYS:
+        raise HTTPException(400, f"A trip can be at most {MAX_TRIP_DAYS} days")
+    return legs
+
+
+def _interests(request: Request) -> tuple[str, ...]:
+    """Comma-separated ``interests`` (names from ``ranking.INTERESTS``), normalized for use in cache keys."""
+    names = {name.casefold(): name for name in ranking.INTERESTS}
+    interests = set()
+    for value in filter(None, (v.strip() for v in request.query_params.get("interests", "").split(","))):
+        if value.casefold() not in names:
+            raise HTTPException(400, f"Unknown interest {value!r}; use {', '.join(ranking.INTERESTS)}")
+        interests.add(names[value.casefold()])
+    return tuple(sorted(interests))
+
+
+def _language(value) -> str:
+    """Accept a language code or one of the names in ``LANGUAGES``."""
+    if value in LANGUAGES.values():
+        return value
+    if value in LANGUAGES:
+        return LANGUAGES[value]
+    raise HTTPException(400, f"Unsupported language {value!r}")
+
+
+def _call_upstream(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except RateLimitTimeout as e:
+        raise Busy(str(e)) from e
+    except requests.exceptions.RequestException as e:
+        raise UpstreamError(f"Network error occurred: {e}") from e
+
+
+async def _http_error(request: Request, exc: HTTPException) -> JSONResponse:
+    return JSONResponse({"error": exc.detail}, status_code=exc.status_code)
+
+
+def _error(status: int):
+    async def handler(request: Request, exc: Exception) -> JSONResponse:
+        headers = {"Retry-After": "5"} if status == 503 else None
+        return JSONResponse({"error": str(exc)}, status_code=status, headers=headers)
+    return handler
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    # The httpx client is bound to this event loop, so it lives here rather than in the registry
+    app.state.client = aio.new_client()
+    # Built from the response cache up front so the first /suggest does not block the loop
+    await asyncio.to_thread(resources.get, "search_index")
+    try:
+        yield
+    finally:
+        await app.state.client.aclose()
+        resources.close()
+
+
+app = Starlette(
+    routes=[
+        Route("/geocode", geocode),
+        Route("/suggest", suggest),
+        Route("/nearby", nearby),
+        Route("/itinerary", itinerary),
+        Route("/trip", trip),
+        Route("/weather", weather),
+        Route("/translate", translate, methods=["POST"]),
+        Route("/culture", culture),
+        Route("/thumbnail", thumbnail),
+        Route("/export", export_plan, methods=["POST"]),
+        Route("/metrics", prometheus),
+        Route("/health", health),
+    ],
+    exception_handlers={
+        HTTPException: _http_error,
+        NotFound: _error(404),
+        Busy: _error(503),
+        UpstreamError: _error(502),
+    },
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    uvicorn.run("api_server:app", host=args.host, port=args.port, workers=args.workers)
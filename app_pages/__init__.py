@@ -0,0 +1,26 @@
+"""Per-feature pages of the TravelScope app.
+
+Each module exposes ``render()``. Pages are imported only when selected, so
+a session that never opens the translator never pays for PyPDF2, WebRTC or
+speech recognition, and a page's module-level setup runs once per process
+instead of on every rerun.
+"""
+import importlib
+
+PAGES = {
+    "Nearby Explorer": "app_pages.nearby",
+    "Trip Itinerary": "app_pages.trip_itinerary",
+    "Expense Tracker": "app_pages.expenses",
+    "Weather Explorer": "app_pages.weather_explorer",
+    "Language Translator": "app_pages.translator",
+    "Cultural Insights": "app_pages.cultural_insights",
+}
+
+# Only listed when TRAVELSCOPE_ADMIN_TOKEN is set and the app is opened with ?admin=<that token>
+ADMIN_PAGES = {
+    "Metrics": "app_pages.metrics_admin",
+}
+
+
+def load_page(name: str):
+    return importlib.import_module(PAGES.get(name) or ADMIN_PAGES[name])
@@ -0,0 +1,50 @@
+import streamlit as st
+from travelscope import resources, search, thumbnails
+from travelscope.culture import fetch_related, fetch_summary
+
+def render():
+    st.header("Cultural Insights App")
+    destination = st.text_input("Enter a place:", placeholder="e.g., Paris, Tokyo, New Delhi", key="culture_destination")
+    if destination:
+        cache = resources.get("response_cache")
+        try:
+            summary = fetch_summary(destination, cache)
+            if summary is None:
+                # Only a place Wikipedia has no article for is tried as a near miss of a known name
+                corrected = search.correct(destination)
+                if corrected != destination and (summary := fetch_summary(corrected, cache)):
+                    st.caption(f"No article for “{destination}”; showing **{corrected}**.")
+                    destination = corrected
+            if summary:
+                st.subheader(summary["title"])
+                if summary["thumbnail"]:
+                    # Served from the local thumbnail cache; the URL only if it could not be fetched
+                    image = thumbnails.get(summary["thumbnail"]) or summary["thumbnail"]
+                    st.image(image, caption=f"Image of {destination}")
+                st.write(summary["extract"])
+                related_articles(destination, summary["title"])
+            else:
+                st.error("Unable to fetch cultural insights. Please try a different place.")
+        except Exception as e:
+            st.error(f"An error occurred: {e}")
+    else:
+        st.info("Enter a place above to get started!")
+    st.markdown("---")
+    st.caption("Powered by Wikipedia API")
+
+# Toggling the related articles reruns only this section, not the summary lookup
+@st.fragment
+def related_articles(destination: str, title: str):
+    if not st.checkbox("Show customs, cuisine and festivals", key="culture_related"):
+        return
+    try:
+        articles = fetch_related(destination, resources.get("response_cache"))
+    except Exception as e:
+        st.error(f"An error occurred: {e}")
+        return
+    for article in articles:
+        if article["title"] != title:
+            with st.expander(article["title"]):
+                if article["thumbnail"]:
+                    st.image(thumbnails.get(article["thumbnail"], 320) or article["thumbnail"], width=320)
+                st.write(article["extract"])
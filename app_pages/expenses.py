@@ -0,0 +1,111 @@
+import datetime
+import streamlit as st
+from travelscope import resources
+from travelscope.expense_analytics import burn_rate, category_totals, converted_amounts, daily_rollup
+from travelscope.expense_import import import_expenses
+from travelscope.expense_ledger import CATEGORIES, CURRENCIES, ExpenseLedger
+from travelscope.fx_rates import load_rates
+
+# FX rates (the on-disk table itself refreshes once a day)
+@st.cache_data(ttl=3600)
+def get_fx_rates():
+    return load_rates("INR")
+
+def render():
+    if "expenses" not in st.session_state:
+        st.session_state["expenses"] = ExpenseLedger()
+        st.session_state["expenses_version"] = 0
+        st.session_state["expenses_trip"] = None
+    st.header("🧾 Cultural Insights Expense Tracker")
+    trip_id = st.text_input("Trip ID (share it with your group to track expenses together)", "my-trip", key="trip_id")
+    if st.session_state["expenses_trip"] != trip_id:
+        st.session_state["expenses"] = ExpenseLedger()
+        st.session_state["expenses_version"] = 0
+        st.session_state["expenses_trip"] = trip_id
+    add_expense_form(trip_id)
+    import_panel(trip_id)
+    expense_log(trip_id)
+
+# Editing a form field reruns only its fragment; changes to the ledger rerun the page so the log catches up
+def changed(section: str, notice: str):
+    st.session_state[f"expense_notice_{section}"] = notice
+    st.rerun()
+
+def show_notice(section: str):
+    notice = st.session_state.pop(f"expense_notice_{section}", None)
+    if notice:
+        st.success(notice)
+
+@st.fragment
+def add_expense_form(trip_id: str):
+    st.subheader("➕ Add a New Expense")
+    item = st.text_input("Item / Description", key="expense_item")
+    category = st.selectbox("Category", CATEGORIES, key="expense_category")
+    currency = st.selectbox("Currency", CURRENCIES, key="expense_currency")
+    amount = st.number_input(f"Enter amount in {currency}", min_value=0.0, step=10.0, format="%.2f", key="expense_amount")
+    spent_on = st.date_input("Date", datetime.date.today(), key="expense_date")
+    if st.button("Add Expense", key="add_expense"):
+        if item and amount:
+            resources.get("expense_store").add(trip_id, item, category, amount, currency, spent_on)
+            changed("add", f"Added expense: {item} – {amount:.2f} {currency}")
+        else:
+            st.warning("Please fill out both the item and amount.")
+    show_notice("add")
+
+@st.fragment
+def import_panel(trip_id: str):
+    with st.expander("📥 Bulk import from CSV / bank statement"):
+        upload = st.file_uploader("Choose a CSV file", type=["csv"], key="expense_import_file")
+        import_currency = st.selectbox("Currency for rows without one", CURRENCIES, key="expense_import_currency")
+        if upload is not None and st.button("Import Expenses", key="import_expenses"):
+            try:
+                result = import_expenses(upload, resources.get("expense_store"), trip_id, import_currency)
+            except ValueError as e:
+                st.error(f"Could not import file: {e}")
+            else:
+                changed("import", f"Imported {result['imported']} expenses ({result['skipped']} rows skipped).")
+        show_notice("import")
+
+@st.fragment
+def expense_log(trip_id: str):
+    store = resources.get("expense_store")
+    ledger = st.session_state["expenses"]
+    st.session_state["expenses_version"] = store.pull(trip_id, ledger, st.session_state["expenses_version"])
+    fx = get_fx_rates()
+    st.subheader("📋 Expense Log")
+    if not ledger.empty:
+        log = ledger.to_frame().assign(**{"Amount (₹)": converted_amounts(ledger, fx)})
+        st.dataframe(log, use_container_width=True)
+        by_category = category_totals(ledger, fx)
+        st.markdown(f"### 💰 Total Spent: ₹{by_category.sum():.2f}")
+        if log["Amount (₹)"].isna().any():
+            st.warning("Exchange rates are unavailable for some currencies; those expenses are left out of the totals.")
+        st.bar_chart(by_category)
+        budget_panel(ledger, fx)
+    else:
+        st.info("No expenses added yet.")
+    if st.button("🔄 Clear All Expenses", key="clear_expenses"):
+        store.clear(trip_id)
+        changed("log", "All expenses cleared.")
+    show_notice("log")
+
+# Budget inputs rerun only the projection, not the log and chart above
+@st.fragment
+def budget_panel(ledger: ExpenseLedger, fx):
+    st.subheader("📊 Budget")
+    col1, col2, col3 = st.columns(3)
+    budget = col1.number_input("Trip budget (₹)", min_value=0.0, value=50000.0, step=1000.0, key="expense_budget")
+    trip_start = col2.date_input("Trip start", datetime.date.today(), key="expense_trip_start")
+    trip_end = col3.date_input("Trip end", datetime.date.today() + datetime.timedelta(days=6), key="expense_trip_end")
+    projection = burn_rate(ledger, fx, budget, trip_start, trip_end)
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Remaining", f"₹{projection['remaining']:.2f}")
+    m2.metric("Daily burn", f"₹{projection['daily_burn']:.2f}")
+    m3.metric("Projected total", f"₹{projection['projected_total']:.2f}",
+              delta=f"₹{budget - projection['projected_total']:.2f} vs budget")
+    if projection["days_left"]:
+        st.caption(f"Allowance for each of the {projection['days_left']} remaining days: ₹{projection['daily_allowance']:.2f}")
+    if projection["outside_trip"]:
+        st.caption(f"₹{projection['outside_trip']:.2f} is dated outside the trip (bookings, say): "
+                   "it counts against the budget but not towards the daily burn.")
+    st.dataframe(daily_rollup(ledger, fx), use_container_width=True)
@@ -0,0 +1,38 @@
+import pandas as pd
+import streamlit as st
+from travelscope import metrics, rate_limit, resources
+
+def render():
+    st.header("📈 Performance Metrics")
+    st.caption("Per-stage timings for this server process since start (or the last reset).")
+    rows = metrics.snapshot()
+    if rows:
+        table = pd.DataFrame(rows).set_index("stage")
+        st.dataframe(table.style.format(precision=1, na_rep="–"), use_container_width=True)
+        cached = table["cache_hit_rate"].dropna()
+        if not cached.empty:
+            st.subheader("Cache hit rates")
+            st.bar_chart(cached)
+    else:
+        st.info("No requests recorded yet.")
+    st.subheader("Upstream rate limiters")
+    limiters = rate_limit.all_stats()
+    if limiters:
+        st.dataframe(pd.DataFrame(limiters).set_index("host"), use_container_width=True)
+    else:
+        st.info("No upstream requests made yet.")
+    st.subheader("Shared resources")
+    if st.button("Run health checks", key="check_resources"):
+        failed = {name: error for name, error in resources.check().items() if error}
+        if failed:
+            st.error("Dropped unhealthy resources (rebuilt on next use): " + ", ".join(failed))
+        else:
+            st.success("All live resources are healthy.")
+    st.dataframe(pd.DataFrame(resources.status()).set_index("resource"), use_container_width=True)
+    with st.expander("Prometheus export"):
+        text = metrics.render_prometheus()
+        st.code(text, language="text")
+        st.download_button("Download metrics.txt", text, file_name="metrics.txt", key="download_metrics")
+    if st.button("Reset metrics", key="reset_metrics"):
+        metrics.reset()
+        st.success("Metrics reset.")
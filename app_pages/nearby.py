@@ -0,0 +1,71 @@
+import streamlit as st
+from travelscope import TravelScopeError, lookups, metrics, resources, search
+from travelscope.places import nearby_places
+from travelscope.search import CITY, TrigramIndex
+
+@metrics.timed("geocode")
+@st.cache_data
+@metrics.cache_miss("geocode")
+def geocode_location(city_name):
+    return lookups.geocode(city_name, resources.get("response_cache"))
+
+@metrics.timed("nearby_places")
+@st.cache_data
+@metrics.cache_miss("nearby_places")
+def find_nearby_places(lat, lon, category="tourism"):
+    places = nearby_places(lat, lon, category)
+    search.add(place.name for place in places)
+    return places
+
+def render():
+    st.header("📍 Nearby Explorer")
+    st.write("Find places to visit near a city using OpenStreetMap APIs.")
+    city_name = st.text_input("Enter the name of a city to explore nearby places:", key="nearby_city")
+    if not city_name:
+        st.info("Please enter a city name to explore nearby places.")
+        return
+    try:
+        # As typed first; a near miss of a known city is only tried if Nominatim finds nothing
+        location, city = search.find_corrected(city_name, geocode_location)
+        if city != city_name:
+            st.caption(f"No place called “{city_name}” was found; showing results for **{city}**.")
+    except TravelScopeError as e:
+        st.error(f"Could not find the city: {e}")
+        did_you_mean(city_name)
+        return
+    search.add([location.name.split(",")[0]], CITY)
+    st.success(f"City found: {location.name} ({location.lat}, {location.lon})")
+    nearby_results(location, city)
+
+def nearby_results(location, city_name: str):
+    category = st.selectbox(
+        "Choose a category to explore:",
+        ["tourism", "amenity", "shop", "leisure", "natural"],
+        key="nearby_category"
+    )
+    try:
+        places = find_nearby_places(location.lat, location.lon, category)
+    except TravelScopeError as e:
+        st.error(str(e))
+        return
+    if not places:
+        st.info(f"No {category} places found near {city_name}.")
+        return
+    names = [place.name or "Unknown" for place in places]
+    query = st.text_input("🔎 Find a place by name", key="nearby_search")
+    if query:
+        index = TrigramIndex()
+        for name in names:
+            index.add(name)
+        names = [match.name for match in index.search(query, limit=len(names))]
+        if not names:
+            st.info(f"No {category} places near {city_name} match “{query}”.")
+            return
+    st.write(f"### Nearby {category.capitalize()} Places:")
+    # One element for the whole list; an element per place dominated the rerun time
+    st.markdown("\n".join(f"- {name}" for name in names))
+
+def did_you_mean(query: str):
+    suggestions = [match.name for match in search.suggest(query, 3, (CITY,))]
+    if suggestions:
+        st.info("Did you mean: " + ", ".join(suggestions) + "?")
@@ -0,0 +1,110 @@
+import hashlib
+import io
+import streamlit as st
+import speech_recognition as sr
+from streamlit_webrtc import webrtc_streamer, AudioProcessorBase
+import av
+import numpy as np
+from travelscope import TravelScopeError, resources
+from travelscope.translation import LANGUAGES, MAX_CHUNKS, extract_pdf_text, split_for_translation, translate
+
+# Audio processor for live transcription
+class AudioProcessor(AudioProcessorBase):
+    def __init__(self) -> None:
+        self.buffer = []
+
+    def recv(self, frame: av.AudioFrame) -> av.AudioFrame:
+        audio = frame.to_ndarray()
+        self.buffer.append(audio)
+        return frame
+
+# Built once per process on first use rather than on every transcription
+resources.register("recognizer", sr.Recognizer)
+
+# Keyed by content hash, so reruns and re-uploads of the same file skip PyPDF2
+@st.cache_data(max_entries=32)
+def pdf_text(digest: str, _data: bytes) -> str:
+    return extract_pdf_text(io.BytesIO(_data))
+
+def use_source(source: str):
+    st.session_state["translate_source"] = source
+
+def pdf_changed():
+    # Removing the PDF goes back to the typed text rather than translating nothing
+    use_source("text" if st.session_state.get("pdf_upload") is None else "pdf")
+
+def render():
+    st.header("🌐 Language Translator with Live Audio 🎙️")
+    src_lang = st.selectbox("Source Language", list(LANGUAGES.keys()), index=0, key="src_lang")
+    dest_lang = st.selectbox("Target Language", list(LANGUAGES.keys()), index=1, key="dest_lang")
+    text_inputs()
+    microphone_input()
+    translate_panel(LANGUAGES[src_lang], LANGUAGES[dest_lang])
+
+# Typing or uploading only reruns this section; the most recently used source is translated
+@st.fragment
+def text_inputs():
+    st.text_area("Enter text to translate:", key="translate_text", on_change=use_source, args=("text",))
+    st.markdown("### 📄 Or upload a PDF to translate its text")
+    pdf_file = st.file_uploader("Choose a PDF file", type=["pdf"], key="pdf_upload", on_change=pdf_changed)
+    st.session_state["translate_pdf_text"] = ""
+    if pdf_file is not None:
+        data = pdf_file.getvalue()
+        try:
+            text = st.session_state["translate_pdf_text"] = pdf_text(hashlib.sha256(data).hexdigest(), data)
+            st.success("PDF text extracted!")
+            st.write(text[:1000] + "..." if len(text) > 1000 else text)
+        except Exception as e:
+            st.error(f"Could not extract text from PDF: {e}")
+
+@st.fragment
+def microphone_input():
+    st.markdown("### 🎙️ Or speak into your mic to transcribe and translate")
+    # The WebRTC component keeps a peer connection per session, so only start it on request
+    if not st.toggle("Use microphone", key="use_mic"):
+        return
+    ctx = webrtc_streamer(
+        key="speech",
+        audio_processor_factory=AudioProcessor,
+        media_stream_constraints={"audio": True, "video": False},
+        async_processing=True,
+    )
+    if ctx.audio_processor and st.button("Transcribe Audio", key="transcribe_audio"):
+        try:
+            recognizer = resources.get("recognizer")
+            audio_data = np.concatenate(ctx.audio_processor.buffer, axis=1).flatten().astype(np.int16).tobytes()
+            with open("live_audio.wav", "wb") as f:
+                f.write(audio_data)
+            with sr.AudioFile("live_audio.wav") as source:
+                audio = recognizer.record(source)
+                st.session_state["translate_transcript"] = recognizer.recognize_google(audio)
+            use_source("speech")
+            st.success("Live audio transcribed!")
+            st.write(st.session_state["translate_transcript"])
+        except Exception as e:
+            st.error(f"Could not transcribe audio: {e}")
+
+@st.fragment
+def translate_panel(src_code: str, dest_code: str):
+    if not st.button("Translate", key="translate_button"):
+        return
+    source = st.session_state.get("translate_source", "text")
+    input_text = {
+        "text": st.session_state.get("translate_text", ""),
+        "pdf": st.session_state.get("translate_pdf_text", ""),
+        "speech": st.session_state.get("translate_transcript", ""),
+    }[source]
+    if not input_text.strip():
+        st.warning("Please enter or speak some text.")
+        return
+    chunks = split_for_translation(input_text)
+    if len(chunks) > MAX_CHUNKS:
+        # One request per chunk at about one a second; a whole document would hold the page for minutes
+        input_text = " ".join(chunks[:MAX_CHUNKS])
+        st.caption(f"The text is long, so only its first {len(input_text)} characters are translated.")
+    try:
+        translated_text = translate(input_text, src_code, dest_code)
+        st.success("Translation:")
+        st.write(translated_text)
+    except TravelScopeError as e:
+        st.error(str(e))
@@ -0,0 +1,116 @@
+import streamlit as st
+from travelscope import TravelScopeError, export, lookups, metrics, ranking, resources, search
+from travelscope.itinerary import build_itinerary
+from travelscope.trip import MAX_LEGS, Leg, plan_trip
+
+@metrics.timed("geocode_city")
+def geocode_city(city: str):
+    return lookups.geocode(city, resources.get("response_cache"))
+
+@metrics.timed("attractions")
+def find_attractions(lat: float, lon: float, interests: list[str]):
+    attractions = lookups.attractions(lat, lon, resources.get("response_cache"), interests=interests)
+    search.add(place.name for place in attractions)
+    return attractions
+
+def render():
+    if "itinerary" not in st.session_state:
+        st.session_state["itinerary"] = None
+    if "city" not in st.session_state:
+        st.session_state["city"] = None
+    st.header("🌍 Dynamic Trip Itinerary Generator")
+    if st.toggle("🗺️ Multi-city trip", key="itinerary_multi_city"):
+        trip_planner()
+    else:
+        itinerary_planner()
+
+def itinerary_planner():
+    city = st.text_input("📍 Enter city", "Paris", key="itinerary_city")
+    num_days = st.number_input("🗓️ Number of days", 1, 10, 3, key="itinerary_days")
+    interests = st.multiselect("🎯 Interests", list(ranking.INTERESTS), key="itinerary_interests")
+    start = st.date_input("📅 First day", key="itinerary_start")
+    if st.button("Generate Itinerary", key="generate_itinerary"):
+        try:
+            # As typed first; a near miss of a known city is only tried if Nominatim finds nothing
+            location, corrected = search.find_corrected(city, geocode_city)
+            if corrected != city:
+                st.caption(f"No place called “{city}” was found; planning for **{corrected}**.")
+                city = corrected
+            attractions = find_attractions(location.lat, location.lon, interests)
+        except TravelScopeError as e:
+            st.error(str(e))
+            return
+        if not attractions:
+            st.warning("No attractions found within range.")
+        else:
+            # Best matches for the interests first, near the centre and well-known places preferred
+            scores = ranking.score_places(attractions, location.lat, location.lon, interests)
+            st.session_state["itinerary"] = build_itinerary(attractions, num_days, scores=scores, start=start)
+            st.session_state["city"] = city
+            st.session_state["itinerary_first_day"] = start
+    itinerary = st.session_state.get("itinerary")
+    if itinerary:
+        st.header(f"🧳 Trip Itinerary for {st.session_state['city']}")
+        for day, items in itinerary.items():
+            with st.expander(day, expanded=True):
+                for item in items:
+                    st.markdown(f"🕘 **{item['time']}–{item['end']}** — {item['place']}")
+        city = st.session_state["city"]
+        download_buttons(export.make_plan(itinerary, st.session_state["itinerary_first_day"], f"Trip to {city}"),
+                         city, "itinerary_export")
+    else:
+        st.info("Enter a city and click Generate Itinerary.")
+
+
+@metrics.timed("plan_trip")
+def find_trip(legs: list[Leg], interests: list[str], start):
+    return plan_trip(legs, resources.get("response_cache"), interests, start)
+
+def trip_planner():
+    rows = st.data_editor(
+        [{"City": "Paris", "Days": 3}, {"City": "Rome", "Days": 2}],
+        num_rows="dynamic", key="trip_legs",
+        column_config={"Days": st.column_config.NumberColumn(min_value=1, max_value=10, step=1)},
+    )
+    interests = st.multiselect("🎯 Interests", list(ranking.INTERESTS), key="trip_interests")
+    start = st.date_input("📅 First day", key="trip_start")
+    if st.button("Plan Trip", key="plan_trip"):
+        legs = [Leg(row["City"].strip(), int(row["Days"])) for row in rows
+                if row.get("City") and row["City"].strip() and row.get("Days")]
+        if not legs or len(legs) > MAX_LEGS:
+            st.warning(f"Enter 1 to {MAX_LEGS} cities, each with a number of days.")
+            return
+        try:
+            # Every leg is fetched at once, so this takes about as long as the slowest city
+            st.session_state["trip"] = find_trip(legs, interests, start)
+        except TravelScopeError as e:
+            st.error(str(e))
+            return
+        # Legs whose city was not found and was planned as a known city it is close to
+        for leg, planned in zip(legs, st.session_state["trip"]["legs"]):
+            if planned["city"] != leg.city:
+                st.caption(f"No place called “{leg.city}” was found; planning for **{planned['city']}**.")
+    trip = st.session_state.get("trip")
+    if not trip:
+        st.info("List the cities in travel order and click Plan Trip.")
+        return
+    for leg in trip["legs"]:
+        weather = leg["weather"]
+        now = f" · {weather['temperature']}°C now" if weather else ""
+        st.subheader(f"📍 {leg['city']} — {leg['days']} day(s) from {leg['start']}{now}")
+        for day, items in trip["days"].items():
+            if 0 <= int(day.split()[1]) - leg["first_day"] < leg["days"]:
+                with st.expander(day, expanded=True):
+                    for item in items:
+                        st.markdown(f"🕘 **{item['time']}–{item['end']}** — {item['place']}")
+    title = " – ".join(leg["city"] for leg in trip["legs"])
+    download_buttons(export.make_plan(trip["days"], trip["legs"][0]["start"], title), "trip", "trip_export")
+
+
+def download_buttons(plan: dict, name: str, key: str):
+    # Rendered on every rerun, but only the first time per plan is not a cache read
+    labels = {"ics": "📅 Calendar (.ics)", "geojson": "🗺️ Route (.geojson)", "pdf": "🖨️ PDF"}
+    for column, fmt in zip(st.columns(len(export.FORMATS)), export.FORMATS):
+        mime, extension = export.FORMATS[fmt]
+        column.download_button(labels[fmt], export.render(plan, fmt), file_name=f"{name}.{extension}", mime=mime,
+                               key=f"{key}_{fmt}")
@@ -0,0 +1,53 @@
+import streamlit as st
+from travelscope import TravelScopeError, lookups, metrics, resources, search
+from travelscope.search import CITY
+from travelscope.weather import current_conditions
+
+@metrics.timed("weather_geocode")
+@st.cache_data
+@metrics.cache_miss("weather_geocode")
+def fetch_coordinates(city_name):
+    return lookups.weather_city(city_name, resources.get("response_cache"))
+
+# Expire with the disk entry so refreshed forecasts (e.g. from the warm-up job) are picked up
+@metrics.timed("forecast")
+@st.cache_data(ttl=lookups.FORECAST_TTL)
+@metrics.cache_miss("forecast")
+def fetch_weather_and_details(lat, lon):
+    return lookups.forecast(lat, lon, resources.get("response_cache"))
+
+def render():
+    st.header("🌦️ Accurate Weather Explorer")
+    st.write("Enter a city name to get real-time weather conditions, including humidity, air pressure, and UV index.")
+    weather_panel()
+
+def weather_panel():
+    city_name = st.text_input("Enter a city name:", key="weather_city")
+    if not city_name:
+        st.info("Please enter a city name to get the weather conditions.")
+        return
+    try:
+        # As typed first; a near miss of a known city is only tried if Open-Meteo finds nothing
+        location, city = search.find_corrected(city_name, fetch_coordinates)
+        if city != city_name:
+            st.caption(f"No place called “{city_name}” was found; showing results for **{city}**.")
+        st.success(f"Fetching real-time weather for: {location.name}")
+        weather = current_conditions(fetch_weather_and_details(location.lat, location.lon))
+    except TravelScopeError as e:
+        st.error(f"Unable to fetch weather data: {e}")
+        suggestions = [match.name for match in search.suggest(city_name, 3, (CITY,))]
+        if suggestions:
+            st.info("Did you mean: " + ", ".join(suggestions) + "?")
+        return
+    search.add([location.name], CITY)
+    st.subheader(f"Real-Time Weather in {location.name}:")
+    st.write(f"**Temperature:** {weather.temperature}°C")
+    st.write(f"**Wind Speed:** {weather.windspeed} km/h")
+    st.write(f"**Wind Direction:** {weather.winddirection}°")
+    if None in (weather.humidity, weather.pressure, weather.uv_index):
+        st.error("Unable to retrieve additional metrics from hourly data.")
+    else:
+        st.subheader("Additional Weather Details:")
+        st.write(f"**Humidity:** {weather.humidity}%")
+        st.write(f"**Air Pressure:** {weather.pressure} hPa")
+        st.write(f"**UV Index:** {weather.uv_index}")
@@ -0,0 +1,197 @@
+"""Drive concurrent headless Streamlit sessions through trail_travel.py.
+
+Usage:
+    python benchmarks/load_test.py                            # 1, 2, 4, 8, 16 sessions
+    python benchmarks/load_test.py --levels 4,32 --iterations 3 --latency 0.2
+    python benchmarks/load_test.py --flows itinerary,weather --output load.json
+
+Each simulated user is an ``AppTest`` session running in this process, so all
+sessions share one interpreter, GIL and ``st.cache_*`` store the way they do
+in a single ``streamlit run`` server. Sessions pick a page, enter a city,
+generate an itinerary and translate some text; upstream APIs are served by
+stub_server.py. For every concurrency level the report gives per-rerun
+latency percentiles, reruns/s and peak RSS. The saturation point is the
+last level that still raised throughput by ``--min-gain``. Memory per
+session is measured once, up front, with tracemalloc.
+"""
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from stub_server import StubServer  # noqa: E402
+
+APP = os.path.join(ROOT, "trail_travel.py")
+CITIES = ["Paris", "Rome", "Kyoto", "Lisbon", "Hyderabad", "Prague", "Cusco", "Hanoi"]
+PHRASE = "Where is the museum? How much is a ticket for two adults? "
+
+
+def _page(name):
+    return lambda at, user: at.sidebar.selectbox[0].select(name)
+
+
+def _type(key, value):
+    return lambda at, user: at.text_input(key=key).input(value(user))
+
+
+def _click(key):
+    return lambda at, user: at.button(key=key).click()
+
+
+# Each step changes one widget; the session then reruns the script, as a browser would
+FLOWS = {
+    "itinerary": [
+        _page("Trip Itinerary"),
+        _type("itinerary_city", lambda user: CITIES[user % len(CITIES)]),
+        _click("generate_itinerary"),
+    ],
+    "translate": [
+        _page("Language Translator"),
+        lambda at, user: at.text_area(key="translate_text").input(PHRASE * (1 + user % 4)),
+        _click("translate_button"),
+    ],
+    "weather": [
+        _page("Weather Explorer"),
+        _type("weather_city", lambda user: CITIES[user % len(CITIES)]),
+    ],
+    "nearby": [
+        _page("Nearby Explorer"),
+        _type("nearby_city", lambda user: CITIES[user % len(CITIES)]),
+    ],
+}
+
+
+def run_session(user: int, flows: list[str], iterations: int, timeout: float):
+    """One simulated user; returns (rerun latencies in seconds, error count, the AppTest)."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    latencies, errors = [], 0
+
+    def rerun():
+        nonlocal errors
+        start = time.perf_counter()
+        at.run()
+        latencies.append(time.perf_counter() - start)
+        errors += len(at.exception) + len(at.error)
+
+    rerun()
+    for _ in range(iterations):
+        for flow in flows:
+            for step in FLOWS[flow]:
+                step(at, user)
+                rerun()
+    return latencies, errors, at
+
+
+def memory_per_session(flows: list[str], timeout: float, sessions: int = 3) -> float:
+    """Average bytes retained per finished session (session state, widget trees, messages)."""
+    run_session(0, flows, 1, timeout)  # imports and caches are shared, not per-session
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [run_session(user, flows, 1, timeout)[2] for user in range(1, sessions + 1)]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return (after - before) / sessions
+
+
+def run_level(sessions: int, flows: list[str], iterations: int, timeout: float) -> dict:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda user: run_session(user, flows, iterations, timeout), range(sessions)))
+    wall = time.perf_counter() - started
+    latencies = sorted(t for r in results for t in r[0])
+
+    def pct(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": sum(r[1] for r in results),
+        "wall_s": wall,
+        "reruns_per_s": len(latencies) / wall,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": latencies[-1] * 1000,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def saturation_point(levels: list[dict], min_gain: float) -> int:
+    """Last concurrency level whose throughput beat the previous level by ``min_gain``."""
+    best = levels[0]
+    for previous, current in zip(levels, levels[1:]):
+        if current["reruns_per_s"] < previous["reruns_per_s"] * (1 + min_gain):
+            break
+        best = current
+    return best["sessions"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", default="1,2,4,8,16", help="comma-separated concurrent session counts")
+    parser.add_argument("--flows", default="itinerary,translate", help=f"any of {', '.join(FLOWS)}")
+    parser.add_argument("--iterations", type=int, default=2, help="times each session repeats its flows")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated upstream latency in seconds")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds allowed per rerun")
+    parser.add_argument("--min-gain", type=float, default=0.10)
+    parser.add_argument("--output", default="load_results.json")
+    args = parser.parse_args()
+    levels = [int(n) for n in args.levels.split(",")]
+    flows = args.flows.split(",")
+
+    with StubServer(latency=args.latency) as stub:
+        # Must be set before the app imports upstreams
+        os.environ["TRAVELSCOPE_UPSTREAM_URL"] = stub.url
+        scratch = tempfile.mkdtemp(prefix="travelscope-load-")
+        os.environ.setdefault("TRAVELSCOPE_CACHE_DIR", scratch)
+        os.environ.setdefault("TRAVELSCOPE_DB", os.path.join(scratch, "load.db"))
+        from streamlit import logger
+
+        per_session = memory_per_session(flows, args.timeout)
+        logger.set_log_level("error")
+        print(f"memory per session: {per_session / 1024:.0f} KiB")
+        results = []
+        for n in levels:
+            r = run_level(n, flows, args.iterations, args.timeout)
+            results.append(r)
+            print(f"{n:>4} sessions  {r['reruns_per_s']:7.1f} reruns/s  p50 {r['p50_ms']:7.0f}ms  "
+                  f"p95 {r['p95_ms']:7.0f}ms  p99 {r['p99_ms']:7.0f}ms  errors {r['errors']}  "
+                  f"rss {r['peak_rss_mb']:.0f} MB")
+        upstream_hits = dict(stub.hits)
+
+    saturation = saturation_point(results, args.min_gain)
+    print(f"\nthroughput stops scaling after {saturation} concurrent sessions")
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "flows": flows,
+        "iterations": args.iterations,
+        "latency_s": args.latency,
+        "memory_per_session_kb": per_session / 1024,
+        "saturation_sessions": saturation,
+        "upstream_hits": upstream_hits,
+        "levels": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Record upstream responses for the offline benchmarks.
+
+Usage:
+    python benchmarks/record_fixtures.py [--city Paris]
+
+Writes one JSON file per upstream endpoint into benchmarks/fixtures/. Run it
+against the live services (respecting their usage policies) whenever the
+response formats change; the benchmarks then replay these files through
+stub_server.py.
+"""
+import argparse
+import json
+import os
+import sys
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+HEADERS = {"User-Agent": "TravelScopeApp/1.0 (benchmark fixture recorder)"}
+
+TOURISM = "attraction|museum|viewpoint|artwork|zoo|theme_park"
+
+
+def record(city: str) -> None:
+    os.makedirs(FIXTURES, exist_ok=True)
+    geo = requests.get("https://nominatim.openstreetmap.org/search",
+                       params={"q": city, "format": "json", "limit": 1}, headers=HEADERS, timeout=30).json()
+    save("nominatim_search.json", geo)
+    lat, lon = geo[0]["lat"], geo[0]["lon"]
+    query = f'[out:json];nwr["tourism"~"{TOURISM}"](around:10000,{lat},{lon})["name"];out center;'
+    save("overpass.json", requests.post("https://overpass-api.de/api/interpreter", data=query,
+                                        headers=HEADERS, timeout=120).json())
+    save("open_meteo_geocoding.json", requests.get("https://geocoding-api.open-meteo.com/v1/search",
+                                                   params={"name": city}, timeout=30).json())
+    save("fx_latest.json", requests.get("https://open.er-api.com/v6/latest/INR", timeout=30).json())
+    save("open_meteo_forecast.json", requests.get("https://api.open-meteo.com/v1/forecast", params={
+        "latitude": lat, "longitude": lon, "current_weather": "true",
+        "hourly": "relative_humidity_2m,pressure_msl,uv_index"}, timeout=30).json())
+    save("mymemory.json", requests.get("https://api.mymemory.translated.net/get",
+                                       params={"q": "Where is the museum?", "langpair": "en|fr"}, timeout=30).json())
+    summary = requests.get(f"https://en.wikipedia.org/api/rest_v1/page/summary/{city}",
+                           headers=HEADERS, timeout=30).json()
+    save("wikipedia_summary.json", summary)
+    # The full-size image, so the thumbnail benchmarks have something to shrink
+    image = requests.get(summary["originalimage"]["source"], headers=HEADERS, timeout=60)
+    with open(os.path.join(FIXTURES, "thumbnail.jpg"), "wb") as f:
+        f.write(image.content)
+    print("wrote thumbnail.jpg")
+    save("wikipedia_query.json", requests.get("https://en.wikipedia.org/w/api.php", params={
+        "action": "query", "format": "json", "formatversion": 2, "prop": "extracts|pageimages",
+        "exintro": 1, "explaintext": 1, "piprop": "thumbnail", "pithumbsize": 640, "redirects": 1,
+        "titles": f"{city}|Culture of {city}|{city} cuisine"}, headers=HEADERS, timeout=30).json())
+
+
+def save(name: str, data) -> None:
+    with open(os.path.join(FIXTURES, name), "w") as f:
+        json.dump(data, f, ensure_ascii=False)
+    print(f"wrote {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--city", default="Paris")
+    record(parser.parse_args().city)
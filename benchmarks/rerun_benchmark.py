@@ -0,0 +1,189 @@
+"""Compare a full-script rerun with a fragment rerun for common page interactions.
+
+Usage:
+    python benchmarks/rerun_benchmark.py                     # all scenarios
+    python benchmarks/rerun_benchmark.py --only expense_category,translate_text --reps 50
+    python benchmarks/rerun_benchmark.py --output rerun_results.json
+
+Each scenario opens a page in an ``AppTest`` session, then repeats one widget
+change and times the rerun two ways: re-executing all of trail_travel.py (what
+every interaction cost before the pages were split into ``st.fragment``
+sections) and re-executing only the fragment that owns the widget (what a
+browser session does now). CPU time is measured alongside wall time so
+upstream latency from stub_server.py does not blur the comparison.
+
+AppTest has no public way to rerun a single fragment, so this relies on two
+Streamlit internals: ``AppTest._fragment_storage._fragments`` and the
+``fragment_id_queue`` field of ``local_script_runner.RerunData``. Written
+against Streamlit 1.37.1 (the version pinned in scopee_requirements.txt) and
+checked on 1.66; ``check_internals`` stops the run if either is missing.
+"""
+import argparse
+import dataclasses
+import datetime
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from run_benchmarks import make_pdf  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+APP = os.path.join(ROOT, "trail_travel.py")
+EXPENSE_ROWS = 2000
+
+
+def _page(at, name):
+    at.sidebar.selectbox[0].select(name).run()
+
+
+def _open_expenses(at):
+    _page(at, "Expense Tracker")
+
+
+def _open_translator(at):
+    _page(at, "Language Translator")
+    at.file_uploader(key="pdf_upload").upload("guide.pdf", make_pdf(20), "application/pdf").run()
+
+
+def _open_culture(at):
+    _page(at, "Cultural Insights")
+    at.text_input(key="culture_destination").input("Paris").run()
+
+
+# name -> (open the page, change one widget on rep i, fragment that owns the widget)
+SCENARIOS = {
+    "expense_category": (_open_expenses, lambda at, i: at.selectbox(key="expense_category").select_index(i % 2),
+                         "add_expense_form"),
+    "expense_budget": (_open_expenses, lambda at, i: at.number_input(key="expense_budget").set_value(40000.0 + i),
+                       "budget_panel"),
+    "translate_text": (_open_translator, lambda at, i: at.text_area(key="translate_text").input(f"Hello {i}"),
+                       "text_inputs"),
+    "culture_related": (_open_culture, lambda at, i: at.checkbox(key="culture_related").set_value(i % 2 == 0),
+                        "related_articles"),
+}
+
+
+def check_internals(at) -> None:
+    """Fail loudly if this Streamlit no longer has the internals used to rerun one fragment."""
+    import streamlit
+    from streamlit.testing.v1 import local_script_runner
+
+    rerun_data = getattr(local_script_runner, "RerunData", None)
+    missing = []
+    if not isinstance(getattr(getattr(at, "_fragment_storage", None), "_fragments", None), dict):
+        missing.append("AppTest._fragment_storage._fragments")
+    if rerun_data is None or "fragment_id_queue" not in {f.name for f in dataclasses.fields(rerun_data)}:
+        missing.append("local_script_runner.RerunData(fragment_id_queue=...)")
+    if missing:
+        raise RuntimeError(f"Streamlit {streamlit.__version__} lacks {', '.join(missing)}; "
+                           "this benchmark was written against 1.37.1")
+
+
+def fragment_id(at, name: str) -> str:
+    """Id of the fragment registered by the function called ``name`` in the last run."""
+    for fid, wrapped in at._fragment_storage._fragments.items():
+        if any(getattr(cell.cell_contents, "__name__", None) == name for cell in wrapped.__closure__ or ()):
+            return fid
+    raise LookupError(f"fragment {name!r} was not registered")
+
+
+def rerun_fragment(at, fid: str):
+    """Rerun only one fragment, the way the browser requests it after a widget inside it changes."""
+    from streamlit.testing.v1 import local_script_runner
+
+    rerun_data = local_script_runner.RerunData
+    with mock.patch.object(local_script_runner, "RerunData",
+                           lambda **kwargs: rerun_data(fragment_id_queue=[fid], **kwargs)):
+        at.run()
+
+
+def timed(rerun) -> tuple[float, float]:
+    wall, cpu = time.perf_counter(), time.process_time()
+    rerun()
+    return (time.perf_counter() - wall) * 1000, (time.process_time() - cpu) * 1000
+
+
+def run_scenario(name: str, reps: int, timeout: float) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    open_page, change, fragment = SCENARIOS[name]
+    at = AppTest.from_file(APP, default_timeout=timeout).run()
+    check_internals(at)
+    open_page(at)
+    fid = fragment_id(at, fragment)
+    full, partial = [], []
+    for i in range(reps):
+        change(at, i)
+        full.append(timed(at.run))
+        change(at, i + 1)
+        partial.append(timed(lambda: rerun_fragment(at, fid)))
+    if at.exception:
+        raise RuntimeError(f"{name}: {at.exception[0].value}")
+
+    def median(samples, column):
+        return statistics.median(s[column] for s in samples)
+
+    return {
+        "fragment": fragment,
+        "full_wall_ms": median(full, 0),
+        "full_cpu_ms": median(full, 1),
+        "fragment_wall_ms": median(partial, 0),
+        "fragment_cpu_ms": median(partial, 1),
+    }
+
+
+def seed_expenses(rows: int):
+    from travelscope.expense_ledger import CATEGORIES
+    from travelscope.expense_store import ExpenseStore
+
+    store = ExpenseStore()
+    today = datetime.date.today()
+    for i in range(rows):
+        store.add("my-trip", f"Item {i}", CATEGORIES[i % len(CATEGORIES)], 100.0 + i, "INR",
+                  today - datetime.timedelta(days=i % 14))
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help=f"comma-separated subset of {', '.join(SCENARIOS)}")
+    parser.add_argument("--reps", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds allowed per rerun")
+    parser.add_argument("--output", help="write the report to this file")
+    args = parser.parse_args()
+    names = args.only.split(",") if args.only else list(SCENARIOS)
+
+    with StubServer() as stub:
+        # Must be set before the app imports upstreams
+        os.environ["TRAVELSCOPE_UPSTREAM_URL"] = stub.url
+        scratch = tempfile.mkdtemp(prefix="travelscope-rerun-")
+        os.environ["TRAVELSCOPE_CACHE_DIR"] = scratch
+        os.environ["TRAVELSCOPE_DB"] = os.path.join(scratch, "expenses.db")
+        from streamlit import logger
+
+        logger.set_log_level("error")
+        seed_expenses(EXPENSE_ROWS)
+        results = {}
+        print(f"{'scenario':<18}{'fragment':<20}{'full ms (cpu)':>18}{'fragment ms (cpu)':>20}{'speedup':>9}")
+        for name in names:
+            r = results[name] = run_scenario(name, args.reps, args.timeout)
+            print(f"{name:<18}{r['fragment']:<20}"
+                  f"{r['full_wall_ms']:>9.1f} ({r['full_cpu_ms']:5.1f}){r['fragment_wall_ms']:>11.1f} "
+                  f"({r['fragment_cpu_ms']:5.1f}){r['full_cpu_ms'] / max(r['fragment_cpu_ms'], 1e-3):>8.1f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "reps": args.reps, "scenarios": results},
+                      f, indent=2)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
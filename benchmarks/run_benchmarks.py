@@ -0,0 +1,264 @@
+"""Offline benchmarks for the TravelScope hot paths.
+
+Usage:
+    python benchmarks/run_benchmarks.py                          # writes bench_results.json
+    python benchmarks/run_benchmarks.py --only geocode,weather
+    python benchmarks/run_benchmarks.py --compare old.json       # flag regressions
+
+Upstream calls go to stub_server.py, which replays benchmarks/fixtures, so the
+numbers measure our request building, parsing and data handling rather than
+the public APIs. Cases call the ``travelscope`` core directly, so Streamlit
+caching is not involved. Each case runs until ``--min-time`` has elapsed (and at least
+``--min-runs`` times); results are per-call latency percentiles and ops/s.
+"""
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from stub_server import FIXTURES, StubServer  # noqa: E402
+
+SAMPLE_TEXT = (
+    "The old town is best explored on foot. Start at the cathedral before the crowds arrive! "
+    "Most museums close on Mondays, so plan accordingly. Where is the nearest train station? "
+)
+
+
+def make_pdf(pages: int, lines_per_page: int = 40) -> bytes:
+    """A minimal uncompressed PDF with one Helvetica text block per page."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for p in range(pages):
+        text = " ".join(f"({SAMPLE_TEXT[:90]} page {p + 1} line {i + 1}) Tj T*" for i in range(lines_per_page))
+        stream = f"BT /F1 10 Tf 14 TL 40 780 Td {text} ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id)
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+    out = io.BytesIO(b"%PDF-1.4\n")
+    offsets = []
+    for n, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (n, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def build_cases() -> dict:
+    """Name -> zero-argument callable. Imports happen here, after the upstream override is set."""
+    import pandas as pd
+
+    from travelscope import dedup, export, ranking, search, thumbnails
+    from travelscope.expense_ledger import CATEGORIES, COLUMNS, CURRENCIES, ExpenseLedger
+    from travelscope.expense_store import ExpenseStore
+    from travelscope.geo import geocode
+    from travelscope.itinerary import build_itinerary
+    from travelscope.json_stream import CHUNK_SIZE
+    from travelscope.places import Place, PlaceReader, fetch_attractions, nearby_places, parse_elements
+    from travelscope.translation import extract_pdf_text, split_for_translation, translate
+    from travelscope.weather import current_conditions, fetch_forecast, find_city
+
+    with open(os.path.join(FIXTURES, "overpass.json")) as f:
+        overpass = json.load(f)
+    places = parse_elements(overpass)
+    # About 5 MB of Overpass output, as a dense category around a big city returns
+    big_response = json.dumps({**overpass, "elements": [{**e, "id": e["id"] * 100 + i}
+                                                        for i in range(70) for e in overpass["elements"]]}).encode()
+    # 5000 candidates of mixed kinds, as an interest query in a big city returns
+    kinds = [("amenity", "restaurant"), ("leisure", "park"), ("shop", "clothes"), ("historic", "castle"), ("tourism", "museum")]
+    candidates = [Place(f"{p.name} {i}", p.lat, p.lon, {**p.tags, kinds[i % len(kinds)][0]: kinds[i % len(kinds)][1]})
+                  for i, p in enumerate((places * 13)[:5000])]
+    candidate_scores = ranking.score_places(candidates, 48.8566, 2.3522, ["Food", "Culture"])
+    # The same candidates spread over the city, plus an entrance node next to every tenth one
+    rng = random.Random(0)
+    spread = [Place(p.name, p.lat + rng.uniform(-0.02, 0.02), p.lon + rng.uniform(-0.03, 0.03), p.tags)
+              for p in candidates]
+    with_entrances = spread + [Place(f"{p.name} entrance", p.lat + 1e-4, p.lon, {"entrance": "main"})
+                               for p in spread[::10]]
+    name_index = search.build_indexes()
+    for p in candidates:
+        name_index[search.PLACE].add(p.name)
+    long_text = SAMPLE_TEXT * 200
+    short_text = SAMPLE_TEXT * 10
+    pdfs = {pages: make_pdf(pages) for pages in (1, 20)}
+    rows = [(f"Item {i}", CATEGORIES[i % len(CATEGORIES)], 100.0 + i, "INR") for i in range(1000)]
+    db_dir = tempfile.mkdtemp(prefix="travelscope-bench-")
+    with open(os.path.join(FIXTURES, "wikipedia_summary.json")) as f:
+        image_url = json.load(f)["thumbnail"]["source"]
+    with open(os.path.join(FIXTURES, "thumbnail.jpg"), "rb") as f:
+        original_image = f.read()
+    image_cache = thumbnails.ThumbnailCache(os.path.join(db_dir, "thumbnails"))
+    # A month-long trip, about what the multi-city planner makes at most
+    month = export.make_plan({f"Day {d}": build_itinerary(places, 1, start=datetime.date(2024, 6, d))["Day 1"]
+                              for d in range(1, 31)}, datetime.date(2024, 6, 1), "Month in Paris")
+    export_dir = os.path.join(db_dir, "exports")
+    b"".join(export.export(month, "pdf", export_dir))  # so export_cached only measures hits
+
+    def weather():
+        city = find_city("Paris")
+        return current_conditions(fetch_forecast(city.lat, city.lon))
+
+    def overpass_stream():
+        reader = PlaceReader(set())
+        for start in range(0, len(big_response), CHUNK_SIZE):
+            reader.feed(big_response[start:start + CHUNK_SIZE])
+        return reader.close()
+
+    def ledger_append():
+        ledger = ExpenseLedger(CATEGORIES, CURRENCIES)
+        for item, category, amount, currency in rows:
+            ledger.append(item, category, amount, currency)
+        return ledger.to_frame()
+
+    def dataframe_concat():
+        # What the tracker did before ExpenseLedger: one pd.concat per added expense
+        frame = pd.DataFrame(columns=COLUMNS)
+        for item, category, amount, currency in rows:
+            row = pd.DataFrame([[datetime.date.today(), item, category, amount, currency]], columns=COLUMNS)
+            frame = pd.concat([frame, row], ignore_index=True)
+        return frame
+
+    def store_add_many():
+        store = ExpenseStore(os.path.join(db_dir, "bench.db"))
+        try:
+            store.clear("bench")
+            store.add_many("bench", [row + (datetime.date.today(),) for row in rows])
+        finally:
+            store.close()
+
+    return {
+        "geocode": lambda: geocode("Paris"),
+        "nearby_places": lambda: nearby_places(48.8566, 2.3522),
+        "attractions": lambda: fetch_attractions(48.8566, 2.3522),
+        "build_itinerary": lambda: build_itinerary(places, 5),
+        "rank_candidates_5k": lambda: ranking.score_places(candidates, 48.8566, 2.3522, ["Food", "Culture"]),
+        "dedupe_5k": lambda: dedup.dedupe(with_entrances),
+        "overpass_stream_5mb": overpass_stream,
+        # What fetching did before streaming: the whole document decoded at once
+        "overpass_json_5mb": lambda: parse_elements(json.loads(big_response)),
+        "ranked_itinerary_5k": lambda: build_itinerary(candidates, 5, scores=candidate_scores),
+        "suggest_city": lambda: name_index[search.CITY].search("Barcelna"),
+        "suggest_place_5k": lambda: name_index[search.PLACE].search("Muse 12"),
+        "weather": weather,
+        # A cache miss downloads the original (from the stub) and resizes it; a hit reads one small file
+        "thumbnail_resize": lambda: thumbnails.resize(original_image),
+        "thumbnail_cached": lambda: image_cache.get(image_url),
+        "export_ics_30d": lambda: b"".join(export.ics(month)),
+        "export_pdf_30d": lambda: b"".join(export.pdf(month)),
+        "export_cached": lambda: b"".join(export.export(month, "pdf", export_dir)),
+        "split_for_translation": lambda: split_for_translation(long_text),
+        "translate": lambda: translate(short_text, "en", "fr"),
+        "pdf_extract_1p": lambda: extract_pdf_text(io.BytesIO(pdfs[1])),
+        "pdf_extract_20p": lambda: extract_pdf_text(io.BytesIO(pdfs[20])),
+        "expense_ledger_append_1k": ledger_append,
+        "expense_concat_1k_baseline": dataframe_concat,
+        "expense_store_add_many_1k": store_add_many,
+    }
+
+
+def measure(func, min_time: float, min_runs: int) -> dict:
+    func()  # warm-up: imports, connection pools, first-call caches
+    times = []
+    started = time.perf_counter()
+    while len(times) < min_runs or time.perf_counter() - started < min_time:
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    ordered = sorted(times)
+
+    def pct(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "runs": len(times),
+        "ops_per_s": len(times) / sum(times),
+        "mean_ms": statistics.fmean(times) * 1000,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+    }
+
+
+def compare(results: dict, baseline_path: str, threshold: float) -> list[str]:
+    """Cases whose p50 got slower than the baseline by more than ``threshold``."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["cases"]
+    regressions = []
+    print(f"\n{'case':<30}{'old p50':>12}{'new p50':>12}{'change':>10}")
+    for name, new in results.items():
+        old = baseline.get(name)
+        if not old or "p50_ms" not in old or "p50_ms" not in new:
+            continue
+        change = new["p50_ms"] / old["p50_ms"] - 1 if old["p50_ms"] else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<30}{old['p50_ms']:>10.2f}ms{new['p50_ms']:>10.2f}ms{change:>+9.0%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--only", help="comma-separated case names")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per case")
+    parser.add_argument("--min-runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated upstream latency in seconds")
+    parser.add_argument("--compare", metavar="OLD_JSON", help="baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="p50 slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    with StubServer(latency=args.latency) as stub:
+        # Must be set before any app module imports upstreams
+        os.environ["TRAVELSCOPE_UPSTREAM_URL"] = stub.url
+        os.environ.setdefault("TRAVELSCOPE_CACHE_DIR", tempfile.mkdtemp(prefix="travelscope-cache-"))
+        cases = build_cases()
+        selected = args.only.split(",") if args.only else list(cases)
+        results = {}
+        for name in selected:
+            try:
+                results[name] = measure(cases[name], args.min_time, args.min_runs)
+            except Exception as e:
+                results[name] = {"error": repr(e)}
+            r = results[name]
+            if "error" in r:
+                print(f"{name:<30} ERROR {r['error']}")
+            else:
+                print(f"{name:<30}{r['ops_per_s']:>10.1f} ops/s  p50 {r['p50_ms']:8.2f}ms  "
+                      f"p95 {r['p95_ms']:8.2f}ms  p99 {r['p99_ms']:8.2f}ms")
+        upstream_hits = dict(stub.hits)
+
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "latency_s": args.latency,
+        "upstream_hits": upstream_hits,
+        "cases": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
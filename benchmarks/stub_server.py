@@ -0,0 +1,136 @@
+"""Local stand-in for the upstream APIs, serving recorded fixtures.
+
+Usage:
+    python benchmarks/stub_server.py --port 8765 [--latency 0.05]
+    TRAVELSCOPE_UPSTREAM_URL=http://127.0.0.1:8765 streamlit run trail_travel.py
+
+Requests arrive as ``/<host>/<path>`` (see ``upstreams.upstream``) and are
+answered from ``benchmarks/fixtures`` regardless of query parameters, with an
+optional fixed delay to mimic network latency.
+"""
+import argparse
+import hashlib
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# (host, path prefix) -> fixture file
+ROUTES = [
+    ("nominatim.openstreetmap.org", "/search", "nominatim_search.json"),
+    ("overpass-api.de", "/api/interpreter", "overpass.json"),
+    ("geocoding-api.open-meteo.com", "/v1/search", "open_meteo_geocoding.json"),
+    ("api.open-meteo.com", "/v1/forecast", "open_meteo_forecast.json"),
+    ("api.mymemory.translated.net", "/get", "mymemory.json"),
+    ("en.wikipedia.org", "/api/rest_v1/page/summary/", "wikipedia_summary.json"),
+    ("en.wikipedia.org", "/w/api.php", "wikipedia_query.json"),
+    ("open.er-api.com", "/v6/latest/", "fx_latest.json"),
+    ("upload.wikimedia.org", "/", "thumbnail.jpg"),
+]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog of 5 drops connections at load-test concurrency
+    request_queue_size = 256
+
+
+class StubServer:
+    """Threaded HTTP server replaying fixtures; use as a context manager."""
+
+    def __init__(self, port: int = 0, latency: float = 0.0, fixtures: str = FIXTURES):
+        self.latency = latency
+        self.hits = Counter()
+        self._bodies = {}
+        for _, _, name in ROUTES:
+            with open(os.path.join(fixtures, name), "rb") as f:
+                self._bodies[name] = f.read()
+        self._server = _Server(("127.0.0.1", port), _make_handler(self))
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-upstream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def lookup(self, path: str) -> str | None:
+        host, _, rest = path.lstrip("/").partition("/")
+        rest = "/" + rest.split("?", 1)[0]
+        for route_host, prefix, name in ROUTES:
+            if host == route_host and rest.startswith(prefix):
+                return name
+        return None
+
+
+def _make_handler(stub: StubServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes; without this, keep-alive clients hit delayed-ACK stalls
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            self._respond()
+
+        def do_POST(self):
+            self._respond()
+
+        def _respond(self):
+            # Drain any body (Overpass queries are POSTed) so the connection can be reused
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            name = stub.lookup(self.path)
+            if name is None:
+                self.send_error(404, "No fixture for this path")
+                return
+            stub.hits[name] += 1
+            if stub.latency:
+                time.sleep(stub.latency)
+            body = stub._bodies[name]
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "image/jpeg" if name.endswith(".jpg") else "application/json")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+    server = StubServer(args.port, args.latency)
+    print(f"Serving fixtures on {server.url} (Ctrl+C to stop)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -1,5 +1,6 @@
 import streamlit as st
-import requests
+from travelscope import resources, thumbnails
+from travelscope.culture import fetch_related, fetch_summary
 
 # App Title
 st.title("Cultural Insights App")
@@ -9,24 +10,26 @@ st.header("Explore the Culture of Your Destination")
 destination = st.text_input("Enter a place:", placeholder="e.g., Paris, Tokyo, New Delhi")
 
 if destination:
-    # Fetch data from Wikipedia API
+    # Fetch data from Wikipedia API (cached on disk, revalidated with ETags)
+    cache = resources.get("response_cache")
     try:
-        url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{destination}"
-        response = requests.get(url)
-
-        if response.status_code == 200:
-            data = response.json()
+        summary = fetch_summary(destination, cache)
 
+        if summary:
             # Display cultural insights
-            title = data.get("title", "No title available")
-            extract = data.get("extract", "No insights available for this place.")
-            thumbnail = data.get("thumbnail", {}).get("source", None)
-
-            st.subheader(title)
-            if thumbnail:
-                st.image(thumbnail, caption=f"Image of {destination}")
-
-            st.write(extract)
+            st.subheader(summary["title"])
+            if summary["thumbnail"]:
+                image = thumbnails.get(summary["thumbnail"]) or summary["thumbnail"]
+                st.image(image, caption=f"Image of {destination}")
+
+            st.write(summary["extract"])
+
+            # Related articles come back from a single batched request
+            if st.checkbox("Show customs, cuisine and festivals"):
+                for article in fetch_related(destination, cache):
+                    if article["title"] != summary["title"]:
+                        with st.expander(article["title"]):
+                            st.write(article["extract"])
         else:
             st.error("Unable to fetch cultural insights. Please try a different place.")
 
@@ -1,43 +1,94 @@
+import datetime
+
 import streamlit as st
-import pandas as pd
+from travelscope import resources
+from travelscope.expense_analytics import burn_rate, category_totals, converted_amounts, daily_rollup
+from travelscope.expense_import import import_expenses
+from travelscope.expense_ledger import CATEGORIES, CURRENCIES, ExpenseLedger
+from travelscope.fx_rates import load_rates
 
 st.set_page_config(page_title="Cultural Event Expense Tracker", layout="centered")
 
 st.title("🧾 Cultural Insights Expense Tracker")
 
-# Initialize session state
-if "expenses" not in st.session_state:
-    st.session_state["expenses"] = pd.DataFrame(columns=["Item", "Category", "Amount (₹)"])
+@st.cache_data(ttl=3600)
+def get_fx_rates():
+    return load_rates("INR")
+
+store = resources.get("expense_store")
+trip_id = st.text_input("Trip ID (share it with your group to track expenses together)", "my-trip")
+
+# Initialize session state (a new trip starts from an empty ledger)
+if st.session_state.get("expenses_trip") != trip_id:
+    st.session_state["expenses"] = ExpenseLedger()
+    st.session_state["expenses_version"] = 0
+    st.session_state["expenses_trip"] = trip_id
 
 st.subheader("➕ Add a New Expense")
 
 # Input form
 with st.form(key="expense_form", clear_on_submit=True):
     item = st.text_input("Item / Description")
-    category = st.selectbox("Category", ["Food", "Travel", "Accommodation", "Miscellaneous"])
-    amount = st.number_input("Enter amount in ₹", min_value=0.0, step=10.0, format="%.2f")
+    category = st.selectbox("Category", CATEGORIES)
+    currency = st.selectbox("Currency", CURRENCIES)
+    amount = st.number_input("Enter amount", min_value=0.0, step=10.0, format="%.2f")
+    spent_on = st.date_input("Date", datetime.date.today())
     submit = st.form_submit_button("Add Expense")
 
 # Add expense
 if submit:
     if item and amount:
-        new_expense = {"Item": item, "Category": category, "Amount (₹)": amount}
-        new_df = pd.DataFrame([new_expense])
-        st.session_state["expenses"] = pd.concat([st.session_state["expenses"], new_df], ignore_index=True)
-        st.success(f"Added expense: {item} – ₹{amount:.2f}")
+        store.add(trip_id, item, category, amount, currency, spent_on)
+        st.success(f"Added expense: {item} – {amount:.2f} {currency}")
     else:
         st.warning("Please fill out both the item and amount.")
 
+# Bulk import: the file is streamed in chunks and written in batches
+with st.expander("📥 Bulk import from CSV / bank statement"):
+    upload = st.file_uploader("Choose a CSV file", type=["csv"])
+    import_currency = st.selectbox("Currency for rows without one", CURRENCIES)
+    if upload is not None and st.button("Import Expenses"):
+        try:
+            result = import_expenses(upload, store, trip_id, import_currency)
+            st.success(f"Imported {result['imported']} expenses ({result['skipped']} rows skipped).")
+        except ValueError as e:
+            st.error(f"Could not import file: {e}")
+
+# Pull only the rows added since this session last synced
+ledger = st.session_state["expenses"]
+st.session_state["expenses_version"] = store.pull(trip_id, ledger, st.session_state["expenses_version"])
+fx = get_fx_rates()
+
 # Display table
 st.subheader("📋 Expense Log")
-if not st.session_state["expenses"].empty:
-    st.dataframe(st.session_state["expenses"], use_container_width=True)
-    total = st.session_state["expenses"]["Amount (₹)"].sum()
-    st.markdown(f"### 💰 Total Spent: ₹{total:.2f}")
+if not ledger.empty:
+    log = ledger.to_frame().assign(**{"Amount (₹)": converted_amounts(ledger, fx)})
+    st.dataframe(log, use_container_width=True)
+    by_category = category_totals(ledger, fx)
+    st.markdown(f"### 💰 Total Spent: ₹{by_category.sum():.2f}")
+    if log["Amount (₹)"].isna().any():
+        st.warning("Exchange rates are unavailable for some currencies; those expenses are left out of the totals.")
+
+    # Budget and burn rate over the trip dates
+    st.subheader("📊 Budget")
+    budget = st.number_input("Trip budget (₹)", min_value=0.0, value=50000.0, step=1000.0)
+    trip_start = st.date_input("Trip start", datetime.date.today())
+    trip_end = st.date_input("Trip end", datetime.date.today() + datetime.timedelta(days=6))
+    projection = burn_rate(ledger, fx, budget, trip_start, trip_end)
+    st.write(f"**Remaining:** ₹{projection['remaining']:.2f}")
+    st.write(f"**Daily burn:** ₹{projection['daily_burn']:.2f}")
+    st.write(f"**Projected total:** ₹{projection['projected_total']:.2f}")
+    if projection["days_left"]:
+        st.caption(f"Allowance for each of the {projection['days_left']} remaining days: ₹{projection['daily_allowance']:.2f}")
+    if projection["outside_trip"]:
+        st.caption(f"₹{projection['outside_trip']:.2f} is dated outside the trip (bookings, say): "
+                   "it counts against the budget but not towards the daily burn.")
+    st.dataframe(daily_rollup(ledger, fx), use_container_width=True)
 else:
     st.info("No expenses added yet.")
 
 # Optional: Reset
 if st.button("🔄 Clear All Expenses"):
-    st.session_state["expenses"] = pd.DataFrame(columns=["Item", "Category", "Amount (₹)"])
+    store.clear(trip_id)
+    st.session_state["expenses_version"] = store.pull(trip_id, ledger, st.session_state["expenses_version"])
     st.success("All expenses cleared.")
@@ -0,0 +1,104 @@
+"""Measure cold-start import cost and per-rerun overhead of the TravelScope pages.
+
+Usage:
+    python tools/import_profile.py                 # cold import time per page
+    python tools/import_profile.py --reruns 20     # plus warm rerun latency via AppTest
+    python tools/import_profile.py --json out.json
+
+Cold imports run ``python -X importtime -c "import <page module>"`` in a fresh
+interpreter per page, so each number is what a new server worker pays the
+first time that page is opened.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app_pages import PAGES  # noqa: E402
+
+
+def import_times(module: str, repeat: int = 3) -> dict:
+    """Best-of-``repeat`` cold import time of ``module`` and its heaviest direct imports."""
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            return {"error": proc.stderr.strip().splitlines()[-1]}
+        total_us, children = 0, []
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative_us, name = line.split("|", 2)
+            # Nested imports are indented two spaces per level under their importer
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            if depth == 0:
+                total_us += int(cumulative_us)
+            elif depth == 1:
+                children.append((name.strip(), int(cumulative_us)))
+        if best is None or total_us < best[0]:
+            best = (total_us, children)
+    total_us, children = best
+    heaviest = sorted(children, key=lambda item: item[1], reverse=True)[:5]
+    return {"total_ms": total_us / 1000, "heaviest": [(name, us / 1000) for name, us in heaviest]}
+
+
+def rerun_times(reruns: int) -> dict[str, float]:
+    """Median wall time of a rerun of ``trail_travel.py`` with each page selected."""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(ROOT, "trail_travel.py"), default_timeout=60).run()
+    results = {}
+    for name in PAGES:
+        app.sidebar.selectbox[0].set_value(name).run()
+        if app.exception:
+            results[name] = None
+            continue
+        samples = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            app.run()
+            samples.append((time.perf_counter() - start) * 1000)
+        results[name] = statistics.median(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=0, help="also time N warm reruns per page")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    report = {"baseline": import_times("streamlit"), "pages": {}}
+    base_ms = report["baseline"].get("total_ms", 0.0)
+    print(f"{'streamlit (baseline)':<24}{base_ms:>10.1f} ms")
+    for name, module in PAGES.items():
+        cold = import_times(module)
+        report["pages"][name] = cold
+        if "error" in cold:
+            print(f"{name:<24}{'failed':>10}    {cold['error']}")
+            continue
+        heaviest = ", ".join(f"{mod} {ms:.0f}" for mod, ms in cold["heaviest"][:3])
+        print(f"{name:<24}{cold['total_ms']:>10.1f} ms  (+{cold['total_ms'] - base_ms:.1f} over baseline; {heaviest})")
+
+    if args.reruns:
+        report["reruns_ms"] = rerun_times(args.reruns)
+        print("\nWarm rerun (median):")
+        for name, ms in report["reruns_ms"].items():
+            print(f"{name:<24}{'failed' if ms is None else f'{ms:.1f} ms':>10}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
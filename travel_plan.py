@@ -1,5 +1,7 @@
 import streamlit as st
-import requests
+from travelscope import TravelScopeError
+from travelscope.geo import geocode
+from travelscope.places import nearby_places
 
 # Set up the page title and layout
 st.set_page_config(page_title="📍 Nearby Explorer", layout="wide")
@@ -11,66 +13,22 @@ def geocode_location(city_name):
     """
     Geocode a city name to get its latitude, longitude, and display name using OpenStreetMap's Nominatim API.
     """
-    geocode_url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        "q": city_name, 
-        "format": "json",
-        "limit": 1
-    }
-    headers = {
-        "User-Agent": "NearbyExplorerApp/1.0"
-    }
-    try:
-        response = requests.get(geocode_url, params=params, headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            if data:
-                return float(data[0]['lat']), float(data[0]['lon']), data[0]['display_name']
-            else:
-                st.warning("No results found for the entered city name.")
-        else:
-            st.error(f"Error: Received status code {response.status_code} from the server.")
-    except requests.exceptions.RequestException as e:
-        st.error(f"Network error occurred: {e}")
-    
-    return None, None, None
+    return geocode(city_name)
 
 @st.cache_data
 def find_nearby_places(lat, lon, category="tourism"):
     """
     Find nearby places based on latitude, longitude, and category using OpenStreetMap's Overpass API.
     """
-    overpass_url = "https://overpass-api.de/api/interpreter"
-    query = f"""
-    [out:json];
-    node(around:5000,{lat},{lon})["{category}"];
-    out;
-    """
-    headers = {
-        "User-Agent": "NearbyExplorerApp/1.0"
-    }
-    try:
-        response = requests.get(overpass_url, data=query, headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            if "elements" in data and len(data["elements"]) > 0:
-                return data["elements"]
-            else:
-                st.warning("No nearby places found for the given category.")
-        else:
-            st.error(f"Error: Received status code {response.status_code} from the server.")
-    except requests.exceptions.RequestException as e:
-        st.error(f"Network error occurred: {e}")
-    
-    return []
+    return nearby_places(lat, lon, category)
 
 # User input for city name
 city_name = st.text_input("Enter the name of a city to explore nearby places:")
 
 if city_name:
-    lat, lon, display_name = geocode_location(city_name)
-    if lat and lon:
-        st.success(f"City found: {display_name} ({lat}, {lon})")
+    try:
+        location = geocode_location(city_name)
+        st.success(f"City found: {location.name} ({location.lat}, {location.lon})")
 
         # Dropdown for selecting a category of places
         category = st.selectbox(
@@ -79,17 +37,16 @@ if city_name:
         )
 
         # Fetch nearby places
-        nearby_places = find_nearby_places(lat, lon, category)
+        places = find_nearby_places(location.lat, location.lon, category)
 
         # Display nearby places
-        if nearby_places:
+        if places:
             st.write(f"### Nearby {category.capitalize()} Places:")
-            for place in nearby_places:
-                name = place.get("tags", {}).get("name", "Unknown")
-                st.write(f"- {name}")
+            for place in places:
+                st.write(f"- {place.name or 'Unknown'}")
         else:
             st.info(f"No {category} places found near {city_name}.")
-    else:
-        st.error("Could not find the city. Please check the name and try again.")
+    except TravelScopeError as e:
+        st.error(f"Could not find the city or places: {e}")
 else:
     st.info("Please enter a city name to explore nearby places.")
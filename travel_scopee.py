@@ -2,15 +2,14 @@ import streamlit as st
 import requests
 import random
 from datetime import datetime, timedelta
-from faker import Faker
 import PyPDF2
 import speech_recognition as sr
 from streamlit_webrtc import webrtc_streamer, AudioProcessorBase
 import av
 import numpy as np
+from travelscope import mock_data, ranking
 
-# Initialize faker
-fake = Faker()
+ATTRACTION_CANDIDATES = 40
 
 # ======================
 # Language Configuration
@@ -52,63 +51,12 @@ def fetch_weather(location, days=3):
         return weather
     except Exception as e:
         st.warning(f"Using fallback data due to: {e}")
-        return auto_generate_weather(location, days)
-
-# Fallback generator
-def auto_generate_weather(location, days):
-    weather = []
-    for i in range(days):
-        date = datetime.now() + timedelta(days=i)
-        temp = random.gauss(25, 5)
-        condition = random.choice([("☀️", "Sunny"), ("⛅", "Cloudy"), ("🌧️", "Rainy")])
-        weather.append({
-            "date": date.strftime("%Y-%m-%d"),
-            "day": date.strftime("%A"),
-            "temp": f"{max(-5, min(40, temp)):.1f}°C",
-            "icon": condition[0],
-            "condition": condition[1],
-            "rain": f"{random.randint(10, 90)}%",
-            "humidity": f"{random.randint(30, 90)}%"
-        })
-    return weather
-
-# ======================
-# Mock Place Generator
-# ======================
-def auto_generate_places(location, place_type):
-    types = {
-        "restaurant": {
-            "names": list(set([f"{fake.company()} {x}" for x in ["Bistro", "Grill", "Kitchen", "Eatery"]])),
-            "cuisines": ["Italian", "Japanese", "Indian", "Mexican", "Local", "Fusion"],
-            "descriptors": ["Cozy", "Modern", "Traditional", "Upscale", "Casual"]
-        },
-        "attraction": {
-            "names": list(set([f"{x} {y}" for x in ["National", "City", "Old", "Grand"] 
-                              for y in ["Museum", "Park", "Gallery", "Tower"]])),
-            "types": ["Museum", "Park", "Landmark", "Historical Site"],
-            "descriptors": ["Famous", "Iconic", "Must-see", "Hidden gem"]
-        }
-    }
-    random.shuffle(types[place_type]['names'])
-    places = []
-    for _ in range(5):
-        place_data = types[place_type]
-        name = f"{random.choice(place_data['descriptors'])} {random.choice(place_data['names'])}"
-        places.append({
-            "name": name,
-            "type": random.choice(place_data['types'] if place_type == "attraction" else place_data['cuisines']),
-            "rating": round(random.uniform(3.0, 5.0), 1),
-            "price": "$" * random.randint(1, 4),
-            "distance": f"{random.uniform(0.1, 5.0):.1f} km",
-            "address": fake.address().replace("\n", ", "),
-            "description": fake.sentence()
-        })
-    return sorted(places, key=lambda x: x["rating"], reverse=True)
+        return mock_data.weather(location, days)
 
 # ======================
 # Itinerary Planner
 # ======================
-def generate_itinerary(attractions, restaurants, start_date):
+def generate_itinerary(attractions, restaurants, start_date, rng=random):
     itinerary = []
     total_days = min(len(attractions), len(restaurants))
     for i in range(total_days):
@@ -117,7 +65,7 @@ def generate_itinerary(attractions, restaurants, start_date):
             "day": f"Day {i+1} - {day_date}",
             "morning": f"Visit {attractions[i]['name']} ({attractions[i]['type']})",
             "afternoon": f"Lunch at {restaurants[i]['name']} ({restaurants[i]['type']})",
-            "evening": f"Dinner at {random.choice(restaurants)['name']} and evening walk"
+            "evening": f"Dinner at {rng.choice(restaurants)['name']} and evening walk"
         })
     return itinerary
 
@@ -153,7 +101,7 @@ def main():
         location = st.text_input("Destination", "Paris, France")
         start_date = st.date_input("Start Date", datetime.now())
         end_date = st.date_input("End Date", datetime.now() + timedelta(days=3))
-        interests = st.multiselect("Interests", ["Adventure", "Culture", "Food", "Nature", "Shopping", "Relaxation"])
+        interests = st.multiselect("Interests", list(ranking.INTERESTS))
 
     days = (end_date - start_date).days + 1
 
@@ -173,7 +121,8 @@ def main():
 
     with tabs[2]:
         st.subheader("Top Restaurants")
-        restaurants = auto_generate_places(location, "restaurant")
+        # Drawn from a per-process pool with a seed from the destination: stable across reruns
+        restaurants = mock_data.places(location, "restaurant")
         for r in restaurants:
             with st.expander(f"{r['name']} ({r['rating']}⭐)"):
                 st.write(f"**Cuisine:** {r['type']}")
@@ -182,15 +131,20 @@ def main():
 
     with tabs[3]:
         st.subheader("Must-See Attractions")
-        attractions = auto_generate_places(location, "attraction")
+        # Score a wider draw against the chosen interests and keep the best five
+        candidates = mock_data.places(location, "attraction", count=ATTRACTION_CANDIDATES)
+        scores = ranking.score([a["tags"] for a in candidates], np.array([a["distance_km"] for a in candidates]),
+                               interests, radius_km=5.0, boost=np.array([a["rating"] for a in candidates]) - 3.0)
+        attractions = ranking.top_k(candidates, scores, 5)
         for a in attractions:
             with st.expander(f"{a['name']} ({a['rating']}⭐)"):
                 st.write(f"**Type:** {a['type']}")
-                st.write(f"**Time Needed:** {random.randint(1, 3)} hours")
+                st.write(f"**Time Needed:** {a['hours']} hours")
 
     with tabs[1]:
         st.subheader(f"{days}-Day Personalized Itinerary")
-        itinerary = generate_itinerary(attractions, restaurants, start_date)
+        itinerary = generate_itinerary(attractions, restaurants, start_date,
+                                       random.Random(mock_data.seed_for(location, "itinerary")))
         for day in itinerary:
             with st.expander(day["day"]):
                 st.write("**Morning:**", day["morning"])
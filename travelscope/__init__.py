@@ -0,0 +1,31 @@
+"""TravelScope core: data fetching and planning with no Streamlit dependency.
+
+- ``geo``: Nominatim geocoding
+- ``places``: nearby OSM places and attractions (Overpass)
+- ``itinerary``: timed day plans that respect opening hours and travel time
+- ``opening_hours``: OSM ``opening_hours`` tags as weekly time windows
+- ``ranking``: interest-aware scoring of candidate places
+- ``trip``: multi-city trips, with every leg fetched in parallel
+- ``search``: fuzzy city and place name search, typo correction
+- ``weather``: Open-Meteo city lookup and current conditions
+- ``translation``: MyMemory translation and PDF text extraction
+- ``culture``: Wikipedia summaries and related articles
+- ``thumbnails``: resized, disk-cached copies of the Wikipedia images
+- ``export``: ICS, GeoJSON and PDF downloads of a plan, cached by content
+- ``expense_*``, ``fx_rates``: expense ledger, storage, import and analytics
+- ``lookups``: geocode/attraction/forecast lookups through the disk cache
+- ``mock_data``: seeded mock places and weather for demos
+- ``warmup``: keeps the cache warm for popular destinations
+- ``aio``: async versions of the upstream lookups (httpx), used by the API server
+
+Shared plumbing lives in ``upstreams`` (endpoints), ``rate_limit``,
+``disk_cache``, ``json_stream`` (large responses parsed as they arrive),
+``metrics`` and ``resources`` (one HTTP session, client and database handle
+per process). Functions raise ``TravelScopeError``
+subclasses instead of reporting to the UI; the pages in ``app_pages`` add
+``st.cache_data`` and turn errors into messages. Submodules are imported on
+demand, so ``import travelscope`` stays cheap.
+"""
+from travelscope.errors import Busy, NotFound, TravelScopeError, UpstreamError
+
+__all__ = ["Busy", "NotFound", "TravelScopeError", "UpstreamError"]
@@ -0,0 +1,144 @@
+"""Async versions of the upstream lookups, used by the API server.
+
+Requests go through one pooled ``httpx.AsyncClient`` and take slots from the
+same per-host limiters as the sync code, so the API and the Streamlit app
+(with ``TRAVELSCOPE_RATE_LIMIT_DIR`` set) share each upstream's budget.
+Parsing is shared with the sync modules; both return the same objects.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import httpx
+
+from travelscope import dedup, rate_limit
+from travelscope.errors import Busy, UpstreamError
+from travelscope.geo import HEADERS, Location, parse_search
+from travelscope.json_stream import CHUNK_SIZE
+from travelscope.places import MIN_FAMOUS, Place, PlaceReader, attraction_queries, interest_query, nearby_query
+from travelscope.translation import translation_chunks
+from travelscope.upstreams import (
+    MYMEMORY_URL,
+    NOMINATIM_SEARCH_URL,
+    OPEN_METEO_FORECAST_URL,
+    OPEN_METEO_GEOCODING_URL,
+    OVERPASS_URL,
+)
+from travelscope.weather import check_forecast, forecast_params, parse_city
+
+# Waiting for a rate-limit slot blocks a thread. Each host gets its own few threads, off the
+# loop's default executor, so a backlog for a slow host cannot hold up requests to the others
+WAITERS_PER_HOST = 8
+MAX_WAIT = 30.0
+_slot_waiters = {}
+
+
+def new_client(max_connections: int = 100) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=httpx.Timeout(10.0, read=60.0),
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=20),
+    )
+
+
+async def geocode(client: httpx.AsyncClient, query: str) -> Location:
+    params = {"q": query, "format": "json", "limit": 1}
+    response = await _request(client, "GET", NOMINATIM_SEARCH_URL, params=params)
+    return parse_search(response.json(), query)
+
+
+async def nearby_places(client: httpx.AsyncClient, lat: float, lon: float, category: str = "tourism",
+                        radius: int = 5000) -> list[Place]:
+    return await _overpass_places(client, nearby_query(lat, lon, category, radius), PlaceReader())
+
+
+async def fetch_attractions(client: httpx.AsyncClient, lat: float, lon: float, radius_famous: int = 10000,
+                            radius_fallback: int = 8000, interests=()) -> list[Place]:
+    seen = set()
+    famous_q, near_q = attraction_queries(lat, lon, radius_famous, radius_fallback)
+    places = await _overpass_places(client, famous_q, PlaceReader(seen))
+    if len(places) < MIN_FAMOUS:
+        places += await _overpass_places(client, near_q, PlaceReader(seen))
+    interest_q = interest_query(lat, lon, radius_fallback, interests)
+    if interest_q:
+        places += await _overpass_places(client, interest_q, PlaceReader(seen))
+    return dedup.dedupe(places)
+
+
+async def find_city(client: httpx.AsyncClient, name: str) -> Location:
+    response = await _request(client, "GET", OPEN_METEO_GEOCODING_URL, params={"name": name})
+    return parse_city(response.json(), name)
+
+
+async def fetch_forecast(client: httpx.AsyncClient, lat: float, lon: float) -> dict:
+    response = await _request(client, "GET", OPEN_METEO_FORECAST_URL, params=forecast_params(lat, lon))
+    return check_forecast(response.json())
+
+
+async def translate(client: httpx.AsyncClient, text: str, src_code: str, dest_code: str) -> str:
+    """Translate all chunks concurrently; the MyMemory limiter decides how many are in flight."""
+    async def one(chunk):
+        params = {"q": chunk, "langpair": f"{src_code}|{dest_code}"}
+        response = await _request(client, "GET", MYMEMORY_URL, params=params)
+        return response.json()["responseData"]["translatedText"]
+
+    return " ".join(await asyncio.gather(*(one(chunk) for chunk in translation_chunks(text))))
+
+
+async def _overpass_places(client: httpx.AsyncClient, query: str, reader: PlaceReader) -> list[Place]:
+    response = await _request(client, "POST", OVERPASS_URL, stream=True, content=query.encode())
+    try:
+        async for chunk in response.aiter_bytes(CHUNK_SIZE):
+            reader.feed(chunk)
+        return reader.close()
+    except httpx.HTTPError as e:
+        raise UpstreamError(f"Network error occurred: {e}") from e
+    except ValueError as e:
+        raise UpstreamError(f"Overpass error: {e!r}") from e
+    finally:
+        await response.aclose()
+
+
+async def _request(client: httpx.AsyncClient, method: str, url: str, priority: int = rate_limit.INTERACTIVE,
+                   retries: int = 2, stream: bool = False, **kwargs) -> httpx.Response:
+    """Rate-limited request that retries after HTTP 429; raises ``UpstreamError`` unless the status is 200.
+
+    With ``stream`` the body is left unread and the caller must ``aclose`` the response.
+    """
+    host = urlsplit(url).hostname
+    for attempt in range(retries + 1):
+        await _acquire(url, priority)
+        try:
+            response = await client.send(client.build_request(method, url, **kwargs), stream=stream)
+        except httpx.HTTPError as e:
+            raise UpstreamError(f"Network error occurred: {e}") from e
+        if response.status_code != 429 or attempt == retries:
+            break
+        await response.aclose()
+        rate_limit.backoff(url, response.headers.get("Retry-After"))
+    if response.status_code != 200:
+        await response.aclose()
+        raise UpstreamError(f"Received status code {response.status_code} from {host}.")
+    return response
+
+
+async def _acquire(url: str, priority: int) -> None:
+    limiter = rate_limit.limiter_for(url)
+    if limiter is None:
+        return
+    waiters = _slot_waiters.get(limiter.host)
+    if waiters is None:
+        waiters = _slot_waiters[limiter.host] = ThreadPoolExecutor(
+            max_workers=WAITERS_PER_HOST, thread_name_prefix=f"rate-limit-{limiter.host}")
+    deadline = time.monotonic() + MAX_WAIT
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(waiters, _acquire_by, limiter, priority, deadline)
+    except rate_limit.RateLimitTimeout as e:
+        raise Busy(f"{urlsplit(url).hostname} is busy right now. Please wait and try again.") from e
+
+
+def _acquire_by(limiter: rate_limit.HostLimiter, priority: int, deadline: float) -> None:
+    # Time spent queued for one of the host's threads counts against the wait limit
+    limiter.acquire(priority, max_wait=max(deadline - time.monotonic(), 0.0))
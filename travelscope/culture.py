@@ -0,0 +1,158 @@
+from urllib.parse import quote
+
+import requests
+
+from travelscope import metrics, rate_limit
+from travelscope.disk_cache import DiskCache, is_fresh
+from travelscope.upstreams import WIKIPEDIA_ACTION_URL, WIKIPEDIA_SUMMARY_URL
+
+SUMMARY_URL = WIKIPEDIA_SUMMARY_URL
+ACTION_URL = WIKIPEDIA_ACTION_URL
+HEADERS = {"User-Agent": "TravelScopeApp/1.0"}
+TIMEOUT = 10
+
+SUMMARY_TTL = 24 * 60 * 60
+MISSING_TTL = 60 * 60
+
+# Related articles fetched together with the destination itself
+RELATED_TOPICS = ["Culture of {}", "Cuisine of {}", "{} cuisine", "Festivals in {}"]
+
+
+def normalize_title(text: str) -> str:
+    """Canonical Wikipedia title: collapsed whitespace, spaces instead of underscores."""
+    title = " ".join(text.replace("_", " ").split())
+    return title[:1].upper() + title[1:]
+
+
+def cache_key(text: str) -> str:
+    return normalize_title(text).casefold()
+
+
+@metrics.timed("wikipedia_summary")
+def fetch_summary(destination: str, cache: DiskCache, session: requests.Session | None = None,
+                  priority: int = rate_limit.INTERACTIVE, refresh_within: float = 0.0) -> dict | None:
+    """Return ``{title, extract, thumbnail}`` for a destination, or None if Wikipedia has no page.
+
+    Fresh cache hits make no request; stale entries (or ones expiring within
+    ``refresh_within`` seconds) are revalidated with ``If-None-Match`` and
+    kept on 304. If Wikipedia is unreachable a stale copy is returned,
+    otherwise the ``requests`` exception propagates.
+    """
+    key = cache_key(destination)
+    entry = cache.get("summary", key)
+    if is_fresh(entry, refresh_within):
+        return entry.value
+    metrics.record_miss("wikipedia_summary")
+    headers = dict(HEADERS)
+    if entry and entry.etag:
+        headers["If-None-Match"] = entry.etag
+    url = SUMMARY_URL.format(title=quote(normalize_title(destination).replace(" ", "_"), safe=""))
+    try:
+        response = rate_limit.throttled_get(url, priority, headers=headers, timeout=TIMEOUT, session=session)
+        if response.status_code == 304 and entry:
+            cache.touch("summary", key, SUMMARY_TTL)
+            return entry.value
+        if response.status_code == 404:
+            cache.set("summary", key, None, MISSING_TTL)
+            return None
+        response.raise_for_status()
+    except (requests.exceptions.RequestException, rate_limit.RateLimitTimeout):
+        if entry:
+            return entry.value
+        raise
+    data = response.json()
+    summary = {
+        "title": data.get("title", normalize_title(destination)),
+        "extract": data.get("extract", ""),
+        "thumbnail": data.get("thumbnail", {}).get("source"),
+    }
+    cache.set("summary", key, summary, SUMMARY_TTL, etag=response.headers.get("ETag"))
+    return summary
+
+
+@metrics.timed("wikipedia_related")
+def fetch_related(destination: str, cache: DiskCache, topics: list[str] = RELATED_TOPICS,
+                  session: requests.Session | None = None, priority: int = rate_limit.INTERACTIVE,
+                  refresh_within: float = 0.0) -> list[dict]:
+    """Fetch intro extracts for the destination and its related articles in one Action API call.
+
+    Only titles that are not already cached are requested; titles with no
+    article are cached as missing and left out of the result. If Wikipedia
+    is unreachable the stale copies are used, as in ``fetch_summary``; the
+    ``requests`` exception only propagates when there are none.
+    """
+    main = normalize_title(destination)
+    titles = [main] + [normalize_title(t.format(main)) for t in topics]
+    results = {}
+    wanted = []
+    stale = {}
+    for title in titles:
+        entry = cache.get("extract", cache_key(title))
+        if is_fresh(entry, refresh_within):
+            results[title] = entry.value
+        else:
+            wanted.append(title)
+            if entry:
+                stale[title] = entry.value
+    if wanted:
+        metrics.record_miss("wikipedia_related")
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": 2,
+            "prop": "extracts|pageimages",
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": len(wanted),
+            "piprop": "thumbnail",
+            "pithumbsize": 640,
+            "redirects": 1,
+            "titles": "|".join(wanted),
+        }
+        try:
+            response = rate_limit.throttled_get(ACTION_URL, priority, params=params, headers=HEADERS,
+                                                timeout=TIMEOUT, session=session)
+            response.raise_for_status()
+        except (requests.exceptions.RequestException, rate_limit.RateLimitTimeout):
+            if not stale:
+                raise
+            results.update(stale)
+        else:
+            fetched = _pages_by_requested_title(response.json().get("query", {}))
+            for title in wanted:
+                page = fetched.get(title)
+                value = None
+                if page and not page.get("missing") and page.get("extract"):
+                    value = {
+                        "title": page["title"],
+                        "extract": page["extract"],
+                        "thumbnail": page.get("thumbnail", {}).get("source"),
+                    }
+                cache.set("extract", cache_key(title), value, SUMMARY_TTL if value else MISSING_TTL)
+                results[title] = value
+    seen, related = set(), []
+    for title in titles:
+        page = results.get(title)
+        # Different spellings can redirect to the same article
+        if page and page["title"] not in seen:
+            seen.add(page["title"])
+            related.append(page)
+    return related
+
+
+def _pages_by_requested_title(query: dict) -> dict[str, dict]:
+    """Index Action API pages by the title that was asked for, following normalization and redirects."""
+    pages = {page["title"]: page for page in query.get("pages", [])}
+    aliases = {}
+    for step in query.get("normalized", []) + query.get("redirects", []):
+        aliases[step["from"]] = step["to"]
+    indexed = {}
+    for title in list(pages) + list(aliases):
+        target = title
+        for _ in range(3):
+            if target in pages:
+                break
+            target = aliases.get(target, target)
+        if target in pages:
+            indexed[title] = pages[target]
+    return indexed
@@ -0,0 +1,92 @@
+"""Merging of duplicate places from Overpass results.
+
+OSM often has the same sight more than once: a node and its entrance, the
+building and a visitor-centre node, "Louvre" and "Musée du Louvre". Places
+are bucketed on a grid of ``radius_m`` cells, so each one is compared only
+with the places already kept in its own and the eight neighbouring cells
+(near-linear overall); two places are the same if they lie within
+``radius_m`` and their names match (see ``similar_names``). Places with the
+same name far apart are kept as distinct.
+"""
+import math
+from dataclasses import replace
+
+import numpy as np
+
+from travelscope.search import normalize, trigrams
+
+RADIUS_M = 40.0
+NAME_SIMILARITY = 0.5
+_ROW = 1 << 32  # more rows than a 40 m grid has between the poles
+_NEIGHBOURS = [dx * _ROW + dy for dx in (0, -1, 1) for dy in (0, -1, 1)]
+# Words that do not tell places apart ("Musée du Louvre" ~ "Louvre")
+STOPWORDS = frozenset(
+    "the of and a an de du des la le les l d el al di del della da do dos das der die und von am im "
+    "museum musee museo museu gallery galerie church eglise iglesia chiesa park parc parque garden jardin "
+    "tower tour torre palace palais palacio palazzo square place plaza piazza entrance entree eingang".split()
+)
+
+
+def dedupe(places: list, radius_m: float = RADIUS_M) -> list:
+    """``places`` without duplicates, in order; each kept place also gets its duplicates' missing tags."""
+    if len(places) < 2:
+        return list(places)
+    cos_lat = math.cos(math.radians(sum(p.lat for p in places) / len(places)))
+    # Metres per degree; fine over a city, where the cosine hardly changes
+    mx, my = 111_320.0 * cos_lat, 110_540.0
+    # Cells as single ints (column * _ROW + row), so the nine neighbours are nine additions
+    cells = (np.floor(np.fromiter((p.lon for p in places), float, len(places)) * (mx / radius_m)) * _ROW
+             + np.floor(np.fromiter((p.lat for p in places), float, len(places)) * (my / radius_m))).astype(np.int64)
+    grid: dict[int, list[int]] = {}
+    kept, keys, merged = [], [], set()
+    for place, cell in zip(places, cells.tolist()):
+        key, match = None, None
+        for offset in _NEIGHBOURS:
+            for i in grid.get(cell + offset, ()):
+                if math.hypot((place.lon - kept[i].lon) * mx, (place.lat - kept[i].lat) * my) > radius_m:
+                    continue
+                # Names are only normalized for places that have a neighbour, which most do not
+                key = key or _name_key(place.name)
+                keys[i] = keys[i] or _name_key(kept[i].name)
+                if _similar(key, keys[i]):
+                    match = i
+                    break
+            if match is not None:
+                break
+        if match is None:
+            grid.setdefault(cell, []).append(len(kept))
+            kept.append(place)
+            keys.append(key)
+            continue
+        # The first one wins (famous places are fetched first); it only gains tags it lacks
+        if match not in merged:
+            kept[match] = replace(kept[match], tags=dict(kept[match].tags))
+            merged.add(match)
+        for tag, value in place.tags.items():
+            kept[match].tags.setdefault(tag, value)
+    return kept
+
+
+def similar_names(a: str | None, b: str | None) -> bool:
+    """Same name once normalized, one name's significant words within the other's, or close spelling."""
+    return _similar(_name_key(a), _name_key(b))
+
+
+def _name_key(name: str | None) -> tuple[str, frozenset, set]:
+    norm = normalize(name or "")
+    return norm, frozenset(w for w in norm.split() if w not in STOPWORDS), trigrams(norm) if norm else set()
+
+
+def _similar(a: tuple[str, frozenset, set], b: tuple[str, frozenset, set]) -> bool:
+    (norm_a, words_a, grams_a), (norm_b, words_b, grams_b) = a, b
+    if not norm_a or not norm_b:
+        return False
+    if norm_a == norm_b:
+        return True
+    numbers_a, numbers_b = {w for w in words_a if w.isdigit()}, {w for w in words_b if w.isdigit()}
+    if numbers_a != numbers_b:
+        return False  # "Gate 1" and "Gate 2", "Pier 39" and "Pier 41"
+    if words_a and words_b and (words_a <= words_b or words_b <= words_a):
+        return True
+    shared = len(grams_a & grams_b)
+    return shared / (len(grams_a) + len(grams_b) - shared) >= NAME_SIMILARITY
@@ -0,0 +1,80 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+CACHE_DIR = os.environ.get("TRAVELSCOPE_CACHE_DIR", ".travelscope_cache")
+
+CacheEntry = namedtuple("CacheEntry", ["value", "etag", "fetched_at", "expires_at"])
+
+
+class DiskCache:
+    """Small persistent key/value cache for upstream API responses.
+
+    Values are stored as JSON in SQLite together with the upstream ``ETag``
+    and an expiry time, so entries survive restarts, are shared by every
+    session and server process on the host, and can be revalidated with
+    ``If-None-Match`` once they go stale instead of being downloaded again.
+    """
+
+    def __init__(self, path: str | None = None):
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, "responses.db")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, etag TEXT,"
+            " fetched_at REAL NOT NULL, expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+
+    def get(self, namespace: str, key: str) -> CacheEntry | None:
+        """Return the entry even if expired; callers decide whether to revalidate."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, etag, fetched_at, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], row[2], row[3])
+
+    def set(self, namespace: str, key: str, value, ttl: float, etag: str | None = None) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), etag, now, now + ttl),
+            )
+
+    def items(self, namespace: str) -> list[tuple[str, object]]:
+        """Every ``(key, value)`` in a namespace, expired or not."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM entries WHERE namespace = ?", (namespace,)).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def touch(self, namespace: str, key: str, ttl: float) -> None:
+        """Extend an entry's lifetime after the upstream confirmed it unchanged (HTTP 304)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE entries SET expires_at = ? WHERE namespace = ? AND key = ?",
+                (time.time() + ttl, namespace, key),
+            )
+
+    def ping(self) -> None:
+        """Raise if the database can no longer be read."""
+        with self._lock:
+            self._conn.execute("SELECT 1 FROM entries LIMIT 1").fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def is_fresh(entry: CacheEntry | None, margin: float = 0.0) -> bool:
+    """True if the entry exists and will not expire within ``margin`` seconds."""
+    return entry is not None and entry.expires_at - margin > time.time()
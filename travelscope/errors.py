@@ -0,0 +1,14 @@
+class TravelScopeError(Exception):
+    """Base class for errors raised by the core; the UI shows ``str(error)``."""
+
+
+class NotFound(TravelScopeError):
+    """The upstream service had no result for the query (unknown city, no places)."""
+
+
+class UpstreamError(TravelScopeError):
+    """An upstream API failed, returned an unexpected status, or had no free request slot."""
+
+
+class Busy(UpstreamError):
+    """No request slot for the upstream host within the allowed wait; retry later."""
@@ -0,0 +1,70 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from travelscope.expense_ledger import ExpenseLedger
+from travelscope.fx_rates import FxRates
+
+
+def converted_amounts(ledger: ExpenseLedger, fx: FxRates) -> np.ndarray:
+    """Every ledger amount converted into the FX base currency in one pass."""
+    return fx.convert(ledger.amounts, ledger.currency_codes, ledger.currencies)
+
+
+def category_totals(ledger: ExpenseLedger, fx: FxRates) -> pd.Series:
+    """Spend per category in the base currency, from the ledger's running totals."""
+    factors = np.nan_to_num(fx.factors(ledger.currencies))
+    return pd.Series(ledger.totals @ factors, index=ledger.categories)
+
+
+def daily_rollup(ledger: ExpenseLedger, fx: FxRates) -> pd.DataFrame:
+    """Base-currency spend per day (rows) and category (columns), plus a Total column."""
+    if ledger.empty:
+        return pd.DataFrame(columns=ledger.categories + ["Total"])
+    values = np.nan_to_num(converted_amounts(ledger, fx))
+    days = ledger.day_ordinals
+    first = int(days.min())
+    n_days = int(days.max()) - first + 1
+    n_cats = len(ledger.categories)
+    keys = (days - first).astype(np.int64) * n_cats + ledger.category_codes
+    grid = np.bincount(keys, weights=values, minlength=n_days * n_cats).reshape(n_days, n_cats)
+    index = pd.to_datetime(np.arange(first, first + n_days) - datetime.date(1970, 1, 1).toordinal(), unit="D")
+    frame = pd.DataFrame(grid, index=index, columns=ledger.categories)
+    frame.index.name = "Date"
+    frame["Total"] = grid.sum(axis=1)
+    return frame
+
+
+def burn_rate(ledger: ExpenseLedger, fx: FxRates, budget: float, start: datetime.date,
+              end: datetime.date, today: datetime.date | None = None) -> dict:
+    """Project trip spend from the average daily burn so far.
+
+    Returns spent (on ``start``..``end``), spend dated outside those days
+    (bookings made beforehand, say), remaining budget after both, average
+    spend per elapsed day, the projected total for the whole trip and the
+    allowance per remaining day. Only spend within the trip counts towards
+    the burn rate; before ``start`` it is zero and every trip day is left.
+    """
+    trip_days = max((end - start).days + 1, 1)
+    today = today or datetime.date.today()
+    elapsed = min(max((today - start).days + 1, 0), trip_days)
+    spent = outside = 0.0
+    if not ledger.empty:
+        values = converted_amounts(ledger, fx)
+        days = ledger.day_ordinals
+        in_trip = (days >= start.toordinal()) & (days <= end.toordinal())
+        spent = float(np.nansum(values[in_trip]))
+        outside = float(np.nansum(values[~in_trip]))
+    daily = spent / elapsed if elapsed else 0.0
+    days_left = trip_days - elapsed
+    remaining = budget - spent - outside
+    return {
+        "spent": spent,
+        "outside_trip": outside,
+        "remaining": remaining,
+        "daily_burn": daily,
+        "projected_total": outside + spent + daily * days_left,
+        "daily_allowance": remaining / days_left if days_left else 0.0,
+        "days_left": days_left,
+    }
@@ -0,0 +1,162 @@
+import csv
+import datetime
+import io
+import re
+
+from travelscope.expense_store import ExpenseStore
+
+CHUNK_ROWS = 5000
+
+# Header spellings seen in hand-made sheets and bank/card statement exports
+COLUMN_ALIASES = {
+    "item": ["item", "description", "item / description", "narration", "details", "particulars",
+             "merchant", "payee", "memo", "name", "transaction details", "remarks"],
+    "amount": ["amount", "amount (₹)", "amt", "debit", "debit amount", "withdrawal", "withdrawal amt.",
+               "withdrawal amount", "spent", "value", "price", "cost"],
+    "category": ["category", "expense type"],
+    "date": ["date", "transaction date", "txn date", "value date", "posted", "posting date", "spent on"],
+    "currency": ["currency", "ccy", "curr"],
+    # A DR/CR marker column; credits (refunds, top-ups) are not spending
+    "direction": ["type", "dr/cr", "cr/dr", "debit/credit", "transaction type"],
+}
+
+# First matching rule wins; anything unmatched is Miscellaneous
+CATEGORY_RULES = {
+    "Food": ["restaurant", "cafe", "café", "coffee", "food", "dinner", "lunch", "breakfast", "swiggy",
+             "zomato", "pizza", "bakery", "bar", "pub", "grocery", "supermarket", "dhaba"],
+    "Travel": ["uber", "ola", "lyft", "taxi", "cab", "flight", "airline", "airways", "irctc", "rail",
+               "train", "metro", "bus", "fuel", "petrol", "diesel", "toll", "parking", "ferry"],
+    "Accommodation": ["hotel", "hostel", "airbnb", "oyo", "resort", "inn", "lodge", "booking.com",
+                      "guest house", "homestay", "motel"],
+}
+
+DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%m/%d/%Y", "%d/%m/%y", "%d %b %Y", "%d-%b-%Y", "%d.%m.%Y"]
+
+_CATEGORY_PATTERN = re.compile(
+    "|".join(
+        rf"(?P<c{i}>\b(?:{'|'.join(re.escape(word) for word in words)})s?\b)"
+        for i, words in enumerate(CATEGORY_RULES.values())
+    ),
+    re.IGNORECASE,
+)
+_CATEGORY_NAMES = list(CATEGORY_RULES)
+_AMOUNT_JUNK = re.compile(r"[^\d.\-()]")
+_MARKER = re.compile(r"\b(cr|dr)\.?\s*$", re.IGNORECASE)
+
+
+def categorize(text: str) -> str:
+    """Pick a category for a free-text description with one regex scan."""
+    match = _CATEGORY_PATTERN.search(text)
+    if match is None:
+        return "Miscellaneous"
+    return _CATEGORY_NAMES[int(match.lastgroup[1:])]
+
+
+def map_columns(header: list[str]) -> dict[str, int]:
+    """Map ledger fields to column positions in ``header``; ``item`` and ``amount`` are required."""
+    normalized = [h.strip().lower() for h in header]
+    mapping = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                mapping[field] = normalized.index(alias)
+                break
+    missing = [field for field in ("item", "amount") if field not in mapping]
+    if missing:
+        raise ValueError(f"Could not find a column for: {', '.join(missing)}")
+    return mapping
+
+
+def iter_chunks(fileobj, chunk_rows: int = CHUNK_ROWS):
+    """Yield ``(mapping, rows)`` chunks from a CSV file without reading it all at once."""
+    wrapped = not isinstance(fileobj, io.TextIOBase)
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", errors="replace", newline="") if wrapped else fileobj
+    try:
+        reader = csv.reader(text)
+        mapping = map_columns(next(reader, []))
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                yield mapping, chunk
+                chunk = []
+        if chunk:
+            yield mapping, chunk
+    finally:
+        if wrapped:
+            # Leave the caller's binary file open
+            text.detach()
+
+
+def parse_chunk(mapping: dict[str, int], rows: list[list[str]], default_currency: str = "INR",
+                today: datetime.date | None = None) -> tuple[list[tuple], int]:
+    """Turn raw CSV rows into store rows; returns ``(rows, skipped)``."""
+    today = today or datetime.date.today()
+    i_item, i_amount = mapping["item"], mapping["amount"]
+    i_category, i_date, i_currency = mapping.get("category"), mapping.get("date"), mapping.get("currency")
+    i_direction = mapping.get("direction")
+    parsed, skipped = [], 0
+    date_format = None
+    for row in rows:
+        try:
+            item = row[i_item].strip()
+            amount = _parse_amount(row[i_amount])
+        except (IndexError, ValueError):
+            # Includes credit rows of statements with separate debit and credit columns
+            skipped += 1
+            continue
+        if i_direction is not None and i_direction < len(row) and row[i_direction].strip().lower()[:2] == "cr":
+            amount = -abs(amount)
+        if not item or amount <= 0:
+            skipped += 1
+            continue
+        spent_on = today
+        if i_date is not None and i_date < len(row) and row[i_date].strip():
+            try:
+                spent_on, date_format = _parse_date(row[i_date].strip(), date_format)
+            except ValueError:
+                # Better left out than filed under the wrong day
+                skipped += 1
+                continue
+        category = row[i_category].strip() if i_category is not None and i_category < len(row) else ""
+        if not category:
+            category = categorize(item)
+        currency = row[i_currency].strip().upper() if i_currency is not None and i_currency < len(row) else ""
+        parsed.append((item, category, amount, currency or default_currency, spent_on))
+    return parsed, skipped
+
+
+def import_expenses(fileobj, store: ExpenseStore, trip_id: str, default_currency: str = "INR",
+                    chunk_rows: int = CHUNK_ROWS) -> dict:
+    """Stream a CSV/statement export into the store, one batched write per chunk."""
+    imported = skipped = 0
+    mapping = {}
+    for mapping, rows in iter_chunks(fileobj, chunk_rows):
+        parsed, bad = parse_chunk(mapping, rows, default_currency)
+        store.add_many(trip_id, parsed)
+        imported += len(parsed)
+        skipped += bad
+    return {"imported": imported, "skipped": skipped, "columns": mapping}
+
+
+def _parse_amount(raw: str) -> float:
+    """Positive for a spend; a refund or credit ("-250.00", "(250.00)", "250.00 Cr") comes out negative."""
+    marker = _MARKER.search(raw)
+    cleaned = _AMOUNT_JUNK.sub("", raw[:marker.start()] if marker else raw)
+    if cleaned.startswith("(") and cleaned.endswith(")"):
+        return -abs(float(cleaned[1:-1]))
+    amount = float(cleaned)
+    if marker:
+        return -abs(amount) if marker.group(1).lower() == "cr" else abs(amount)
+    return amount
+
+
+def _parse_date(raw: str, known_format: str | None) -> tuple[datetime.date, str]:
+    """The date and the format it matched; raises ``ValueError`` if no format in ``DATE_FORMATS`` fits."""
+    formats = [known_format] + DATE_FORMATS if known_format else DATE_FORMATS
+    for fmt in formats:
+        try:
+            return datetime.datetime.strptime(raw, fmt).date(), fmt
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised date {raw!r}")
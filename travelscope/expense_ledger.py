@@ -0,0 +1,161 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = ["Food", "Travel", "Accommodation", "Miscellaneous"]
+CURRENCIES = ["INR", "USD", "EUR", "GBP", "JPY", "AUD", "CAD", "SGD", "AED", "THB"]
+COLUMNS = ["Date", "Item", "Category", "Amount", "Currency"]
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+class ExpenseLedger:
+    """Append-only expense log kept as typed column arrays.
+
+    Rows are written into preallocated numpy columns that double in size when
+    full, and a category x currency matrix of totals is updated on every
+    insert, so adding an expense and reading the totals are both O(1). A
+    DataFrame is only built (and then cached) when the log is rendered.
+    """
+
+    def __init__(self, categories: list[str] = CATEGORIES, currencies: list[str] = CURRENCIES, capacity: int = 64):
+        self.categories = list(categories)
+        self.currencies = list(currencies)
+        self._category_codes = {name: i for i, name in enumerate(self.categories)}
+        self._currency_codes = {code: i for i, code in enumerate(self.currencies)}
+        self._items = np.empty(capacity, dtype=object)
+        self._codes = np.empty(capacity, dtype=np.int16)
+        self._currency = np.empty(capacity, dtype=np.int16)
+        self._days = np.empty(capacity, dtype=np.int32)
+        self._amounts = np.empty(capacity, dtype=np.float64)
+        self._totals = np.zeros((len(self.categories), len(self.currencies)))
+        self._size = 0
+        self._frame = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def empty(self) -> bool:
+        return self._size == 0
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self._amounts[:self._size]
+
+    @property
+    def category_codes(self) -> np.ndarray:
+        return self._codes[:self._size]
+
+    @property
+    def currency_codes(self) -> np.ndarray:
+        return self._currency[:self._size]
+
+    @property
+    def day_ordinals(self) -> np.ndarray:
+        return self._days[:self._size]
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Running totals as a (category, currency) matrix in original currencies."""
+        return self._totals
+
+    def append(self, item: str, category: str, amount: float, currency: str = "INR",
+               spent_on: datetime.date | None = None) -> None:
+        self._reserve(1)
+        code = self._code_for(category)
+        cur = self._currency_for(currency)
+        i = self._size
+        self._items[i] = item
+        self._codes[i] = code
+        self._currency[i] = cur
+        self._days[i] = (spent_on or datetime.date.today()).toordinal()
+        self._amounts[i] = amount
+        self._totals[code, cur] += amount
+        self._size += 1
+        self._frame = None
+
+    def extend(self, items: list[str], categories: list[str], amounts: list[float],
+               currencies: list[str] | None = None, dates: list[datetime.date] | None = None) -> None:
+        """Append many rows in one batch."""
+        n = len(items)
+        if not n:
+            return
+        self._reserve(n)
+        codes = np.fromiter((self._code_for(c) for c in categories), dtype=np.int16, count=n)
+        if currencies is None:
+            cur = np.full(n, self._currency_for("INR"), dtype=np.int16)
+        else:
+            cur = np.fromiter((self._currency_for(c) for c in currencies), dtype=np.int16, count=n)
+        if dates is None:
+            days = np.full(n, datetime.date.today().toordinal(), dtype=np.int32)
+        else:
+            days = np.fromiter((d.toordinal() for d in dates), dtype=np.int32, count=n)
+        values = np.asarray(amounts, dtype=np.float64)
+        start, end = self._size, self._size + n
+        self._items[start:end] = items
+        self._codes[start:end] = codes
+        self._currency[start:end] = cur
+        self._days[start:end] = days
+        self._amounts[start:end] = values
+        np.add.at(self._totals, (codes, cur), values)
+        self._size = end
+        self._frame = None
+
+    def clear(self) -> None:
+        self._totals[:] = 0.0
+        self._size = 0
+        self._frame = None
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the ledger as a DataFrame, rebuilt only after new inserts."""
+        if self._frame is None:
+            n = self._size
+            self._frame = pd.DataFrame({
+                "Date": (self._days[:n] - _EPOCH_ORDINAL).astype("datetime64[D]"),
+                "Item": self._items[:n].copy(),
+                "Category": pd.Categorical.from_codes(self._codes[:n].copy(), categories=self.categories),
+                "Amount": self._amounts[:n].copy(),
+                "Currency": pd.Categorical.from_codes(self._currency[:n].copy(), categories=self.currencies),
+            })
+        return self._frame
+
+    def _code_for(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(category)
+            self._category_codes[category] = code
+            self._totals = np.vstack([self._totals, np.zeros((1, self._totals.shape[1]))])
+        return code
+
+    def _currency_for(self, currency: str) -> int:
+        currency = currency.upper()
+        code = self._currency_codes.get(currency)
+        if code is None:
+            code = len(self.currencies)
+            self.currencies.append(currency)
+            self._currency_codes[currency] = code
+            self._totals = np.hstack([self._totals, np.zeros((self._totals.shape[0], 1))])
+        return code
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._amounts)
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < needed:
+            capacity *= 2
+        self._items = _grow(self._items, capacity, self._size)
+        self._codes = _grow(self._codes, capacity, self._size)
+        self._currency = _grow(self._currency, capacity, self._size)
+        self._days = _grow(self._days, capacity, self._size)
+        self._amounts = _grow(self._amounts, capacity, self._size)
+
+
+def _grow(column: np.ndarray, capacity: int, size: int) -> np.ndarray:
+    grown = np.empty(capacity, dtype=column.dtype)
+    grown[:size] = column[:size]
+    return grown
@@ -0,0 +1,131 @@
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+from travelscope.expense_ledger import ExpenseLedger
+
+DEFAULT_DB_PATH = os.environ.get("TRAVELSCOPE_DB", "travelscope.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS expenses (
+    version    INTEGER PRIMARY KEY AUTOINCREMENT,
+    trip_id    TEXT NOT NULL,
+    item       TEXT NOT NULL,
+    category   TEXT NOT NULL,
+    amount     REAL NOT NULL,
+    currency   TEXT NOT NULL DEFAULT 'INR',
+    spent_on   TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS expenses_trip_version ON expenses (trip_id, version);
+CREATE TABLE IF NOT EXISTS trips (
+    trip_id         TEXT PRIMARY KEY,
+    cleared_version INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class ExpenseStore:
+    """Durable, shareable expense storage backed by SQLite in WAL mode.
+
+    Every row gets a monotonically increasing ``version``, so a session only
+    has to ask for ``changes_since(trip_id, last_version)`` on rerun instead
+    of reloading the whole trip. Every ``add`` and ``add_many`` is committed
+    before it returns, so rows survive a crash and other processes see them
+    at once; ``add_many`` writes all its rows in one transaction.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def add(self, trip_id: str, item: str, category: str, amount: float, currency: str = "INR",
+            spent_on: datetime.date | None = None) -> None:
+        self.add_many(trip_id, [(item, category, amount, currency, spent_on or datetime.date.today())])
+
+    def add_many(self, trip_id: str, rows: list[tuple]) -> None:
+        """Store ``(item, category, amount, currency, spent_on)`` rows for the trip in one transaction."""
+        now = time.time()
+        values = [(trip_id, item, category, float(amount), currency, spent_on.isoformat(), now)
+                  for item, category, amount, currency, spent_on in rows]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO expenses (trip_id, item, category, amount, currency, spent_on, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+
+    def clear(self, trip_id: str) -> None:
+        """Delete all expenses of a trip; readers see ``reset=True`` on their next pull."""
+        with self._lock:
+            with self._conn:
+                # The clear takes a version of its own, so sessions already at the latest row still see it
+                cleared = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq), 0) + 1 FROM sqlite_sequence WHERE name = 'expenses'"
+                ).fetchone()[0]
+                self._conn.execute("DELETE FROM expenses WHERE trip_id = ?", (trip_id,))
+                self._conn.execute(
+                    "INSERT INTO trips (trip_id, cleared_version) VALUES (?, ?) "
+                    "ON CONFLICT(trip_id) DO UPDATE SET cleared_version = excluded.cleared_version",
+                    (trip_id, cleared),
+                )
+                self._conn.execute("DELETE FROM sqlite_sequence WHERE name = 'expenses'")
+                self._conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('expenses', ?)", (cleared,))
+
+    def changes_since(self, trip_id: str, version: int = 0) -> tuple[list[tuple], int, bool]:
+        """Return ``(rows, latest_version, reset)`` for rows newer than ``version``.
+
+        ``reset`` is True when the trip was cleared after ``version``; the
+        caller should then drop what it holds and apply ``rows`` from scratch.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT cleared_version FROM trips WHERE trip_id = ?", (trip_id,)).fetchone()
+            reset = bool(row) and row[0] > version
+            if reset:
+                version = 0
+            rows = self._conn.execute(
+                "SELECT version, item, category, amount, currency, spent_on FROM expenses "
+                "WHERE trip_id = ? AND version > ? ORDER BY version",
+                (trip_id, version),
+            ).fetchall()
+        latest = rows[-1][0] if rows else version
+        if reset and not rows:
+            latest = row[0]
+        return rows, latest, reset
+
+    def pull(self, trip_id: str, ledger: ExpenseLedger, version: int = 0) -> int:
+        """Apply new rows for the trip to ``ledger`` and return the new version."""
+        rows, latest, reset = self.changes_since(trip_id, version)
+        if reset:
+            ledger.clear()
+        if rows:
+            _, items, categories, amounts, currencies, days = zip(*rows)
+            dates = [datetime.date.fromisoformat(d) for d in days]
+            ledger.extend(list(items), list(categories), list(amounts), list(currencies), dates)
+        return latest
+
+    def ping(self) -> None:
+        """Raise if the database can no longer be read."""
+        with self._lock:
+            self._conn.execute("SELECT 1 FROM trips LIMIT 1").fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _migrate(self) -> None:
+        """Add the currency/date columns to databases created before they existed."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(expenses)")}
+        with self._conn:
+            if "currency" not in columns:
+                self._conn.execute("ALTER TABLE expenses ADD COLUMN currency TEXT NOT NULL DEFAULT 'INR'")
+            if "spent_on" not in columns:
+                self._conn.execute("ALTER TABLE expenses ADD COLUMN spent_on TEXT")
+            self._conn.execute("UPDATE expenses SET spent_on = date(created_at, 'unixepoch') WHERE spent_on IS NULL")
@@ -0,0 +1,281 @@
+"""Itinerary downloads: iCalendar events, a GeoJSON route and a printable PDF.
+
+An export plan is ``{"title", "start": "YYYY-MM-DD", "days": {"Day 1": [item,
+...], ...}}`` with the items of ``build_itinerary`` or ``build_trip``; day
+N falls on ``start`` + N - 1. ``export`` yields the document in pieces as it
+is written (a day's events or features, or one PDF page, at a time) and tees
+it into ``<CACHE_DIR>/exports``, named by a hash of the plan and format, so
+downloading the same plan again just reads that file.
+
+Times are written as the city's local wall-clock time: ICS events have no
+time zone ("floating"), so calendars show them as planned. The PDF uses the
+standard Helvetica font, so characters outside Windows-1252 print as "?".
+"""
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Iterator
+
+from travelscope.disk_cache import CACHE_DIR
+
+# Format -> (media type, file extension)
+FORMATS = {
+    "ics": ("text/calendar", "ics"),
+    "geojson": ("application/geo+json", "geojson"),
+    "pdf": ("application/pdf", "pdf"),
+}
+VERSION = 1  # part of the cache key; bump when the output changes
+MAX_FILES = 256
+MAX_ITEMS = 2000  # far more than the longest trip the planners make
+
+_DAY = re.compile(r"Day (\d+)\b")
+_CLOCK = re.compile(r"\d{2}:\d{2}")
+
+PAGE_WIDTH, PAGE_HEIGHT, MARGIN = 595, 842, 50  # A4, in points
+LINE_CHARS = 95  # about what fits in a line of 10 pt Helvetica
+
+
+def make_plan(days: dict, start: datetime.date | str, title: str) -> dict:
+    """An export plan, checked; raises ``ValueError`` if ``days`` is not an itinerary."""
+    if not isinstance(days, dict):
+        raise ValueError("'days' must map day names to lists of stops")
+    if isinstance(start, datetime.date):
+        start = start.isoformat()
+    if not isinstance(start, str) or not re.fullmatch(r"\d{4}-\d{2}-\d{2}", start):
+        raise ValueError(f"'start' must be a YYYY-MM-DD date, not {start!r}")
+    datetime.date.fromisoformat(start)
+    items = 0
+    for key, stops in days.items():
+        if not _DAY.match(str(key)):
+            raise ValueError(f"Days must be named 'Day N', not {key!r}")
+        if not isinstance(stops, list):
+            raise ValueError(f"{key!r} must be a list of stops")
+        for stop in stops:
+            if not isinstance(stop, dict) or not isinstance(stop.get("place"), str) \
+                    or not all(_CLOCK.fullmatch(str(stop.get(k, ""))) for k in ("time", "end")):
+                raise ValueError(f"Each stop needs 'place', 'time' and 'end' (HH:MM), not {stop!r}")
+            if any(stop.get(k) is not None and not isinstance(stop[k], (int, float)) for k in ("lat", "lon")):
+                raise ValueError(f"'lat' and 'lon' must be numbers, not {stop!r}")
+            items += 1
+    if items > MAX_ITEMS:
+        raise ValueError(f"At most {MAX_ITEMS} stops can be exported")
+    return {"title": str(title), "start": start, "days": days}
+
+
+def export(plan: dict, fmt: str, cache_dir: str | None = None) -> Iterator[bytes]:
+    """``plan`` as ``fmt`` (a key of ``FORMATS``), in pieces; from the cache if it was exported before."""
+    directory = cache_dir or os.path.join(CACHE_DIR, "exports")
+    path = os.path.join(directory, f"{plan_key(plan, fmt)}.{FORMATS[fmt][1]}")
+    try:
+        with open(path, "rb") as f:
+            os.utime(path)
+            yield from iter(lambda: f.read(64 * 1024), b"")
+        return
+    except FileNotFoundError:
+        pass
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            for piece in _WRITERS[fmt](plan):
+                f.write(piece)
+                yield piece
+        os.replace(tmp, path)
+    finally:
+        # Left behind only if the consumer stopped early or writing failed
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    _prune(directory)
+
+
+def render(plan: dict, fmt: str) -> bytes:
+    """``export`` joined into one document, for callers that need bytes (``st.download_button``)."""
+    return b"".join(export(plan, fmt))
+
+
+def plan_key(plan: dict, fmt: str) -> str:
+    text = json.dumps([VERSION, fmt, plan], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def ics(plan: dict) -> Iterator[bytes]:
+    """An iCalendar file with one event per stop."""
+    uid = plan_key(plan, "ics")[:16]
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield b"".join(_fold(line) for line in (
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//TravelScope//Itinerary export//EN", "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_ics_text(plan['title'])}",
+    ))
+    n = 0
+    for key, date, items in _days(plan):
+        day = f"{date:%Y%m%d}T"
+        lines = []
+        for item in items:
+            n += 1
+            place = _ics_text(item["place"])
+            lines += [
+                "BEGIN:VEVENT", f"UID:{uid}-{n}@travelscope", f"DTSTAMP:{stamp}",
+                f"DTSTART:{day}{item['time'].replace(':', '')}00", f"DTEND:{day}{item['end'].replace(':', '')}00",
+                f"SUMMARY:{place}", f"LOCATION:{place}",
+            ]
+            if item.get("lat") is not None and item.get("lon") is not None:
+                lines.append(f"GEO:{item['lat']:.6f};{item['lon']:.6f}")
+            travel = f". {item['travel_min']} min from the previous stop" if item.get("travel_min") else ""
+            lines += [f"DESCRIPTION:{_ics_text(key + travel)}", "END:VEVENT"]
+        yield b"".join(map(_fold, lines))
+    yield _fold("END:VCALENDAR")
+
+
+def geojson(plan: dict) -> Iterator[bytes]:
+    """A FeatureCollection: a point per stop and a line per day through its stops, in visiting order."""
+    yield json.dumps({"type": "FeatureCollection", "name": plan["title"]}, ensure_ascii=False)[:-1].encode()
+    yield b', "features": ['
+    first = True
+    for key, date, items in _days(plan):
+        features = []
+        route = []
+        for order, item in enumerate(items, 1):
+            if item.get("lat") is None or item.get("lon") is None:
+                continue
+            point = [round(item["lon"], 6), round(item["lat"], 6)]
+            route.append(point)
+            features.append({
+                "type": "Feature", "geometry": {"type": "Point", "coordinates": point},
+                "properties": {"day": key, "date": date.isoformat(), "order": order, "place": item["place"],
+                               "time": item["time"], "end": item["end"], "travel_min": item.get("travel_min")},
+            })
+        if len(route) > 1:
+            features.append({"type": "Feature", "geometry": {"type": "LineString", "coordinates": route},
+                             "properties": {"day": key, "date": date.isoformat()}})
+        for feature in features:
+            yield (b"" if first else b",\n") + json.dumps(feature, ensure_ascii=False).encode()
+            first = False
+    yield b"]}\n"
+
+
+def pdf(plan: dict) -> Iterator[bytes]:
+    """An A4 PDF listing each day's stops, written a page at a time."""
+    writer = _PdfWriter()
+    yield writer.start()
+    page, y = [], PAGE_HEIGHT - MARGIN
+    for font, size, gap, text in _pdf_lines(plan):
+        if y - gap - size < MARGIN and page:
+            yield writer.page(page)
+            page, y = [], PAGE_HEIGHT - MARGIN
+        y -= gap + size
+        page.append(b"BT /%s %d Tf %d %d Td (%s) Tj ET" % (font, size, MARGIN, y, _pdf_text(text)))
+    yield writer.page(page)
+    yield writer.finish()
+
+
+_WRITERS = {"ics": ics, "geojson": geojson, "pdf": pdf}
+
+
+def _days(plan: dict):
+    """``(day name, date, stops)`` in day order."""
+    start = datetime.date.fromisoformat(plan["start"])
+    numbered = sorted((int(_DAY.match(key).group(1)), key) for key in plan["days"])
+    for number, key in numbered:
+        yield key, start + datetime.timedelta(days=number - 1), plan["days"][key]
+
+
+def _ics_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fold(line: str) -> bytes:
+    """A content line, folded to 75 octets as RFC 5545 asks, without splitting a UTF-8 character."""
+    data = line.encode()
+    if len(data) <= 75:
+        return data + b"\r\n"
+    pieces, start, limit = [], 0, 75
+    while len(data) - start > limit:
+        end = start + limit
+        while data[end] & 0xC0 == 0x80:  # continuation byte
+            end -= 1
+        pieces.append(data[start:end])
+        start, limit = end, 74  # continuation lines start with a space
+    pieces.append(data[start:])
+    return b"\r\n ".join(pieces) + b"\r\n"
+
+
+def _pdf_lines(plan: dict):
+    """``(font, size, space above, text)`` for every line of the PDF."""
+    yield b"F2", 18, 0, plan["title"]
+    days = list(_days(plan))
+    if days:
+        yield b"F1", 10, 6, f"{days[0][1]:%a %d %b %Y} to {days[-1][1]:%a %d %b %Y}"
+    for key, date, items in days:
+        yield b"F2", 13, 16, f"{key} \u00b7 {date:%a %d %b}"
+        for item in items:
+            travel = f"  ({item['travel_min']} min travel)" if item.get("travel_min") else ""
+            line = f"{item['time']}\u2013{item['end']}   {item['place']}"
+            if len(line) + len(travel) > LINE_CHARS:
+                line = line[:LINE_CHARS - len(travel) - 1] + "\u2026"
+            yield b"F1", 10, 5, line + travel
+
+
+def _pdf_text(text: str) -> bytes:
+    data = text.encode("cp1252", "replace")
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+class _PdfWriter:
+    """Just enough PDF: objects 1-4 are the catalog, page tree and two fonts; each page adds two more.
+
+    The page tree (object 2) is written last, once every page is known; the
+    cross-reference table records where each object starts.
+    """
+
+    def __init__(self):
+        self.offset = 0
+        self.offsets: dict[int, int] = {}
+        self.pages: list[int] = []
+        self.next_id = 5
+
+    def start(self) -> bytes:
+        data = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+        self.offset += len(data)
+        return data + b"".join([
+            self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+            self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"),
+            self._object(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>"),
+        ])
+
+    def page(self, lines: list[bytes]) -> bytes:
+        content, page = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self.pages.append(page)
+        stream = b"\n".join(lines)
+        return self._object(content, b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)) + self._object(
+            page, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R"
+                  b" /Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>" % (PAGE_WIDTH, PAGE_HEIGHT, content))
+
+    def finish(self) -> bytes:
+        kids = b" ".join(b"%d 0 R" % page for page in self.pages)
+        tree = self._object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.pages)))
+        xref = [b"xref\n0 %d\n" % self.next_id, b"0000000000 65535 f \n"]
+        xref += [b"%010d 00000 n \n" % self.offsets[i] for i in range(1, self.next_id)]
+        trailer = b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (self.next_id, self.offset)
+        return tree + b"".join(xref) + trailer
+
+    def _object(self, number: int, body: bytes) -> bytes:
+        data = b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        self.offsets[number] = self.offset
+        self.offset += len(data)
+        return data
+
+
+def _prune(directory: str) -> None:
+    """Delete the least recently used exports beyond ``MAX_FILES``."""
+    entries = [e for e in os.scandir(directory) if e.is_file() and not e.name.endswith(".tmp")]
+    if len(entries) <= MAX_FILES:
+        return
+    for entry in sorted(entries, key=lambda e: e.stat().st_mtime)[:len(entries) - MAX_FILES]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
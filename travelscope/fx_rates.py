@@ -0,0 +1,71 @@
+import json
+import os
+import time
+
+import numpy as np
+import requests
+
+from travelscope.disk_cache import CACHE_DIR
+from travelscope.rate_limit import RateLimitTimeout, throttled_get
+from travelscope.upstreams import FX_URL
+
+MAX_AGE = 24 * 60 * 60
+
+
+class FxRates:
+    """Exchange-rate table quoted as units of each currency per one ``base``."""
+
+    def __init__(self, base: str, rates: dict[str, float], fetched_at: float):
+        self.base = base
+        self.rates = rates
+        self.fetched_at = fetched_at
+
+    @property
+    def stale(self) -> bool:
+        return time.time() - self.fetched_at > MAX_AGE
+
+    def factors(self, currencies: list[str]) -> np.ndarray:
+        """Multipliers converting each currency into ``base`` (NaN if unknown)."""
+        quoted = np.array([self.rates.get(c, np.nan) for c in currencies], dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            return 1.0 / quoted
+
+    def convert(self, amounts: np.ndarray, currency_codes: np.ndarray, currencies: list[str]) -> np.ndarray:
+        """Vectorized conversion of ``amounts`` (with per-row currency codes) into ``base``."""
+        return amounts * self.factors(currencies)[currency_codes]
+
+
+def load_rates(base: str = "INR", cache_dir: str = CACHE_DIR) -> FxRates:
+    """Return FX rates for ``base``, refreshing the local cache once a day.
+
+    If the refresh fails the last cached table is used; without any cache
+    only the base currency itself can be converted.
+    """
+    path = os.path.join(cache_dir, f"fx_{base}.json")
+    cached = _read_cache(path)
+    if cached and not cached.stale:
+        return cached
+    try:
+        response = throttled_get(FX_URL.format(base=base), timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if data.get("result") != "success":
+            raise ValueError(data.get("error-type", "unexpected FX response"))
+        fresh = FxRates(base, data["rates"], time.time())
+    except (requests.exceptions.RequestException, RateLimitTimeout, ValueError, KeyError):
+        return cached or FxRates(base, {base: 1.0}, 0.0)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"base": fresh.base, "rates": fresh.rates, "fetched_at": fresh.fetched_at}, f)
+    os.replace(tmp, path)
+    return fresh
+
+
+def _read_cache(path: str) -> FxRates | None:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return FxRates(data["base"], data["rates"], data["fetched_at"])
+    except (OSError, ValueError, KeyError):
+        return None
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+import requests
+
+from travelscope.errors import NotFound, UpstreamError
+from travelscope.rate_limit import INTERACTIVE, RateLimitTimeout, throttled_get
+from travelscope.upstreams import NOMINATIM_SEARCH_URL
+
+HEADERS = {"User-Agent": "TravelScopeApp/1.0"}
+
+
+@dataclass(frozen=True)
+class Location:
+    lat: float
+    lon: float
+    name: str
+
+
+def geocode(query: str, session: requests.Session | None = None, priority: int = INTERACTIVE) -> Location:
+    """Best Nominatim match for a place name.
+
+    Raises ``NotFound`` if there is no match and ``UpstreamError`` if
+    Nominatim cannot be reached or answers with an error status.
+    """
+    params = {"q": query, "format": "json", "limit": 1}
+    try:
+        response = throttled_get(NOMINATIM_SEARCH_URL, priority, params=params, headers=HEADERS, timeout=10,
+                                 session=session)
+    except (requests.exceptions.RequestException, RateLimitTimeout) as e:
+        raise UpstreamError(f"Network error occurred: {e}") from e
+    if response.status_code != 200:
+        raise UpstreamError(f"Received status code {response.status_code} from Nominatim.")
+    return parse_search(response.json(), query)
+
+
+def parse_search(data: list, query: str) -> Location:
+    if not data:
+        raise NotFound(f"No results found for {query!r}.")
+    return Location(float(data[0]["lat"]), float(data[0]["lon"]), data[0]["display_name"])
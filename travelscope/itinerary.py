@@ -0,0 +1,212 @@
+"""Day-by-day plans that respect opening hours, visit lengths and travel time.
+
+Each day is a small orienteering problem with time windows: choose and order
+stops so that every visit fits inside the place's ``opening_hours`` and the
+day (DAY_START to DAY_END), with travel between stops accounted for, and
+collect as much score as possible. ``build_itinerary`` cuts the candidates to
+the best few per day, precomputes their travel-time matrix, then builds each
+day greedily by score per minute spent (travel, waiting and visit) and
+improves it with 2-opt, insertion and swap moves until none helps. Days are
+planned in turn, so the best places go to the first days.
+"""
+import datetime
+import math
+import random
+
+import numpy as np
+
+from travelscope import opening_hours, ranking
+from travelscope.places import Place
+
+DAY_START, DAY_END = 9 * 60, 18 * 60
+MAX_PER_DAY = 5
+CANDIDATES_PER_DAY = 12  # best-scored places kept per planned day
+SLOT = 5  # start times are rounded up to 5 minutes
+
+# Minutes spent at a place, by OSM tag; the first match in this order wins
+VISIT_MINUTES = {
+    ("tourism", "theme_park"): 240, ("tourism", "zoo"): 180, ("leisure", "water_park"): 180,
+    ("tourism", "museum"): 120, ("tourism", "gallery"): 90, ("amenity", "theatre"): 120,
+    ("amenity", "restaurant"): 75, ("amenity", "marketplace"): 60, ("amenity", "cafe"): 45,
+    ("leisure", "park"): 60, ("leisure", "garden"): 60, ("leisure", "nature_reserve"): 120,
+    ("tourism", "viewpoint"): 30, ("tourism", "artwork"): 15, ("historic", "*"): 45,
+    ("amenity", "place_of_worship"): 30, ("shop", "*"): 45, ("tourism", "*"): 60,
+}
+DEFAULT_VISIT = 60
+
+# Walk short hops, take transit beyond WALK_KM; straight-line distance times DETOUR
+DETOUR = 1.3
+WALK_KM, WALK_KMH = 1.5, 4.5
+TRANSIT_KMH, TRANSIT_WAIT = 18.0, 10.0
+
+
+def build_itinerary(places: list[Place], days: int, rng: random.Random | None = None,
+                    scores: np.ndarray | None = None, start: datetime.date | None = None) -> dict[str, list[dict]]:
+    """Timed plan over ``days`` starting on ``start`` (default today).
+
+    With ``scores`` (see ``ranking``) better places are preferred; without
+    them every place is worth the same and candidates are drawn at random.
+
+    Returns ``{"Day 1": [{"time": "09:00", "end": "10:00", "place": name,
+    "lat": ..., "lon": ..., "travel_min": 0}, ...], ...}``; days where nothing
+    fits are left out, without renumbering the others.
+    """
+    if not places:
+        return {}
+    if scores is None:
+        places = list(places)
+        (rng or random).shuffle(places)
+        scores = np.zeros(len(places), dtype=np.float32)
+    best = ranking.top_k(list(range(len(places))), scores, max(days, 2) * CANDIDATES_PER_DAY)
+    pool = [places[i] for i in best]
+    # Shifted so every place is worth something, even with negative scores
+    pool_scores = np.asarray([scores[i] for i in best], dtype=np.float64)
+    value = (pool_scores - pool_scores.min() + 1.0).tolist()
+    travel = travel_minutes(pool).tolist()
+    visit = [visit_minutes(p.tags) for p in pool]
+    hours = [opening_hours.parse(p.tags.get("opening_hours")) for p in pool]
+    day_plan = _DayPlanner(value, travel, visit, hours)
+
+    start = start or datetime.date.today()
+    left = set(range(len(pool)))
+    plan = {}
+    for d in range(days):
+        route = day_plan.solve((start + datetime.timedelta(days=d)).weekday(), left)
+        if not route:
+            continue
+        left.difference_update(route)
+        plan[f"Day {d + 1}"] = [
+            {"time": _clock(begin), "end": _clock(begin + visit[i]), "place": pool[i].name,
+             "lat": pool[i].lat, "lon": pool[i].lon, "travel_min": round(hop)}
+            for i, begin, hop in day_plan.timeline(route)
+        ]
+    return plan
+
+
+def visit_minutes(tags: dict) -> int:
+    """Expected length of a visit, from the place's tags."""
+    for (key, value), minutes in VISIT_MINUTES.items():
+        if key in tags and value in ("*", tags[key]):
+            return minutes
+    return DEFAULT_VISIT
+
+
+def travel_minutes(places: list[Place]) -> np.ndarray:
+    """Matrix of travel times between places, in minutes."""
+    lats = np.radians([p.lat for p in places])
+    lons = np.radians([p.lon for p in places])
+    dlat = lats[:, None] - lats[None, :]
+    dlon = lons[:, None] - lons[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lats)[:, None] * np.cos(lats)[None, :] * np.sin(dlon / 2) ** 2
+    km = 2 * 6371.0 * np.arcsin(np.sqrt(a)) * DETOUR
+    return np.where(km <= WALK_KM, km / WALK_KMH * 60, TRANSIT_WAIT + km / TRANSIT_KMH * 60)
+
+
+class _DayPlanner:
+    """Greedy construction plus local search for one day's route (indices into the candidate pool)."""
+
+    def __init__(self, value: list[float], travel: list[list[float]], visit: list[int], hours: list):
+        self.value, self.travel, self.visit, self.hours = value, travel, visit, hours
+        self.weekday = 0
+
+    def solve(self, weekday: int, left: set[int]) -> list[int]:
+        self.weekday = weekday
+        route = self._greedy(left)
+        improved = True
+        while improved:
+            improved = self._two_opt(route) or self._insert(route, left) or self._swap(route, left)
+        return route
+
+    def timeline(self, route: list[int]) -> list[tuple[int, float, float]] | None:
+        """``(stop, start minute, travel minutes to it)`` per stop, or None if the route does not fit the day."""
+        out, now, prev = [], DAY_START, None
+        for i in route:
+            hop = 0.0 if prev is None else self.travel[prev][i]
+            begin = self._begin(i, now + hop)
+            if begin is None:
+                return None
+            out.append((i, begin, hop))
+            now, prev = begin + self.visit[i], i
+        return out
+
+    def _begin(self, i: int, arrive: float) -> float | None:
+        arrive = math.ceil(arrive / SLOT) * SLOT
+        begin = opening_hours.earliest_visit(self.hours[i], self.weekday, arrive, self.visit[i])
+        if begin is None or begin + self.visit[i] > DAY_END:
+            return None
+        return begin
+
+    def _end(self, route: list[int]) -> float | None:
+        times = self.timeline(route)
+        if times is None:
+            return None
+        i, begin, _ = times[-1] if times else (None, DAY_START, 0)
+        return begin + (self.visit[i] if i is not None else 0)
+
+    def _greedy(self, left: set[int]) -> list[int]:
+        route, now, prev = [], DAY_START, None
+        while len(route) < MAX_PER_DAY:
+            best, best_ratio = None, 0.0
+            for i in left.difference(route):
+                begin = self._begin(i, now + (0.0 if prev is None else self.travel[prev][i]))
+                if begin is None:
+                    continue
+                ratio = self.value[i] / (begin + self.visit[i] - now)
+                if ratio > best_ratio:
+                    best, best_ratio = i, ratio
+            if best is None:
+                break
+            begin = self._begin(best, now + (0.0 if prev is None else self.travel[prev][best]))
+            route.append(best)
+            now, prev = begin + self.visit[best], best
+        return route
+
+    def _two_opt(self, route: list[int]) -> bool:
+        """Reverse the first segment that makes the day finish earlier."""
+        end = self._end(route)
+        for a in range(len(route) - 1):
+            for b in range(a + 1, len(route)):
+                candidate = route[:a] + route[a:b + 1][::-1] + route[b + 1:]
+                new_end = self._end(candidate)
+                if new_end is not None and new_end < end:
+                    route[:] = candidate
+                    return True
+        return False
+
+    def _insert(self, route: list[int], left: set[int]) -> bool:
+        """Add the most valuable unplanned place that still fits, where it delays the day least."""
+        if len(route) >= MAX_PER_DAY:
+            return False
+        # No order can fit a visit longer than the day's time not already spent visiting
+        spare = DAY_END - DAY_START - sum(self.visit[i] for i in route)
+        for i in sorted(left.difference(route), key=self.value.__getitem__, reverse=True):
+            if self.visit[i] > spare:
+                continue
+            best, best_end = None, math.inf
+            for pos in range(len(route) + 1):
+                candidate = route[:pos] + [i] + route[pos:]
+                end = self._end(candidate)
+                if end is not None and end < best_end:
+                    best, best_end = candidate, end
+            if best is not None:
+                route[:] = best
+                return True
+        return False
+
+    def _swap(self, route: list[int], left: set[int]) -> bool:
+        """Replace a stop with a more valuable unplanned place that fits in its slot."""
+        spare = sorted(left.difference(route), key=self.value.__getitem__, reverse=True)
+        for pos, stop in enumerate(route):
+            for i in spare:
+                if self.value[i] <= self.value[stop]:
+                    break
+                candidate = route[:pos] + [i] + route[pos + 1:]
+                if self._end(candidate) is not None:
+                    route[:] = candidate
+                    return True
+        return False
+
+
+def _clock(minutes: float) -> str:
+    minutes = int(minutes)
+    return datetime.time(minutes // 60 % 24, minutes % 60).strftime("%H:%M")
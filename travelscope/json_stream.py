@@ -0,0 +1,155 @@
+"""Incremental parsing of the one big array in a JSON response.
+
+Overpass answers ``{"version": ..., "osm3s": {...}, "elements": [...]}``
+where ``elements`` can run to many megabytes. ``ArrayStream`` is fed the
+response body chunk by chunk and hands back each item of the named top-level
+array as soon as it is complete, so only the current chunk and the items the
+caller keeps are ever in memory. Other top-level values are decoded and
+dropped. ijson's push parser is used when installed; otherwise items are cut
+out of the buffer with ``json.JSONDecoder.raw_decode``, which is C-speed per
+item.
+"""
+import codecs
+import json
+import re
+
+try:
+    import ijson
+except ImportError:  # optional; the raw_decode parser below is used instead
+    ijson = None
+
+CHUNK_SIZE = 64 * 1024
+
+_BLANK = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = frozenset("0123456789.eE+-")
+_decoder = json.JSONDecoder()
+
+# Parser states: what the next non-blank character in the buffer should be. The _FIRST_ states
+# follow an opening bracket and may see it closed; after a comma another key or item must come
+_OPEN, _FIRST_KEY, _KEY, _COLON, _VALUE, _AFTER_VALUE, _ARRAY, _FIRST_ITEM, _ITEM, _AFTER_ITEM, _DONE = range(11)
+
+
+class ArrayStream:
+    """Push parser for ``{..., key: [item, ...], ...}``: ``feed`` bytes, get back the items completed so far."""
+
+    def __init__(self, key: str, use_ijson: bool = True):
+        self.key = key
+        self._ijson = use_ijson and ijson is not None
+        if self._ijson:
+            self._items = ijson.sendable_list()
+            self._coro = ijson.items_coro(self._items, f"{key}.item", use_float=True)
+            return
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text, self._pos = "", 0
+        self._state, self._field = _OPEN, None
+
+    def feed(self, chunk: bytes) -> list:
+        """Items completed by ``chunk``; raises ``ValueError`` if the input is not valid JSON."""
+        if self._ijson:
+            return self._send(chunk)
+        self._text = self._text[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        """Items still buffered at the end of input; raises ``ValueError`` if the document is incomplete."""
+        if self._ijson:
+            items = self._send(b"")
+            self._coro.close()
+            return items
+        self._text = self._text[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("JSON document ended early")
+        return items
+
+    def _send(self, chunk: bytes) -> list:
+        try:
+            self._coro.send(chunk)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        items = list(self._items)
+        del self._items[:]
+        return items
+
+    def _parse(self, final: bool) -> list:
+        items, text = [], self._text
+        while True:
+            pos = _BLANK.match(text, self._pos).end()
+            if pos == len(text):
+                self._pos = pos
+                return items
+            char, state = text[pos], self._state
+            if state == _OPEN:
+                self._expect(char, "{", pos)
+                self._state, self._pos = _FIRST_KEY, pos + 1
+            elif state in (_FIRST_KEY, _AFTER_VALUE) and char == "}":
+                self._state, self._pos = _DONE, pos + 1
+            elif state == _AFTER_VALUE:
+                self._expect(char, ",", pos)
+                self._state, self._pos = _KEY, pos + 1
+            elif state == _COLON:
+                self._expect(char, ":", pos)
+                self._state, self._pos = (_ARRAY if self._field == self.key else _VALUE), pos + 1
+            elif state == _ARRAY:
+                self._expect(char, "[", pos)
+                self._state, self._pos = _FIRST_ITEM, pos + 1
+            elif state in (_FIRST_ITEM, _AFTER_ITEM) and char == "]":
+                self._state, self._pos = _AFTER_VALUE, pos + 1
+            elif state == _AFTER_ITEM:
+                self._expect(char, ",", pos)
+                self._state, self._pos = _ITEM, pos + 1
+            elif state in (_KEY, _ITEM) and char in "]}":
+                raise ValueError(f"Trailing comma before {char!r} at character {pos}")
+            elif state == _DONE:
+                raise ValueError(f"Extra data at character {pos}")
+            elif state in (_FIRST_ITEM, _ITEM):
+                if not self._items_from(text, pos, final, items):
+                    return items  # incomplete; wait for the next chunk
+            else:  # _FIRST_KEY, _KEY or _VALUE: a whole JSON value
+                decoded = self._value(text, pos, final)
+                if decoded is None:
+                    self._pos = pos
+                    return items  # incomplete; wait for the next chunk
+                value, self._pos = decoded
+                if state != _VALUE:
+                    self._field, self._state = value, _COLON
+                else:
+                    self._state = _AFTER_VALUE
+
+    def _items_from(self, text: str, pos: int, final: bool, items: list) -> bool:
+        """Array items and the commas between them, in one tight loop; False if it stopped for more input."""
+        while True:
+            decoded = self._value(text, pos, final)
+            if decoded is None:
+                self._pos = pos
+                return False
+            value, end = decoded
+            items.append(value)
+            if text[end:end + 1] != ",":
+                self._state, self._pos = _AFTER_ITEM, end
+                return True
+            pos = _BLANK.match(text, end + 1).end()
+            if pos == len(text) or text[pos] == "]":
+                # The outer loop rejects a "]" straight after the comma
+                self._state, self._pos = _ITEM, pos
+                return True
+
+    @staticmethod
+    def _value(text: str, pos: int, final: bool) -> tuple | None:
+        try:
+            value, end = _decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        # A number cut off by the end of the buffer ("12" of "12.5") may continue in the next chunk
+        if not final and (end == len(text) or text[end] in _NUMBER_TAIL):
+            return None
+        return value, end
+
+    @staticmethod
+    def _expect(char: str, expected: str, pos: int) -> None:
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at character {pos}, found {char!r}")
@@ -0,0 +1,118 @@
+"""Geocoding, attraction and forecast lookups backed by the persistent response cache.
+
+Results are stored in ``DiskCache`` so they are shared by every server
+process and survive restarts; ``warmup`` fills the same entries ahead of
+time. If a refresh fails, the previous (expired) value is returned.
+The ``*_async`` variants take the upstream call as a coroutine function, for
+the API server's async client; cache reads and writes run in a worker thread.
+"""
+import asyncio
+from dataclasses import asdict
+
+from travelscope import geo, places, weather
+from travelscope.disk_cache import DiskCache, is_fresh
+from travelscope.errors import UpstreamError
+from travelscope.geo import Location
+from travelscope.places import Place
+from travelscope.rate_limit import INTERACTIVE
+
+GEOCODE_TTL = 7 * 24 * 60 * 60
+ATTRACTIONS_TTL = 24 * 60 * 60
+FORECAST_TTL = 60 * 60
+
+
+def geocode(query: str, cache: DiskCache, priority: int = INTERACTIVE, refresh_within: float = 0.0) -> Location:
+    value = _read_through(cache, "geocode", _text_key(query), GEOCODE_TTL, refresh_within,
+                          lambda: asdict(geo.geocode(query, priority=priority)))
+    return Location(**value)
+
+
+def attractions(lat: float, lon: float, cache: DiskCache, priority: int = INTERACTIVE,
+                refresh_within: float = 0.0, interests=()) -> list[Place]:
+    value = _read_through(cache, "attractions", _attractions_key(lat, lon, interests), ATTRACTIONS_TTL,
+                          refresh_within,
+                          lambda: [asdict(p) for p in places.fetch_attractions(lat, lon, priority=priority,
+                                                                               interests=interests)])
+    return [Place(**p) for p in value]
+
+
+def weather_city(name: str, cache: DiskCache, priority: int = INTERACTIVE, refresh_within: float = 0.0) -> Location:
+    value = _read_through(cache, "weather_city", _text_key(name), GEOCODE_TTL, refresh_within,
+                          lambda: asdict(weather.find_city(name, priority=priority)))
+    return Location(**value)
+
+
+def forecast(lat: float, lon: float, cache: DiskCache, priority: int = INTERACTIVE,
+             refresh_within: float = 0.0) -> dict:
+    return _read_through(cache, "forecast", _point_key(lat, lon), FORECAST_TTL, refresh_within,
+                         lambda: weather.fetch_forecast(lat, lon, priority=priority))
+
+
+async def geocode_async(query: str, cache: DiskCache, load) -> Location:
+    async def fetch():
+        return asdict(await load())
+
+    return Location(**await _read_through_async(cache, "geocode", _text_key(query), GEOCODE_TTL, fetch))
+
+
+async def attractions_async(lat: float, lon: float, cache: DiskCache, load, interests=()) -> list[Place]:
+    async def fetch():
+        return [asdict(p) for p in await load()]
+
+    value = await _read_through_async(cache, "attractions", _attractions_key(lat, lon, interests),
+                                      ATTRACTIONS_TTL, fetch)
+    return [Place(**p) for p in value]
+
+
+async def weather_city_async(name: str, cache: DiskCache, load) -> Location:
+    async def fetch():
+        return asdict(await load())
+
+    return Location(**await _read_through_async(cache, "weather_city", _text_key(name), GEOCODE_TTL, fetch))
+
+
+async def forecast_async(lat: float, lon: float, cache: DiskCache, load) -> dict:
+    return await _read_through_async(cache, "forecast", _point_key(lat, lon), FORECAST_TTL, load)
+
+
+def _read_through(cache: DiskCache, namespace: str, key: str, ttl: float, refresh_within: float, load):
+    entry = cache.get(namespace, key)
+    if is_fresh(entry, refresh_within):
+        return entry.value
+    try:
+        value = load()
+    except UpstreamError:
+        if entry:
+            return entry.value
+        raise
+    cache.set(namespace, key, value, ttl)
+    return value
+
+
+async def _read_through_async(cache: DiskCache, namespace: str, key: str, ttl: float, load):
+    entry = await asyncio.to_thread(cache.get, namespace, key)
+    if is_fresh(entry):
+        return entry.value
+    try:
+        value = await load()
+    except UpstreamError:
+        if entry:
+            return entry.value
+        raise
+    await asyncio.to_thread(cache.set, namespace, key, value, ttl)
+    return value
+
+
+def _attractions_key(lat: float, lon: float, interests) -> str:
+    key = _point_key(lat, lon)
+    if interests:
+        key += "|" + ",".join(sorted(_text_key(i) for i in interests))
+    return key
+
+
+def _text_key(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def _point_key(lat: float, lon: float) -> str:
+    return f"{lat:.5f},{lon:.5f}"
@@ -0,0 +1,173 @@
+"""In-process timing histograms for the app's hot paths.
+
+Wrap a stage with ``span("geocode")`` or ``@timed("geocode")``; durations
+land in a per-stage histogram (Prometheus buckets plus a bounded sample for
+percentiles). ``cache_miss`` marks the body of a cached function so hit
+rates can be derived from calls vs. misses. ``render_prometheus`` returns
+the text exposition format and ``start_exporter`` serves it on /metrics.
+"""
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SAMPLE_SIZE = 2048
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.errors = 0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        i = 0
+        while i < len(BUCKETS) and seconds > BUCKETS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.total += seconds
+        self.count += 1
+        self.errors += error
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+_lock = threading.Lock()
+_histograms = {}
+_misses = {}
+
+
+def observe(stage: str, seconds: float, error: bool = False) -> None:
+    with _lock:
+        histogram = _histograms.get(stage)
+        if histogram is None:
+            histogram = _histograms[stage] = Histogram()
+        histogram.observe(seconds, error)
+
+
+@contextmanager
+def span(stage: str):
+    """Time the enclosed block under ``stage``; exceptions are counted and re-raised.
+
+    Control flow that is not a failure (``st.rerun()``/``st.stop()``, cancellation,
+    ``KeyboardInterrupt``) raises ``BaseException`` subclasses and is not counted.
+    """
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        observe(stage, time.perf_counter() - start, error)
+
+
+def timed(stage: str):
+    """Decorator form of :func:`span`."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def record_miss(stage: str) -> None:
+    with _lock:
+        _misses[stage] = _misses.get(stage, 0) + 1
+
+
+def cache_miss(stage: str):
+    """Decorator for the undecorated body of a cached function: counts each real execution."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            record_miss(stage)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def snapshot() -> list[dict]:
+    """Per-stage count, error count, mean and p50/p95/p99 in milliseconds, plus cache hit rate."""
+    with _lock:
+        items = [(stage, h, _misses.get(stage)) for stage, h in sorted(_histograms.items())]
+        rows = []
+        for stage, h, misses in items:
+            rows.append({
+                "stage": stage,
+                "count": h.count,
+                "errors": h.errors,
+                "mean_ms": h.total / h.count * 1000 if h.count else 0.0,
+                "p50_ms": h.percentile(0.50) * 1000,
+                "p95_ms": h.percentile(0.95) * 1000,
+                "p99_ms": h.percentile(0.99) * 1000,
+                "cache_hit_rate": max(0.0, 1 - misses / h.count) if misses is not None and h.count else None,
+            })
+    return rows
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
+        _misses.clear()
+
+
+def render_prometheus() -> str:
+    lines = [
+        "# HELP travelscope_stage_seconds Time spent per request stage.",
+        "# TYPE travelscope_stage_seconds histogram",
+    ]
+    with _lock:
+        for stage, h in sorted(_histograms.items()):
+            cumulative = 0
+            for bound, n in zip(BUCKETS + (float("inf"),), h.counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'travelscope_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'travelscope_stage_seconds_sum{{stage="{stage}"}} {h.total}')
+            lines.append(f'travelscope_stage_seconds_count{{stage="{stage}"}} {h.count}')
+        lines.append("# HELP travelscope_stage_errors_total Stage executions that raised.")
+        lines.append("# TYPE travelscope_stage_errors_total counter")
+        for stage, h in sorted(_histograms.items()):
+            lines.append(f'travelscope_stage_errors_total{{stage="{stage}"}} {h.errors}')
+        lines.append("# HELP travelscope_cache_misses_total Executions of cached functions (cache misses).")
+        lines.append("# TYPE travelscope_cache_misses_total counter")
+        for stage, n in sorted(_misses.items()):
+            lines.append(f'travelscope_cache_misses_total{{stage="{stage}"}} {n}')
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_exporter(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``/metrics`` in a daemon thread for Prometheus to scrape."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+    return server
@@ -0,0 +1,141 @@
+"""Deterministic mock places and weather for demos and offline runs.
+
+A pool of restaurants and attractions is generated once per process
+(Faker text, numpy columns) and reused; ``places(location, kind)`` draws from
+it with a seed derived from the location and kind, so the same destination
+always gets the same list, in microseconds, across reruns and processes.
+"""
+import datetime
+import hashlib
+import random
+from dataclasses import dataclass
+
+import numpy as np
+
+from travelscope import resources
+
+POOL_SIZE = 2048
+POOL_SEED = 20240601
+TEXT_POOL = 512  # distinct Faker addresses / sentences / companies per pool
+
+KINDS = {
+    "restaurant": {
+        "types": ["Italian", "Japanese", "Indian", "Mexican", "Local", "Fusion"],
+        "descriptors": ["Cozy", "Modern", "Traditional", "Upscale", "Casual"],
+        "suffixes": ["Bistro", "Grill", "Kitchen", "Eatery"],
+    },
+    "attraction": {
+        "types": ["Museum", "Park", "Landmark", "Historical Site"],
+        "descriptors": ["Famous", "Iconic", "Must-see", "Hidden gem"],
+        "names": [f"{x} {y}" for x in ["National", "City", "Old", "Grand"] for y in ["Museum", "Park", "Gallery", "Tower"]],
+    },
+}
+# OSM-style tags per type, so mock places can be scored like real ones (see ``ranking``)
+TYPE_TAGS = {
+    "Museum": {"tourism": "museum"},
+    "Park": {"leisure": "park"},
+    "Landmark": {"tourism": "attraction"},
+    "Historical Site": {"historic": "monument"},
+    **{cuisine: {"amenity": "restaurant", "cuisine": cuisine.lower()} for cuisine in KINDS["restaurant"]["types"]},
+}
+CONDITIONS = [("☀️", "Sunny"), ("⛅", "Cloudy"), ("🌧️", "Rainy")]
+
+
+@dataclass
+class _Column:
+    """One kind's pool, column-wise; text columns hold indices into the shared string lists."""
+    names: list[str]
+    types: np.ndarray
+    rating: np.ndarray
+    price: np.ndarray
+    distance: np.ndarray
+    hours: np.ndarray
+    address: np.ndarray
+    description: np.ndarray
+
+
+class MockPool:
+    def __init__(self, size: int = POOL_SIZE, seed: int = POOL_SEED):
+        from faker import Faker
+
+        fake = Faker()
+        fake.seed_instance(seed)
+        rng = np.random.default_rng(seed)
+        self.addresses = [fake.address().replace("\n", ", ") for _ in range(TEXT_POOL)]
+        self.sentences = [fake.sentence() for _ in range(TEXT_POOL)]
+        companies = [fake.company() for _ in range(TEXT_POOL)]
+        self.columns = {}
+        for kind, spec in KINDS.items():
+            descriptors = rng.choice(spec["descriptors"], size)
+            if kind == "restaurant":
+                base = [f"{companies[c]} {spec['suffixes'][s]}"
+                        for c, s in zip(rng.integers(TEXT_POOL, size=size), rng.integers(len(spec["suffixes"]), size=size))]
+            else:
+                base = list(rng.choice(spec["names"], size))
+            self.columns[kind] = _Column(
+                names=[f"{d} {b}" for d, b in zip(descriptors, base)],
+                types=rng.integers(len(spec["types"]), size=size, dtype=np.uint8),
+                rating=np.round(rng.uniform(3.0, 5.0, size), 1).astype(np.float32),
+                price=rng.integers(1, 5, size=size, dtype=np.uint8),
+                distance=rng.uniform(0.1, 5.0, size).astype(np.float32),
+                hours=rng.integers(1, 4, size=size, dtype=np.uint8),
+                address=rng.integers(TEXT_POOL, size=size, dtype=np.uint16),
+                description=rng.integers(TEXT_POOL, size=size, dtype=np.uint16),
+            )
+
+    def draw(self, kind: str, seed: int, count: int) -> list[dict]:
+        col = self.columns[kind]
+        # random.sample touches only ``count`` slots; numpy's choice(replace=False) permutes the whole pool
+        picks = random.Random(seed).sample(range(len(col.names)), count)
+        picks.sort(key=lambda i: -col.rating[i])  # best rated first, ties in draw order
+        types = KINDS[kind]["types"]
+        return [
+            {
+                "name": col.names[i],
+                "type": types[col.types[i]],
+                "rating": round(float(col.rating[i]), 1),
+                "price": "$" * int(col.price[i]),
+                "distance": f"{col.distance[i]:.1f} km",
+                "distance_km": round(float(col.distance[i]), 1),
+                "hours": int(col.hours[i]),
+                "address": self.addresses[col.address[i]],
+                "description": self.sentences[col.description[i]],
+                "tags": TYPE_TAGS[types[col.types[i]]],
+            }
+            for i in picks
+        ]
+
+
+resources.register("mock_pool", MockPool)
+
+
+def seed_for(*parts: str) -> int:
+    """Stable 64-bit seed for a tuple of strings (same in every process, unlike ``hash``)."""
+    key = "\x1f".join(" ".join(p.split()).casefold() for p in parts)
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def places(location: str, kind: str, count: int = 5) -> list[dict]:
+    """``count`` mock restaurants or attractions for ``location``, best rated first."""
+    return resources.get("mock_pool").draw(kind, seed_for(location, kind), count)
+
+
+def weather(location: str, days: int, start: datetime.date | None = None) -> list[dict]:
+    """Mock daily forecast; each (location, date) always gets the same weather."""
+    start = start or datetime.date.today()
+    forecast = []
+    for i in range(days):
+        date = start + datetime.timedelta(days=i)
+        rng = random.Random(seed_for(location, date.isoformat()))
+        temp = rng.gauss(25, 5)
+        icon, condition = rng.choice(CONDITIONS)
+        forecast.append({
+            "date": date.strftime("%Y-%m-%d"),
+            "day": date.strftime("%A"),
+            "temp": f"{max(-5, min(40, temp)):.1f}°C",
+            "icon": icon,
+            "condition": condition,
+            "rain": f"{rng.randint(10, 90)}%",
+            "humidity": f"{rng.randint(30, 90)}%",
+        })
+    return forecast
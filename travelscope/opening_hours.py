@@ -0,0 +1,100 @@
+"""OSM ``opening_hours`` tags as weekly time windows.
+
+Covers the forms nearly all tagged attractions use: ``24/7``, weekday ranges
+and lists (``Mo-Fr,Su``), several spans per rule (``09:00-12:00,14:00-18:00``),
+``off``/``closed``, spans past midnight and ``sunrise``/``sunset`` (fixed
+approximations). Later rules override the days they name; days no rule names
+are closed. Rules with anything else (months, dates, public holidays, week
+numbers) are skipped, and if no rule can be read ``parse`` returns None,
+which callers treat as "hours unknown, assume open".
+"""
+import functools
+import re
+
+DAYS = ("Mo", "Tu", "We", "Th", "Fr", "Sa", "Su")
+SUNRISE, SUNSET = 7 * 60, 20 * 60
+ALL_DAY = ((0, 24 * 60),)
+
+_DAY = "(?:" + "|".join(DAYS) + ")"
+_DAY_SELECTOR = re.compile(rf"({_DAY}(?:\s*-\s*{_DAY})?(?:\s*,\s*{_DAY}(?:\s*-\s*{_DAY})?)*)\s*:?\s*")
+_SPAN = re.compile(r"(\d{1,2}:\d{2}|sunrise|sunset)\s*-\s*(\d{1,2}:\d{2}|sunrise|sunset)\+?")
+
+# One tuple of (open, close) minute spans per weekday, Monday first
+Week = tuple[tuple[tuple[int, int], ...], ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def parse(text: str | None) -> Week | None:
+    """Weekly open spans in minutes after midnight, or None if the tag is missing or unreadable."""
+    if not text:
+        return None
+    week: list[tuple | None] = [None] * 7
+    readable = False
+    for rule in re.split(r";|\|\|", text):
+        rule = rule.strip()
+        if not rule:
+            continue
+        parsed = _rule(rule)
+        if parsed is None:
+            continue
+        days, spans = parsed
+        for day in days:
+            week[day] = spans
+        readable = True
+    if not readable:
+        return None
+    return tuple(spans or () for spans in week)
+
+
+def earliest_visit(week: Week | None, weekday: int, arrive: float, minutes: float) -> float | None:
+    """First start at or after ``arrive`` with ``minutes`` of visit before closing, or None if closed."""
+    if week is None:
+        return arrive
+    for opens, closes in week[weekday]:
+        start = max(arrive, opens)
+        if start + minutes <= closes:
+            return start
+    return None
+
+
+def _rule(rule: str) -> tuple[list[int], tuple] | None:
+    match = _DAY_SELECTOR.match(rule)
+    if match:
+        days = _days(match.group(1))
+        rest = rule[match.end():].strip()
+    else:
+        days, rest = list(range(7)), rule
+    if rest in ("off", "closed"):
+        return days, ()
+    if rest in ("", "24/7"):
+        # A bare day selector ("Sa-Su") means open all day
+        return days, ALL_DAY
+    spans = []
+    for part in rest.split(","):
+        span = _SPAN.fullmatch(part.strip())
+        if span is None:
+            return None
+        opens, closes = _minutes(span.group(1)), _minutes(span.group(2))
+        if closes <= opens:
+            closes += 24 * 60
+        spans.append((opens, closes))
+    return days, tuple(sorted(spans))
+
+
+def _days(selector: str) -> list[int]:
+    days = []
+    for part in selector.split(","):
+        first, _, last = (p.strip() for p in part.partition("-"))
+        start = DAYS.index(first)
+        span = (DAYS.index(last) - start) % 7 if last else 0  # "Fr-Mo" wraps round the week
+        days += [(start + i) % 7 for i in range(span + 1)]
+    return days
+
+
+def _minutes(value: str) -> int:
+    if value == "sunrise":
+        return SUNRISE
+    if value == "sunset":
+        return SUNSET
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
@@ -0,0 +1,187 @@
+from dataclasses import dataclass, field
+
+import requests
+
+from travelscope import dedup, metrics, rate_limit, ranking, resources
+from travelscope.errors import UpstreamError
+from travelscope.geo import HEADERS
+from travelscope.json_stream import CHUNK_SIZE, ArrayStream
+from travelscope.upstreams import OVERPASS_URL
+
+TOURISM = "attraction|museum|viewpoint|artwork|zoo|theme_park"
+# Fewer well-known attractions than this and the nearby fallback query runs too
+MIN_FAMOUS = 10
+# Interest queries can match thousands of shops or restaurants in a big city
+MAX_INTEREST_CANDIDATES = 2000
+
+
+@dataclass(slots=True)
+class Place:
+    name: str | None
+    lat: float
+    lon: float
+    tags: dict = field(default_factory=dict)
+
+
+def nearby_places(lat: float, lon: float, category: str = "tourism", radius: int = 5000,
+                  session: requests.Session | None = None) -> list[Place]:
+    """OSM elements carrying a ``category`` tag within ``radius`` metres; unnamed ones have ``name=None``.
+
+    Ways and relations (parks, museums mapped as buildings) are placed at
+    their centre.
+    """
+    return _run_overpass_query(nearby_query(lat, lon, category, radius), PlaceReader(), session=session)
+
+
+def nearby_query(lat: float, lon: float, category: str, radius: int) -> str:
+    return f"""
+    [out:json];
+    nwr(around:{radius},{lat},{lon})["{category}"];
+    out center;
+    """
+
+
+def parse_elements(data: dict) -> list[Place]:
+    """Places from an already decoded Overpass response."""
+    reader = PlaceReader()
+    reader.add(data.get("elements", []))
+    return reader.places
+
+
+class PlaceReader:
+    """Places from an Overpass JSON response fed in chunks, one element at a time.
+
+    Each element is turned into a ``Place`` as soon as it has been read and
+    the rest of it (way node lists, relation members) is dropped, so memory
+    holds the places kept and one chunk, however big the response. With
+    ``seen`` only named elements not already in it are kept, and ``seen``
+    gains their ``(type, id)``.
+    """
+
+    def __init__(self, seen: set | None = None):
+        self.places: list[Place] = []
+        self._seen = seen
+        self._stream = ArrayStream("elements")
+
+    def feed(self, chunk: bytes) -> None:
+        self.add(self._stream.feed(chunk))
+
+    def close(self) -> list[Place]:
+        self.add(self._stream.close())
+        return self.places
+
+    def add(self, elements) -> None:
+        for e in elements:
+            tags = e.get("tags", {})
+            if self._seen is not None:
+                key = (e.get("type"), e.get("id"))
+                if not tags.get("name") or key in self._seen:
+                    continue
+            point = element_point(e)
+            if point is None:
+                continue
+            if self._seen is not None:
+                self._seen.add(key)
+            self.places.append(Place(tags.get("name"), float(point[0]), float(point[1]), tags))
+
+
+def element_point(e: dict) -> tuple[float, float] | None:
+    """A node's position, or a way's or relation's centre; None if the output has no geometry for it."""
+    if "lat" in e:
+        return e["lat"], e["lon"]
+    if "center" in e:  # out center
+        return e["center"]["lat"], e["center"]["lon"]
+    if "bounds" in e:  # out bb
+        b = e["bounds"]
+        return (b["minlat"] + b["maxlat"]) / 2, (b["minlon"] + b["maxlon"]) / 2
+    points = [p for p in e.get("geometry") or () if p]  # out geom; missing members are null
+    if points:
+        return sum(p["lat"] for p in points) / len(points), sum(p["lon"] for p in points) / len(points)
+    return None
+
+
+def fetch_attractions(lat: float, lon: float, radius_famous: int = 10000, radius_fallback: int = 8000,
+                      priority: int = rate_limit.INTERACTIVE, interests=()) -> list[Place]:
+    """Named attractions around a point: well-known ones first, topped up with nearby ones if fewer than 10.
+
+    With ``interests`` (see ``ranking.INTERESTS``), named places matching
+    them within ``radius_fallback`` are added as further candidates. Elements
+    found by more than one query count once, and near-duplicates (a sight
+    and its entrance, "Louvre" and "Musée du Louvre") are merged by
+    ``dedup.dedupe``.
+    """
+    seen = set()
+    famous_q, near_q = attraction_queries(lat, lon, radius_famous, radius_fallback)
+    places = _run_overpass_query(famous_q, PlaceReader(seen), priority)
+    if len(places) < MIN_FAMOUS:
+        places += _run_overpass_query(near_q, PlaceReader(seen), priority)
+    interest_q = interest_query(lat, lon, radius_fallback, interests)
+    if interest_q:
+        places += _run_overpass_query(interest_q, PlaceReader(seen), priority)
+    return dedup.dedupe(places)
+
+
+def attraction_queries(lat: float, lon: float, radius_famous: int, radius_fallback: int) -> tuple[str, str]:
+    """Overpass QL for well-known attractions and for the nearby fallback."""
+    famous_q = f"""
+    (
+      nwr["tourism"~"{TOURISM}"]
+      (around:{radius_famous},{lat},{lon})["name"]["wikidata"];
+      nwr["tourism"~"{TOURISM}"]
+      (around:{radius_famous},{lat},{lon})["name"]["wikipedia"];
+      nwr["tourism"~"{TOURISM}"]
+      (around:{radius_famous},{lat},{lon})["name"]["heritage"];
+    );
+    out center;
+    """
+    near_q = f"""
+    nwr["tourism"~"{TOURISM}"]
+    (around:{radius_fallback},{lat},{lon})["name"];
+    out center;
+    """
+    return famous_q, near_q
+
+
+def interest_query(lat: float, lon: float, radius: int, interests) -> str | None:
+    """Overpass QL for named places matching any of the interests, or None if they add no tags."""
+    filters = ranking.candidate_filters(interests)
+    if not filters:
+        return None
+    clauses = "".join(f'\n      nwr{f}(around:{radius},{lat},{lon})["name"];' for f in filters)
+    return f"""
+    ({clauses}
+    );
+    out center {MAX_INTEREST_CANDIDATES};
+    """
+
+
+@metrics.timed("overpass_query")
+def _run_overpass_query(query: str, reader: PlaceReader, priority: int = rate_limit.INTERACTIVE, retries: int = 2,
+                        session: requests.Session | None = None) -> list[Place]:
+    """POST ``query`` and stream the response into ``reader``, waiting and retrying after HTTP 429."""
+    session = session or resources.get("http")
+    try:
+        for attempt in range(retries + 1):
+            rate_limit.acquire(OVERPASS_URL, priority)
+            response = session.post(OVERPASS_URL, data=query, headers=HEADERS, timeout=60, stream=True)
+            if response.status_code != 429 or attempt == retries:
+                break
+            response.close()
+            # Wait for a free Overpass slot instead of failing the request
+            rate_limit.backoff(OVERPASS_URL, response.headers.get("Retry-After"))
+        with response:
+            if response.status_code == 429:
+                raise UpstreamError("Too many requests to Overpass. Please wait and try again.")
+            if response.status_code == 504:
+                raise UpstreamError("Overpass timed out. Try a smaller radius or another city.")
+            if response.status_code != 200:
+                raise UpstreamError(f"Received status code {response.status_code} from Overpass.")
+            for chunk in response.iter_content(CHUNK_SIZE):
+                reader.feed(chunk)
+            return reader.close()
+    except rate_limit.RateLimitTimeout as e:
+        raise UpstreamError("Overpass is busy right now. Please wait and try again.") from e
+    except requests.exceptions.RequestException as e:
+        raise UpstreamError(f"Network error occurred: {e}") from e
+    except ValueError as e:
+        raise UpstreamError(f"Overpass error: {e!r}") from e
@@ -0,0 +1,101 @@
+"""Interest-aware scoring of candidate places.
+
+Each interest maps OSM tags to weights (``("shop", "*")`` matches any
+value). ``score`` turns all candidates into one tag-indicator matrix and
+scores them in a single matrix product, adding a bonus for well-known places
+(Wikidata/Wikipedia links) and a penalty for distance from the centre;
+``top_k`` picks the best with a heap instead of sorting everything.
+"""
+import heapq
+import math
+
+import numpy as np
+
+INTERESTS = {
+    "Adventure": {("tourism", "theme_park"): 3, ("leisure", "water_park"): 3, ("natural", "peak"): 3,
+                  ("tourism", "zoo"): 2, ("tourism", "viewpoint"): 2, ("leisure", "sports_centre"): 1},
+    "Culture": {("tourism", "museum"): 3, ("tourism", "gallery"): 3, ("historic", "*"): 3,
+                ("tourism", "artwork"): 2, ("amenity", "theatre"): 2, ("amenity", "arts_centre"): 2,
+                ("heritage", "*"): 2, ("amenity", "place_of_worship"): 1},
+    "Food": {("amenity", "restaurant"): 3, ("amenity", "marketplace"): 3, ("amenity", "cafe"): 2,
+             ("amenity", "food_court"): 2, ("cuisine", "*"): 1},
+    "Nature": {("leisure", "park"): 3, ("leisure", "garden"): 3, ("leisure", "nature_reserve"): 3,
+               ("natural", "*"): 2, ("tourism", "viewpoint"): 2, ("tourism", "zoo"): 1},
+    "Shopping": {("shop", "mall"): 3, ("shop", "department_store"): 3, ("amenity", "marketplace"): 3,
+                 ("shop", "*"): 2},
+    "Relaxation": {("leisure", "garden"): 3, ("leisure", "spa"): 3, ("natural", "beach"): 3,
+                   ("leisure", "park"): 2, ("tourism", "viewpoint"): 2},
+}
+# Always applied, so sights outrank incidental matches when no interest is picked
+BASE_WEIGHTS = {("tourism", "*"): 1}
+FAME_WEIGHT = 2.0
+DISTANCE_WEIGHT = 1.0
+RADIUS_KM = 10.0
+# Tags worth querying Overpass for; the rest (cuisine, heritage) only refine the score
+CANDIDATE_KEYS = ("tourism", "historic", "amenity", "leisure", "natural", "shop")
+
+
+def tag_weights(interests) -> dict[tuple[str, str], float]:
+    """Summed tag weights for the selected interests (names are case-insensitive)."""
+    by_name = {name.casefold(): tags for name, tags in INTERESTS.items()}
+    weights = dict(BASE_WEIGHTS)
+    for interest in interests:
+        for tag, weight in by_name.get(interest.casefold(), {}).items():
+            weights[tag] = weights.get(tag, 0) + weight
+    return weights
+
+
+def candidate_filters(interests) -> list[str]:
+    """Overpass tag filters (``["shop"]``, ``["leisure"~"^(park|garden)$"]``) that find candidates for the interests."""
+    values = {}
+    for key, value in tag_weights(interests):
+        if key in CANDIDATE_KEYS and (key, value) not in BASE_WEIGHTS:
+            values.setdefault(key, set()).add(value)
+    return [f'["{key}"]' if "*" in vals else f'["{key}"~"^({"|".join(sorted(vals))})$"]'
+            for key, vals in sorted(values.items())]
+
+
+def score(tags: list[dict], distance_km: np.ndarray, interests=(), radius_km: float = RADIUS_KM,
+          boost: np.ndarray | None = None) -> np.ndarray:
+    """One score per candidate; higher is better. ``boost`` is added as is (e.g. a rating)."""
+    weights = tag_weights(interests)
+    index = {tag: i for i, tag in enumerate(weights)}
+    keys = {key for key, _ in weights}
+    rows, cols = [], []
+    fame = np.zeros(len(tags), dtype=np.float32)
+    for row, t in enumerate(tags):
+        for key in keys.intersection(t):
+            for col in (index.get((key, t[key])), index.get((key, "*"))):
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        fame[row] = "wikidata" in t or "wikipedia" in t
+    matches = np.zeros((len(tags), len(weights)), dtype=np.float32)
+    matches[rows, cols] = 1.0
+    scores = matches @ np.fromiter(weights.values(), dtype=np.float32, count=len(weights))
+    scores += FAME_WEIGHT * fame
+    scores -= DISTANCE_WEIGHT * np.minimum(np.asarray(distance_km, dtype=np.float32) / radius_km, 1.0)
+    if boost is not None:
+        scores += boost
+    return scores
+
+
+def score_places(places: list, lat: float, lon: float, interests=(), radius_km: float = RADIUS_KM) -> np.ndarray:
+    """``score`` for ``Place`` objects around a centre point."""
+    lats = np.fromiter((p.lat for p in places), dtype=np.float64, count=len(places))
+    lons = np.fromiter((p.lon for p in places), dtype=np.float64, count=len(places))
+    return score([p.tags for p in places], distance_km(lats, lons, lat, lon), interests, radius_km)
+
+
+def distance_km(lats: np.ndarray, lons: np.ndarray, lat: float, lon: float) -> np.ndarray:
+    """Haversine distance from (lat, lon) to each point."""
+    lat1, lat2 = math.radians(lat), np.radians(lats)
+    dlat, dlon = lat2 - lat1, np.radians(lons - lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * 6371.0 * np.arcsin(np.sqrt(a))
+
+
+def top_k(items: list, scores: np.ndarray, k: int) -> list:
+    """The ``k`` best items, best first (ties keep input order)."""
+    best = heapq.nlargest(k, range(len(items)), key=scores.__getitem__)
+    return [items[i] for i in best]
@@ -0,0 +1,211 @@
+"""Client-side rate limiting for the public upstream APIs.
+
+Every request to a known host first takes a token from that host's bucket.
+Callers queue by priority (interactive lookups ahead of background
+prefetches), so bursts from many sessions turn into short waits instead of
+429s. Set ``TRAVELSCOPE_RATE_LIMIT_DIR`` to share each host's schedule
+between server processes on the same machine through a locked file.
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from travelscope import metrics, resources
+
+try:
+    import fcntl
+except ImportError:  # Windows: limits are per process only
+    fcntl = None
+
+INTERACTIVE = 0
+BACKGROUND = 10
+
+# requests per second, burst size
+HOST_LIMITS = {
+    "nominatim.openstreetmap.org": (1.0, 1),
+    "overpass-api.de": (0.5, 2),
+    "geocoding-api.open-meteo.com": (5.0, 5),
+    "api.open-meteo.com": (5.0, 5),
+    "api.mymemory.translated.net": (1.0, 2),
+    "en.wikipedia.org": (10.0, 10),
+    "upload.wikimedia.org": (10.0, 10),
+    "open.er-api.com": (1.0, 1),
+}
+
+SHARED_DIR = os.environ.get("TRAVELSCOPE_RATE_LIMIT_DIR")
+
+
+class RateLimitTimeout(TimeoutError):
+    """Raised when a request could not get a slot within ``max_wait`` seconds."""
+
+
+class HostLimiter:
+    """Token bucket for one upstream host with a priority-ordered wait queue."""
+
+    def __init__(self, host: str, rate: float, burst: int = 1, shared_dir: str | None = SHARED_DIR):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self._shared_path = os.path.join(shared_dir, f"{host}.slot") if shared_dir and fcntl else None
+        self._waits = deque(maxlen=1000)
+        self._granted = 0
+        self._timeouts = 0
+
+    def acquire(self, priority: int = INTERACTIVE, max_wait: float | None = 30.0) -> float:
+        """Block until a request may be sent; returns the time spent queued in seconds."""
+        start = time.monotonic()
+        deadline = None if max_wait is None else start + max_wait
+        ticket = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._queue[0] == ticket and self._tokens >= 1 and now >= self._blocked_until:
+                        heapq.heappop(self._queue)
+                        self._tokens -= 1
+                        break
+                    if deadline is not None and now >= deadline:
+                        self._queue.remove(ticket)
+                        heapq.heapify(self._queue)
+                        self._timeouts += 1
+                        raise RateLimitTimeout(f"No request slot for {self.host} within {max_wait:.0f}s")
+                    pause = max((1 - self._tokens) / self.rate, self._blocked_until - now, 0.001)
+                    if deadline is not None:
+                        pause = min(pause, deadline - now)
+                    self._cond.wait(pause)
+            finally:
+                self._cond.notify_all()
+        if self._shared_path:
+            self._wait_for_shared_slot()
+        waited = time.monotonic() - start
+        with self._cond:
+            self._granted += 1
+            self._waits.append(waited)
+        metrics.observe(f"queue_wait:{self.host}", waited)
+        return waited
+
+    def penalize(self, seconds: float) -> None:
+        """Hold all requests to this host for ``seconds`` (after a 429 / Retry-After)."""
+        with self._cond:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+        if self._shared_path:
+            self._reserve_shared(time.time() + seconds)
+
+    def stats(self) -> dict:
+        with self._cond:
+            waits = sorted(self._waits)
+            queued = len(self._queue)
+        return {
+            "host": self.host,
+            "granted": self._granted,
+            "timeouts": self._timeouts,
+            "queued": queued,
+            "wait_p50": _percentile(waits, 0.50),
+            "wait_p95": _percentile(waits, 0.95),
+            "wait_max": waits[-1] if waits else 0.0,
+        }
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _wait_for_shared_slot(self) -> None:
+        slot = self._reserve_shared(None)
+        delay = slot - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _reserve_shared(self, not_before: float | None) -> float:
+        """Claim the next free send time in the host's slot file and return it."""
+        with open(self._shared_path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                content = f.read().strip()
+                next_free = float(content) if content else 0.0
+                if not_before is not None:
+                    slot = max(next_free, not_before)
+                    following = slot
+                else:
+                    slot = max(next_free, time.time())
+                    following = slot + 1.0 / self.rate
+                f.seek(0)
+                f.truncate()
+                f.write(repr(following))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return slot
+
+
+_limiters = {}
+_registry_lock = threading.Lock()
+
+
+def limiter_for(url_or_host: str) -> HostLimiter | None:
+    """Return the shared limiter for a URL or host name, or None if the host is not limited."""
+    host = urlsplit(url_or_host).hostname if "//" in url_or_host else url_or_host
+    if host not in HOST_LIMITS:
+        return None
+    with _registry_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            rate, burst = HOST_LIMITS[host]
+            limiter = _limiters[host] = HostLimiter(host, rate, burst)
+        return limiter
+
+
+def acquire(url: str, priority: int = INTERACTIVE, max_wait: float | None = 30.0) -> float:
+    """Wait for a request slot for ``url``'s host; returns the queue time in seconds."""
+    limiter = limiter_for(url)
+    return limiter.acquire(priority, max_wait) if limiter else 0.0
+
+
+def backoff(url: str, retry_after: str | float | None = None, default: float = 5.0) -> float:
+    """Pause ``url``'s host after a throttling response; returns the pause in seconds."""
+    try:
+        seconds = float(retry_after) if retry_after is not None else default
+    except ValueError:
+        seconds = default
+    limiter = limiter_for(url)
+    if limiter:
+        limiter.penalize(seconds)
+    return seconds
+
+
+def throttled_get(url: str, priority: int = INTERACTIVE, retries: int = 2, session=None, **kwargs):
+    """``session.get`` (the shared pooled session by default) that waits for a slot and retries after HTTP 429 instead of failing."""
+    for attempt in range(retries + 1):
+        acquire(url, priority)
+        response = (session or resources.get("http")).get(url, **kwargs)
+        if response.status_code != 429 or attempt == retries:
+            return response
+        response.close()
+        backoff(url, response.headers.get("Retry-After"))
+    return response
+
+
+def all_stats() -> list[dict]:
+    with _registry_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
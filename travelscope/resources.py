@@ -0,0 +1,146 @@
+"""Process-wide registry of expensive shared objects.
+
+HTTP sessions, API clients, SQLite handles and speech/translation models are
+registered once with a factory and created lazily on first ``get(name)``;
+every later caller in the process (any Streamlit session, the API server,
+the warm-up thread) gets the same instance. Creation is serialized per name,
+so concurrent first calls build one object. ``check()`` runs each live
+resource's health check and drops the ones that fail, so the next ``get``
+rebuilds them; ``close()`` tears resources down explicitly and runs at exit.
+
+Built in: ``http`` (pooled ``requests.Session``), ``response_cache``
+(``DiskCache``) and ``expense_store`` (``ExpenseStore``). Pages register
+their own, e.g. the speech recognizer.
+"""
+import atexit
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+POOL_SIZE = 32
+
+
+@dataclass
+class _Resource:
+    factory: Callable[[], Any]
+    close: Callable[[Any], None] | None = None
+    check: Callable[[Any], None] | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    instance: Any = None
+    created_at: float | None = None
+    build_seconds: float = 0.0
+    last_error: str | None = None
+
+
+_lock = threading.Lock()
+_resources: dict[str, _Resource] = {}
+
+
+def register(name: str, factory: Callable[[], Any], close: Callable[[Any], None] | None = None,
+             check: Callable[[Any], None] | None = None) -> None:
+    """Declare how to build, tear down and health-check ``name``; re-registering keeps a live instance."""
+    with _lock:
+        existing = _resources.get(name)
+        if existing is not None and existing.factory is factory:
+            return
+        _resources[name] = _Resource(factory, close, check)
+    if existing is not None and existing.instance is not None:
+        _teardown(name, existing)
+
+
+def get(name: str) -> Any:
+    """The shared instance of ``name``, built on first use."""
+    resource = _resources[name]
+    instance = resource.instance
+    if instance is not None:
+        return instance
+    with resource.lock:
+        if resource.instance is None:
+            start = time.perf_counter()
+            resource.instance = resource.factory()
+            resource.build_seconds = time.perf_counter() - start
+            resource.created_at = time.time()
+        return resource.instance
+
+
+def check() -> dict[str, str | None]:
+    """Health-check every live resource: ``{name: error message or None}``. Failed ones are dropped."""
+    results = {}
+    for name, resource in list(_resources.items()):
+        instance = resource.instance
+        if instance is None or resource.check is None:
+            continue
+        try:
+            resource.check(instance)
+            resource.last_error = results[name] = None
+        except Exception as e:
+            resource.last_error = results[name] = f"{type(e).__name__}: {e}"
+            _teardown(name, resource)
+    return results
+
+
+def close(name: str | None = None) -> None:
+    """Tear down one resource, or all of them in reverse creation order; they are rebuilt on next use."""
+    if name is not None:
+        _teardown(name, _resources[name])
+        return
+    live = [(n, r) for n, r in _resources.items() if r.instance is not None]
+    for n, resource in sorted(live, key=lambda item: item[1].created_at, reverse=True):
+        _teardown(n, resource)
+
+
+def status() -> list[dict]:
+    """One row per registered resource, for the metrics page."""
+    return [
+        {
+            "resource": name,
+            "live": resource.instance is not None,
+            "age_s": time.time() - resource.created_at if resource.instance is not None else None,
+            "build_ms": resource.build_seconds * 1000 if resource.created_at else None,
+            "last_error": resource.last_error,
+        }
+        for name, resource in _resources.items()
+    ]
+
+
+def _teardown(name: str, resource: _Resource) -> None:
+    with resource.lock:
+        instance, resource.instance = resource.instance, None
+    if instance is not None and resource.close is not None:
+        try:
+            resource.close(instance)
+        except Exception as e:
+            resource.last_error = f"close failed: {type(e).__name__}: {e}"
+
+
+def _http_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # Sized for concurrent Streamlit sessions hitting the same upstream host
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _response_cache():
+    from travelscope.disk_cache import DiskCache
+    return DiskCache()
+
+
+def _expense_store():
+    from travelscope.expense_store import ExpenseStore
+    return ExpenseStore()
+
+
+def _ping(db) -> None:
+    db.ping()
+
+
+register("http", _http_session, close=lambda session: session.close())
+register("response_cache", _response_cache, close=lambda cache: cache.close(), check=_ping)
+register("expense_store", _expense_store, close=lambda store: store.close(), check=_ping)
+atexit.register(close)
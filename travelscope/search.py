@@ -0,0 +1,256 @@
+"""Fuzzy name search over known cities and cached places.
+
+``TrigramIndex`` keeps an inverted index from character trigrams to names.
+A query counts shared trigrams for every name at once (``np.bincount`` over
+the postings), drops names sharing too few to be similar, keeps the most
+similar few and ranks those by prefix match, then edit distance, so both
+typos ("Barcelna") and partial input ("Barc") find the name in under a
+millisecond.
+
+The process-wide city and place indexes (resource ``search_index``) start
+from ``POPULAR_CITIES`` and the names already in the response cache
+(geocoded and weather cities, attraction names); pages ``add`` what they see.
+``correct`` fixes a likely typo in a city; ``find_corrected`` tries that only
+once the name as typed was not found upstream, since the indexes hold a few
+hundred names and a real place missing from them ("Bergen") would otherwise
+be rewritten to one that is there ("Berlin").
+"""
+import math
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from travelscope import resources
+from travelscope.errors import NotFound
+
+CITY, PLACE = "city", "place"
+CANDIDATES = 10  # best trigram matches re-ranked by edit distance
+MAX_DISTANCE = 3  # edit distances above this rank the same
+MIN_SIMILARITY = 0.25
+
+POPULAR_CITIES = (
+    "Amsterdam", "Athens", "Auckland", "Bangkok", "Barcelona", "Beijing", "Berlin", "Bogotá", "Boston",
+    "Brussels", "Budapest", "Buenos Aires", "Cairo", "Cape Town", "Chicago", "Copenhagen", "Cusco", "Delhi",
+    "Dubai", "Dublin", "Dubrovnik", "Edinburgh", "Florence", "Geneva", "Hanoi", "Havana", "Helsinki",
+    "Ho Chi Minh City", "Hong Kong", "Honolulu", "Istanbul", "Jaipur", "Jakarta", "Jerusalem",
+    "Johannesburg", "Kathmandu", "Kraków", "Kuala Lumpur", "Kyoto", "Las Vegas", "Lima", "Lisbon",
+    "London", "Los Angeles", "Madrid", "Marrakesh", "Melbourne", "Mexico City", "Miami", "Milan",
+    "Montreal", "Moscow", "Mumbai", "Munich", "Nairobi", "Naples", "New Delhi", "New Orleans", "New York",
+    "Nice", "Osaka", "Oslo", "Paris", "Porto", "Prague", "Reykjavík", "Rio de Janeiro", "Rome",
+    "San Francisco", "Santiago", "São Paulo", "Seattle", "Seoul", "Seville", "Shanghai", "Singapore",
+    "Stockholm", "Sydney", "Taipei", "Tallinn", "Tokyo", "Toronto", "Vancouver", "Venice", "Vienna",
+    "Warsaw", "Washington", "Zurich",
+)
+
+
+_NOT_WORD = re.compile(r"[^\w]+")
+
+
+@dataclass(frozen=True)
+class Match:
+    name: str
+    similarity: float
+    distance: int
+    kind: str = PLACE
+
+
+def normalize(text: str) -> str:
+    """Casefolded, accents stripped, punctuation and spacing collapsed: "São  Paulo!" -> "sao paulo"."""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(_NOT_WORD.sub(" ", text.casefold()).split())
+
+
+def trigrams(norm: str) -> set[str]:
+    padded = f"  {norm} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, bound: int | None = None) -> int:
+    """Levenshtein distance, counting a swap of neighbouring letters as one edit.
+
+    With ``bound``, only a band of the table is filled and anything beyond
+    ``bound`` is returned as ``bound + 1``.
+    """
+    if bound is None:
+        bound = max(len(a), len(b))
+    big = bound + 1
+    if abs(len(a) - len(b)) > bound:
+        return big
+    prev2, prev = None, [j if j <= bound else big for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        lo, hi = max(1, i - bound), min(len(b), i + bound)
+        row = [big] * (len(b) + 1)
+        row[0] = i if i <= bound else big
+        for j in range(lo, hi + 1):
+            # Plain comparisons rather than min(): this loop is most of a search's time
+            cb = b[j - 1]
+            cost = prev[j - 1] if ca == cb else prev[j - 1] + 1
+            if prev[j] + 1 < cost:
+                cost = prev[j] + 1
+            if row[j - 1] + 1 < cost:
+                cost = row[j - 1] + 1
+            if prev2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb and prev2[j - 2] + 1 < cost:
+                cost = prev2[j - 2] + 1
+            row[j] = cost
+        if min(row[lo - 1:hi + 1]) > bound:
+            return big
+        prev2, prev = prev, row
+    return min(prev[-1], big)
+
+
+class TrigramIndex:
+    def __init__(self):
+        self.names: list[str] = []
+        self._norms: list[str] = []
+        self._sizes: list[int] = []
+        self._ids: dict[str, int] = {}
+        self._pending: dict[str, list[int]] = defaultdict(list)
+        self._postings: dict[str, np.ndarray] = {}
+        self._size_array = np.empty(0, dtype=np.int32)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str) -> None:
+        norm = normalize(name)
+        with self._lock:
+            if not norm or norm in self._ids:
+                return
+            self._ids[norm] = len(self.names)
+            grams = trigrams(norm)
+            for gram in grams:
+                self._pending[gram].append(len(self.names))
+            self.names.append(name)
+            self._norms.append(norm)
+            self._sizes.append(len(grams))
+
+    def __contains__(self, name: str) -> bool:
+        return normalize(name) in self._ids
+
+    def search(self, query: str, limit: int = 5) -> list[Match]:
+        """Best matches for ``query``: prefix matches first, then by edit distance and similarity."""
+        norm = normalize(query)
+        if not norm:
+            return []
+        grams = trigrams(norm)
+        with self._lock:
+            postings = [p for p in map(self._posting, grams) if p.size]
+            if not postings:
+                return []
+            sizes = self._sizes_array()
+        shared = np.bincount(np.concatenate(postings), minlength=len(sizes))
+        # Similar enough (s / (q + n - s) >= MIN_SIMILARITY) needs s >= MIN_SIMILARITY * q;
+        # a prefix of the name shares all but the query's last trigram
+        least = max(1, min(math.ceil(MIN_SIMILARITY * len(grams)), len(grams) - 1))
+        ids = np.flatnonzero(shared >= least)
+        if not ids.size:
+            return []
+        similarity = shared[ids] / (len(grams) + sizes[ids] - shared[ids])
+        if ids.size > CANDIDATES:
+            best = np.argpartition(-similarity, CANDIDATES)[:CANDIDATES]
+            ids, similarity = ids[best], similarity[best]
+        matches = []
+        for i, sim in zip(ids.tolist(), similarity.tolist()):
+            prefix = self._norms[i].startswith(norm)
+            if sim < MIN_SIMILARITY and not prefix:
+                continue
+            distance = edit_distance(norm, self._norms[i][:len(norm)] if prefix else self._norms[i], MAX_DISTANCE)
+            matches.append((not prefix, distance, -sim, len(self._norms[i]), i))
+        matches.sort()
+        return [Match(self.names[i], -neg_sim, distance) for _, distance, neg_sim, _, i in matches[:limit]]
+
+    def _sizes_array(self) -> np.ndarray:
+        # Extended rather than rebuilt, so a search after a few adds stays cheap
+        if len(self._size_array) < len(self._sizes):
+            tail = np.asarray(self._sizes[len(self._size_array):], dtype=np.int32)
+            self._size_array = np.concatenate([self._size_array, tail])
+        return self._size_array
+
+    def _posting(self, gram: str) -> np.ndarray:
+        # Names added since the last search are merged in lazily, one trigram at a time
+        posting = self._postings.get(gram)
+        pending = self._pending.pop(gram, None)
+        if pending:
+            posting = np.asarray(pending, dtype=np.int32) if posting is None \
+                else np.concatenate([posting, np.asarray(pending, dtype=np.int32)])
+            self._postings[gram] = posting
+        return posting if posting is not None else np.empty(0, dtype=np.int32)
+
+
+def build_indexes(cache=None) -> dict[str, TrigramIndex]:
+    """City and place indexes: ``POPULAR_CITIES`` and every name in the response cache."""
+    indexes = {CITY: TrigramIndex(), PLACE: TrigramIndex()}
+    for city in POPULAR_CITIES:
+        indexes[CITY].add(city)
+    if cache is not None:
+        for namespace in ("geocode", "weather_city"):
+            for _, location in cache.items(namespace):
+                indexes[CITY].add(location["name"].split(",")[0])
+        for _, places in cache.items("attractions"):
+            for place in places:
+                if place.get("name"):
+                    indexes[PLACE].add(place["name"])
+    return indexes
+
+
+def suggest(query: str, limit: int = 5, kinds: tuple[str, ...] = (CITY, PLACE)) -> list[Match]:
+    """Autocomplete suggestions, cities before places."""
+    indexes = resources.get("search_index")
+    matches = [replace(m, kind=kind) for kind in kinds for m in indexes[kind].search(query, limit)]
+    return matches[:limit]
+
+
+def add(names, kind: str = PLACE) -> None:
+    index = resources.get("search_index")[kind]
+    for name in names:
+        if name:
+            index.add(name)
+
+
+def correct(query: str, kind: str = CITY) -> str:
+    """``query`` or, if it is no known name but a letter or two off a known ``kind`` name, that name.
+
+    Known names are few, so only use this once ``query`` itself was not found (see ``find_corrected``).
+    """
+    indexes = resources.get("search_index")
+    if not query.strip() or any(query in index for index in indexes.values()):
+        return query
+    matches = indexes[kind].search(query, 1)
+    if not matches:
+        return query
+    norm = normalize(query)
+    # Whole names only: a prefix match ("Par" -> "Paris") is a suggestion, not a correction
+    if edit_distance(norm, normalize(matches[0].name), 2) <= (1 if len(norm) <= 5 else 2):
+        return matches[0].name
+    return query
+
+
+def find_corrected(query: str, find, kind: str = CITY):
+    """``(find(query), query)``, or if that raises ``NotFound``, ``find`` of the ``correct``-ed name and that name.
+
+    The original ``NotFound`` is raised if there is no correction or it is not found either.
+    """
+    try:
+        return find(query), query
+    except NotFound as e:
+        corrected = correct(query, kind)
+        if corrected == query:
+            raise
+        try:
+            return find(corrected), corrected
+        except NotFound:
+            raise e from None
+
+
+def _search_index() -> dict[str, TrigramIndex]:
+    return build_indexes(resources.get("response_cache"))
+
+
+resources.register("search_index", _search_index)
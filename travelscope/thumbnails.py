@@ -0,0 +1,168 @@
+"""Downsized local copies of the images shown on the culture page.
+
+Wikipedia thumbnail URLs used to go straight to ``st.image``, so the browser
+fetched the image on every view, often much larger than it is shown.
+``ThumbnailCache.get`` downloads an image once, stores it re-encoded (WebP,
+or JPEG if Pillow lacks WebP) at every width in ``WIDTHS`` under
+``<CACHE_DIR>/thumbnails``, named by a hash of the URL, and returns the
+bytes for the width asked for. Once the files pass ``max_bytes`` the least
+recently used are deleted; a hit refreshes the file's mtime, so the order
+survives restarts and is roughly shared by processes using the directory.
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from PIL import Image, ImageOps, features
+
+from travelscope import metrics, rate_limit, resources
+from travelscope.culture import HEADERS
+from travelscope.disk_cache import CACHE_DIR
+from travelscope.upstreams import upstream
+
+HOSTS = frozenset({"upload.wikimedia.org"})  # only Wikipedia's images are fetched
+WIDTHS = (320, 640)
+MAX_BYTES = 200 * 1024 * 1024
+MAX_DOWNLOAD = 20 * 1024 * 1024  # larger originals are not worth decoding for a thumbnail
+QUALITY = 80
+WEBP_METHOD = 2  # encoder effort 0-6; 2 is ~3x quicker than the default 4 for files ~7% larger
+TIMEOUT = 10
+
+if features.check("webp"):
+    FORMAT, EXTENSION, MEDIA_TYPE = "WEBP", "webp", "image/webp"
+else:  # Pillow built without libwebp
+    FORMAT, EXTENSION, MEDIA_TYPE = "JPEG", "jpg", "image/jpeg"
+
+
+class ThumbnailCache:
+    def __init__(self, directory: str | None = None, max_bytes: int = MAX_BYTES):
+        self.directory = directory or os.path.join(CACHE_DIR, "thumbnails")
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._files: OrderedDict[str, int] = OrderedDict()  # name -> size, least recently used first
+        self._size = 0
+        entries = [e for e in os.scandir(self.directory) if e.is_file() and not e.name.endswith(".tmp")]
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            self._files[entry.name] = entry.stat().st_size
+            self._size += self._files[entry.name]
+        with self._lock:
+            self._evict()
+
+    def get(self, url: str, width: int = WIDTHS[-1], session: requests.Session | None = None,
+            priority: int = rate_limit.INTERACTIVE) -> bytes | None:
+        """The image at ``url`` at most ``width`` pixels wide, or None if it is not in ``HOSTS`` or cannot be read."""
+        if urlsplit(url).hostname not in HOSTS:
+            return None
+        width = min((w for w in WIDTHS if w >= width), default=WIDTHS[-1])
+        data = self._read(_file_name(url, width))
+        if data is not None:
+            return data
+        metrics.record_miss("thumbnail")
+        try:
+            with metrics.span("thumbnail_fetch"):
+                variants = resize(_download(url, session, priority))
+        except (requests.exceptions.RequestException, rate_limit.RateLimitTimeout, OSError, ValueError,
+                Image.DecompressionBombError):
+            return None
+        for w, body in variants.items():
+            self._write(_file_name(url, w), body)
+        return variants[width]
+
+    def _read(self, name: str) -> bytes | None:
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted, possibly by another process
+            with self._lock:
+                self._size -= self._files.pop(name, 0)
+            return None
+        with self._lock:
+            if name not in self._files:  # written by another process
+                self._files[name] = len(data)
+                self._size += len(data)
+            self._files.move_to_end(name)
+        return data
+
+    def _write(self, name: str, data: bytes) -> None:
+        path = os.path.join(self.directory, name)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._size += len(data) - self._files.pop(name, 0)
+            self._files[name] = len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._files:
+            name, size = self._files.popitem(last=False)
+            self._size -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+
+def get(url: str, width: int = WIDTHS[-1]) -> bytes | None:
+    """``ThumbnailCache.get`` on the shared cache (resource ``thumbnails``)."""
+    return resources.get("thumbnails").get(url, width)
+
+
+def resize(data: bytes, widths: tuple[int, ...] = WIDTHS) -> dict[int, bytes]:
+    """``data`` re-encoded as ``FORMAT`` at each width; images are never enlarged."""
+    with Image.open(io.BytesIO(data)) as image:
+        largest = max(widths)
+        if image.width > largest:
+            # JPEGs can be decoded at 1/2, 1/4 or 1/8 scale, far quicker than in full
+            image.draft("RGB", (largest, max(1, image.height * largest // image.width)))
+        image = _flatten(ImageOps.exif_transpose(image))
+    out = {}
+    for width in sorted(widths, reverse=True):
+        if image.width > width:
+            # Each size is scaled from the one before, not from the original
+            image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, FORMAT, quality=QUALITY, method=WEBP_METHOD)
+        out[width] = buffer.getvalue()
+    return out
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """RGB, or RGBA for transparent images when the format keeps transparency."""
+    if image.mode not in ("RGBA", "LA", "PA") and "transparency" not in image.info:
+        return image.convert("RGB")
+    image = image.convert("RGBA")
+    if FORMAT == "WEBP":
+        return image
+    background = Image.new("RGB", image.size, "white")
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+def _download(url: str, session: requests.Session | None, priority: int) -> bytes:
+    response = rate_limit.throttled_get(upstream(url), priority, headers=HEADERS, timeout=TIMEOUT, session=session,
+                                        stream=True)
+    with response:
+        response.raise_for_status()
+        body = bytearray()
+        for chunk in response.iter_content(64 * 1024):
+            body += chunk
+            if len(body) > MAX_DOWNLOAD:
+                raise ValueError(f"Image larger than {MAX_DOWNLOAD // (1024 * 1024)} MB")
+    return bytes(body)
+
+
+def _file_name(url: str, width: int) -> str:
+    return f"{hashlib.sha256(url.encode()).hexdigest()[:32]}-{width}.{EXTENSION}"
+
+
+resources.register("thumbnails", ThumbnailCache)
@@ -0,0 +1,104 @@
+import re
+
+import PyPDF2
+import requests
+
+from travelscope import metrics
+from travelscope.errors import UpstreamError
+from travelscope.rate_limit import RateLimitTimeout, throttled_get
+from travelscope.upstreams import MYMEMORY_URL
+
+LANGUAGES = {
+    'English': 'en',
+    'French': 'fr',
+    'German': 'de',
+    'Spanish': 'es',
+    'Italian': 'it',
+    'Hindi': 'hi',
+    'Russian': 'ru',
+    'Chinese': 'zh',
+    'Japanese': 'ja',
+    'Telugu': 'te',
+}
+
+# MyMemory rejects queries longer than 500 bytes of UTF-8
+MAX_QUERY_BYTES = 500
+# Chunks go out at MyMemory's ~1 request/s, so this bounds a translation to a few seconds
+MAX_CHUNKS = 8
+
+_SENTENCE_END = re.compile(r"(?<=[.!?।。])\s+")
+
+
+def split_for_translation(text: str, max_bytes: int = MAX_QUERY_BYTES) -> list[str]:
+    """Split text into chunks under ``max_bytes``, breaking at sentence ends, then words."""
+    chunks, current = [], ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        for piece in _fit(sentence, max_bytes):
+            candidate = f"{current} {piece}" if current else piece
+            if len(candidate.encode()) <= max_bytes:
+                current = candidate
+            else:
+                chunks.append(current)
+                current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def translation_chunks(text: str, max_chunks: int = MAX_CHUNKS) -> list[str]:
+    """``split_for_translation``, or ``ValueError`` if that takes more than ``max_chunks`` requests."""
+    chunks = split_for_translation(text)
+    if len(chunks) > max_chunks:
+        raise ValueError(f"Text is too long to translate at once ({len(chunks)} parts, at most {max_chunks})")
+    return chunks
+
+
+def translate(text: str, src_code: str, dest_code: str, session: requests.Session | None = None) -> str:
+    """Translate ``text`` with MyMemory, one request per chunk.
+
+    Raises ``ValueError`` if the text needs more than ``MAX_CHUNKS`` requests
+    and ``UpstreamError`` if any chunk fails.
+    """
+    chunks = translation_chunks(text)
+    translated = []
+    with metrics.span("translate"):
+        for chunk in chunks:
+            params = {"q": chunk, "langpair": f"{src_code}|{dest_code}"}
+            try:
+                response = throttled_get(MYMEMORY_URL, params=params, timeout=10, session=session)
+                response.raise_for_status()
+            except (requests.exceptions.RequestException, RateLimitTimeout) as e:
+                raise UpstreamError(f"Translation failed: {e}") from e
+            translated.append(response.json()['responseData']['translatedText'])
+    return " ".join(translated)
+
+
+def extract_pdf_text(pdf_file) -> str:
+    with metrics.span("pdf_extract"):
+        reader = PyPDF2.PdfReader(pdf_file)
+        return "".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _fit(sentence: str, max_bytes: int):
+    """Yield pieces of one sentence that each fit in ``max_bytes``."""
+    if len(sentence.encode()) <= max_bytes:
+        yield sentence
+        return
+    piece = ""
+    for word in sentence.split():
+        while len(word.encode()) > max_bytes:
+            # A single "word" (e.g. a URL or unspaced CJK text) longer than the limit
+            head = word.encode()[:max_bytes].decode(errors="ignore")
+            if piece:
+                yield piece
+                piece = ""
+            yield head
+            word = word[len(head):]
+        candidate = f"{piece} {word}" if piece else word
+        if len(candidate.encode()) <= max_bytes:
+            piece = candidate
+        else:
+            yield piece
+            piece = word
+    if piece:
+        yield piece
@@ -0,0 +1,89 @@
+"""Multi-city trips: an ordered list of legs, each a city and a number of days.
+
+``fetch_legs`` looks all legs up concurrently on a bounded thread pool (every
+geocode at once, then every leg's attractions and forecast at once), so a
+trip takes about as long as its slowest leg rather than the sum of them; the
+per-host limits in ``rate_limit`` still apply. A city Nominatim does not find
+is retried as the known city it is a near miss of, and its leg renamed to
+match. ``build_trip`` plans each leg from its own first day and numbers the
+days across the whole trip.
+"""
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+from travelscope import lookups, metrics, ranking, search
+from travelscope.disk_cache import DiskCache
+from travelscope.errors import UpstreamError
+from travelscope.geo import Location
+from travelscope.itinerary import build_itinerary
+from travelscope.places import Place
+from travelscope.weather import Weather, current_conditions
+
+MAX_LEGS = 8
+MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class Leg:
+    city: str
+    days: int
+
+
+@dataclass
+class LegData:
+    leg: Leg
+    location: Location
+    attractions: list[Place]
+    weather: Weather | None  # None if the forecast could not be fetched
+
+
+def fetch_legs(legs: list[Leg], cache: DiskCache, interests=(), max_workers: int = MAX_WORKERS) -> list[LegData]:
+    """Geocode, attractions and current weather for every leg, fetched in parallel."""
+    if not legs:
+        return []
+    with metrics.span("trip_fetch"), ThreadPoolExecutor(min(max_workers, 2 * len(legs))) as pool:
+        found = list(pool.map(lambda leg: search.find_corrected(leg.city, lambda c: lookups.geocode(c, cache)), legs))
+        legs = [Leg(city, leg.days) for leg, (_, city) in zip(legs, found)]
+        locations = [location for location, _ in found]
+        attractions = [pool.submit(lookups.attractions, loc.lat, loc.lon, cache, interests=interests)
+                       for loc in locations]
+        forecasts = [pool.submit(lookups.forecast, loc.lat, loc.lon, cache) for loc in locations]
+        return [LegData(leg, loc, found.result(), _weather(forecast))
+                for leg, loc, found, forecast in zip(legs, locations, attractions, forecasts)]
+
+
+def build_trip(data: list[LegData], interests=(), start: datetime.date | None = None) -> dict:
+    """Per-leg itineraries stitched into one plan.
+
+    Returns ``{"legs": [{"city", "name", "lat", "lon", "start", "first_day",
+    "days", "weather"}, ...], "days": {"Day 1 — Paris": [...], ...}}``; day
+    numbers follow the calendar, so a day where nothing fits leaves a gap.
+    """
+    day = start or datetime.date.today()
+    legs, days, offset = [], {}, 0
+    for leg in data:
+        scores = ranking.score_places(leg.attractions, leg.location.lat, leg.location.lon, interests)
+        plan = build_itinerary(leg.attractions, leg.leg.days, scores=scores, start=day)
+        for key, items in plan.items():
+            days[f"Day {offset + int(key.split()[1])} — {leg.leg.city}"] = items
+        legs.append({
+            "city": leg.leg.city, "name": leg.location.name, "lat": leg.location.lat, "lon": leg.location.lon,
+            "start": day.isoformat(), "first_day": offset + 1, "days": leg.leg.days,
+            "weather": asdict(leg.weather) if leg.weather else None,
+        })
+        offset += leg.leg.days
+        day += datetime.timedelta(days=leg.leg.days)
+    return {"legs": legs, "days": days}
+
+
+def plan_trip(legs: list[Leg], cache: DiskCache, interests=(), start: datetime.date | None = None) -> dict:
+    """``fetch_legs`` then ``build_trip``."""
+    return build_trip(fetch_legs(legs, cache, interests), interests, start)
+
+
+def _weather(forecast) -> Weather | None:
+    try:
+        return current_conditions(forecast.result())
+    except (UpstreamError, KeyError):
+        return None
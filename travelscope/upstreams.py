@@ -0,0 +1,30 @@
+"""Upstream API endpoints.
+
+Set ``TRAVELSCOPE_UPSTREAM_URL`` (e.g. ``http://127.0.0.1:8765``) to send
+every request to a stand-in server instead: ``https://<host>/<path>`` becomes
+``<TRAVELSCOPE_UPSTREAM_URL>/<host>/<path>``. The benchmark and load-test
+tools use this to replay recorded responses offline.
+"""
+import os
+from urllib.parse import urlsplit
+
+OVERRIDE = os.environ.get("TRAVELSCOPE_UPSTREAM_URL", "").rstrip("/")
+
+
+def upstream(url: str) -> str:
+    if not OVERRIDE:
+        return url
+    parts = urlsplit(url)
+    rest = url[len(f"{parts.scheme}://"):]
+    return f"{OVERRIDE}/{rest}"
+
+
+NOMINATIM_SEARCH_URL = upstream("https://nominatim.openstreetmap.org/search")
+OVERPASS_URL = upstream("https://overpass-api.de/api/interpreter")
+OPEN_METEO_GEOCODING_URL = upstream("https://geocoding-api.open-meteo.com/v1/search")
+OPEN_METEO_FORECAST_URL = upstream("https://api.open-meteo.com/v1/forecast")
+MYMEMORY_URL = upstream("https://api.mymemory.translated.net/get")
+WIKIPEDIA_SUMMARY_URL = upstream("https://en.wikipedia.org/api/rest_v1/page/summary/{title}")
+WIKIPEDIA_ACTION_URL = upstream("https://en.wikipedia.org/w/api.php")
+FX_URL = upstream("https://open.er-api.com/v6/latest/{base}")
+
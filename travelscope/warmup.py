@@ -0,0 +1,109 @@
+"""Keep the response cache warm for popular destinations.
+
+Usage:
+    python -m travelscope.warmup Paris Rome Kyoto          # one pass
+    python -m travelscope.warmup --file top.txt --loop     # refresh until stopped
+
+For each destination this fills the geocode, attraction, forecast and
+Wikipedia entries that the pages read, at background priority so user
+requests keep their place in each host's rate-limit queue. Entries are
+refetched once they are within ``REFRESH_FRACTION`` of their lifetime of
+expiring, so a user opening a popular city gets a cache hit. Set
+``TRAVELSCOPE_WARMUP`` to a comma-separated list to run the loop in a
+thread inside the Streamlit server.
+"""
+import argparse
+import os
+import threading
+import time
+
+import requests
+
+from travelscope import lookups, metrics, resources
+from travelscope.culture import MISSING_TTL, fetch_related, fetch_summary
+from travelscope.disk_cache import DiskCache
+from travelscope.errors import TravelScopeError
+from travelscope.rate_limit import BACKGROUND, RateLimitTimeout
+
+# Refresh once an entry has less than this fraction of its lifetime left
+REFRESH_FRACTION = 0.25
+CHECK_INTERVAL = 5 * 60
+
+DESTINATIONS = [d.strip() for d in os.environ.get("TRAVELSCOPE_WARMUP", "").split(",") if d.strip()]
+
+
+def warm(destination: str, cache: DiskCache) -> None:
+    """Bring every cached lookup for one destination up to date; raises on the first failure."""
+    with metrics.span("warmup"):
+        location = lookups.geocode(destination, cache, BACKGROUND, _margin(lookups.GEOCODE_TTL))
+        lookups.attractions(location.lat, location.lon, cache, BACKGROUND, _margin(lookups.ATTRACTIONS_TTL))
+        city = lookups.weather_city(destination, cache, BACKGROUND, _margin(lookups.GEOCODE_TTL))
+        lookups.forecast(city.lat, city.lon, cache, BACKGROUND, _margin(lookups.FORECAST_TTL))
+        # Missing-article markers have the shortest Wikipedia TTL; a margin that suits them suits all
+        fetch_summary(destination, cache, priority=BACKGROUND, refresh_within=_margin(MISSING_TTL))
+        fetch_related(destination, cache, priority=BACKGROUND, refresh_within=_margin(MISSING_TTL))
+
+
+def run_once(destinations: list[str], cache: DiskCache) -> dict[str, str | None]:
+    """Warm each destination in order; returns ``{destination: error message or None}``."""
+    results = {}
+    for destination in destinations:
+        try:
+            warm(destination, cache)
+            results[destination] = None
+        except (TravelScopeError, RateLimitTimeout, requests.exceptions.RequestException) as e:
+            results[destination] = str(e)
+    return results
+
+
+def run_forever(destinations: list[str], cache: DiskCache, stop: threading.Event,
+                interval: float = CHECK_INTERVAL) -> None:
+    while not stop.is_set():
+        run_once(destinations, cache)
+        stop.wait(_pass_interval(interval))
+
+
+def start_background(destinations: list[str], cache: DiskCache | None = None) -> threading.Event:
+    """Run the refresh loop in a daemon thread; set the returned event to stop it."""
+    stop = threading.Event()
+    thread = threading.Thread(target=run_forever, args=(destinations, cache or resources.get("response_cache"), stop),
+                              name="cache-warmup", daemon=True)
+    thread.start()
+    return stop
+
+
+def _margin(ttl: float) -> float:
+    return ttl * REFRESH_FRACTION
+
+
+def _pass_interval(interval: float) -> float:
+    # Passes must come often enough to catch the shortest TTLs (forecasts, missing articles) in their margin
+    return min(interval, _margin(min(lookups.FORECAST_TTL, MISSING_TTL)) / 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("destinations", nargs="*")
+    parser.add_argument("--file", help="one destination per line")
+    parser.add_argument("--loop", action="store_true", help="keep refreshing entries before they expire")
+    parser.add_argument("--interval", type=float, default=CHECK_INTERVAL, help="seconds between passes")
+    args = parser.parse_args()
+    destinations = list(args.destinations) or list(DESTINATIONS)
+    if args.file:
+        with open(args.file) as f:
+            destinations += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    if not destinations:
+        parser.error("no destinations given")
+    cache = resources.get("response_cache")
+    while True:
+        started = time.monotonic()
+        for destination, error in run_once(destinations, cache).items():
+            print(f"{destination:<30} {'ok' if error is None else 'failed: ' + error}")
+        print(f"pass took {time.monotonic() - started:.1f}s")
+        if not args.loop:
+            break
+        time.sleep(_pass_interval(args.interval))
+
+
+if __name__ == "__main__":
+    main()
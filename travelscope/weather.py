@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+
+import requests
+
+from travelscope.errors import NotFound, UpstreamError
+from travelscope.geo import Location
+from travelscope.rate_limit import INTERACTIVE, RateLimitTimeout, throttled_get
+from travelscope.upstreams import OPEN_METEO_FORECAST_URL, OPEN_METEO_GEOCODING_URL
+
+HOURLY = "relative_humidity_2m,pressure_msl,uv_index"
+
+
+@dataclass(frozen=True)
+class Weather:
+    temperature: float
+    windspeed: float
+    winddirection: float
+    # From the first hourly slot; None if the forecast did not include it
+    humidity: float | None = None
+    pressure: float | None = None
+    uv_index: float | None = None
+
+
+def find_city(name: str, session: requests.Session | None = None, priority: int = INTERACTIVE) -> Location:
+    """Best Open-Meteo geocoding match; raises ``NotFound`` or ``UpstreamError``."""
+    return parse_city(_get_json(OPEN_METEO_GEOCODING_URL, {"name": name}, session, priority), name)
+
+
+def parse_city(data: dict, name: str) -> Location:
+    results = data.get("results", [])
+    if not results:
+        raise NotFound(f"City {name!r} not found.")
+    return Location(results[0]["latitude"], results[0]["longitude"], results[0]["name"])
+
+
+def fetch_forecast(lat: float, lon: float, session: requests.Session | None = None,
+                   priority: int = INTERACTIVE) -> dict:
+    """Raw Open-Meteo forecast JSON with current weather and the hourly details."""
+    return check_forecast(_get_json(OPEN_METEO_FORECAST_URL, forecast_params(lat, lon), session, priority))
+
+
+def forecast_params(lat: float, lon: float) -> dict:
+    return {"latitude": lat, "longitude": lon, "current_weather": "true", "hourly": HOURLY}
+
+
+def check_forecast(data: dict) -> dict:
+    if "current_weather" not in data:
+        raise UpstreamError("Forecast response has no current weather.")
+    return data
+
+
+def current_conditions(forecast: dict) -> Weather:
+    current, hourly = forecast["current_weather"], forecast.get("hourly", {})
+
+    def first(key):
+        values = hourly.get(key) or [None]
+        return values[0]
+
+    return Weather(
+        current["temperature"], current["windspeed"], current["winddirection"],
+        first("relative_humidity_2m"), first("pressure_msl"), first("uv_index"),
+    )
+
+
+def _get_json(url: str, params: dict, session: requests.Session | None, priority: int) -> dict:
+    try:
+        response = throttled_get(url, priority, params=params, timeout=10, session=session)
+    except (requests.exceptions.RequestException, RateLimitTimeout) as e:
+        raise UpstreamError(f"Network error occurred: {e}") from e
+    if response.status_code != 200:
+        raise UpstreamError(f"Received status code {response.status_code} from Open-Meteo.")
+    return response.json()